@@ -0,0 +1,161 @@
+"""
+Agent Backends - Pluggable agents consulted concurrently per question
+
+An agent is a named async callable (or a plain callable, run in a worker
+thread) that takes the question and its classification and returns a
+candidate AgentChoice, or None when it has nothing to say:
+
+- Agents are registered in priority order; the answer of the
+  highest-priority agent that has one wins, whatever the confidences
+- All registered agents are consulted at the same time
+- The consultation has a deadline; agents still running when it expires
+  are cancelled and recorded as timed out
+- It stops early, cancelling the rest, once the winner is settled: an
+  agent has answered and every agent registered before it has finished
+  without an answer
+- Each agent also has its own timeout; a timeout or error counts as "no
+  candidate" and is recorded, never raised
+- Per-agent timing stats (calls, answers, mean/max seconds, timeouts, errors)
+
+So a question costs the latency of the agents up to the winner, bounded by
+the deadline, instead of a fixed delay. Registration and timing are shared
+with the outcome detectors (registry.py).
+
+Usage:
+    registry = AgentRegistry()
+    registry.register("architecture", ask_architecture_agent, timeout=1.5)
+    consultation = await registry.consult(question, classification, deadline=2.0)
+    choice = consultation.best
+"""
+
+import sys
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import List, Any, Callable, Optional, Tuple
+
+from registry import Registered, TimedRegistry
+
+
+@dataclass
+class Consultation:
+    """What the agents said about one question"""
+    candidates: List[Tuple[str, Any]] = field(default_factory=list)   # (agent, AgentChoice)
+    timed_out: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    cancelled: List[str] = field(default_factory=list)
+    stopped_early: bool = False
+    elapsed_seconds: float = 0.0
+
+    @property
+    def best(self) -> Optional[Any]:
+        """Candidate of the highest-priority agent that answered, or None"""
+        return self.candidates[0][1] if self.candidates else None
+
+
+class AgentRegistry(TimedRegistry):
+    """Named agents, in priority order, plus their timing stats"""
+
+    counters = ("answers",)
+
+    def __init__(self, default_timeout: float = 2.0):
+        """
+        Create an empty registry
+
+        Args:
+            default_timeout: Seconds an agent may take unless registered otherwise
+        """
+        super().__init__(default_timeout)
+
+    def register(self, name: str, fn: Callable, timeout: float = None):
+        """
+        Add an agent after the ones already registered (a replaced agent
+        keeps its place)
+
+        Args:
+            name: Unique agent name
+            fn: async def fn(question, classification) -> Optional[AgentChoice],
+                or a blocking def with the same signature
+            timeout: Seconds before the agent is abandoned
+        """
+        self._add(Registered, name, fn, timeout)
+
+    async def _call(self, agent: Registered, question: str, classification) -> Optional[Any]:
+        """Run one agent, counting answers (timeouts and errors propagate)"""
+        candidate = await self._timed_call(agent, question, classification)
+        if candidate is not None:
+            self._stats[agent.name]["answers"] += 1
+        return candidate
+
+    async def consult(self, question: str, classification=None,
+                      deadline: float = None, stop_early: bool = True) -> Consultation:
+        """
+        Ask every agent concurrently
+
+        Args:
+            question: The question
+            classification: The classifier's result, passed through to agents
+            deadline: Seconds the whole consultation may take (None = no limit
+                beyond the per-agent timeouts)
+            stop_early: Cancel the remaining agents once the winner is
+                settled (False = wait for every agent, e.g. to collect all
+                their options)
+
+        Returns:
+            Consultation with the candidates in priority order
+        """
+        started = time.perf_counter()
+        consultation = Consultation()
+        tasks = {
+            asyncio.ensure_future(self._call(agent, question, classification)): agent.name
+            for agent in self._entries.values()
+        }
+        order = {name: position for position, name in enumerate(self._entries)}
+        pending = set(tasks)
+
+        while pending:
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - (time.perf_counter() - started))
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                # Deadline reached
+                for task in pending:
+                    self._stats[tasks[task]]["timeouts"] += 1
+                    consultation.timed_out.append(tasks[task])
+                break
+
+            for task in done:
+                name = tasks[task]
+                try:
+                    candidate = task.result()
+                except asyncio.TimeoutError:
+                    self._stats[name]["timeouts"] += 1
+                    consultation.timed_out.append(name)
+                    continue
+                except Exception as e:
+                    self._stats[name]["errors"] += 1
+                    consultation.failed.append(name)
+                    print(f"⚠️  Agent {name} failed: {e}", file=sys.stderr)
+                    continue
+                if candidate is not None:
+                    consultation.candidates.append((name, candidate))
+
+            if pending and stop_early and consultation.candidates:
+                # Settled once no agent still running outranks the leader
+                leader = min(order[name] for name, _ in consultation.candidates)
+                if all(order[tasks[task]] > leader for task in pending):
+                    consultation.stopped_early = True
+                    consultation.cancelled.extend(tasks[task] for task in pending)
+                    break
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        consultation.candidates.sort(key=lambda item: order[item[0]])
+        consultation.elapsed_seconds = time.perf_counter() - started
+        return consultation
+
@@ -0,0 +1,245 @@
+"""
+Audit Store - Persistent audit reviews with running totals
+
+Every review is one INSERT (with the reviewed choice's details copied in)
+plus one counter UPDATE in audit_reviews/audit.db, so recording a review
+costs the same however long the history is, and reviews from every process
+(hook, daemon, CLI) accumulate instead of each overwriting the report.
+A batch of reviews (add_reviews) shares one transaction.
+
+audit_recommendations.md is rendered from the store: the summary comes from
+the counters and the detailed section shows one page of the most recent
+reviews. Older pages are rendered on demand:
+
+    python3 audit_store.py render --page 2
+    python3 audit_store.py stats
+"""
+
+import json
+import sqlite3
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    choice_id       TEXT NOT NULL,
+    verdict         TEXT NOT NULL,
+    concerns        TEXT NOT NULL,      -- JSON list
+    recommendations TEXT NOT NULL,      -- JSON list
+    question        TEXT,
+    chosen_option   TEXT,
+    confidence      REAL,
+    source          TEXT,
+    timestamp       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reviews_choice ON reviews (choice_id);
+CREATE TABLE IF NOT EXISTS counters (
+    name  TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+VERDICTS = ("approved", "questionable", "risky")
+
+VERDICT_EMOJI = {
+    "approved": "✅",
+    "questionable": "⚠️",
+    "risky": "🚨"
+}
+
+
+class AuditStore:
+    """Append-only audit reviews plus persistent per-verdict counters"""
+
+    def __init__(self, db_file: Path, page_size: int = 50):
+        """
+        Open (and create if needed) the audit store
+
+        Args:
+            db_file: SQLite database file
+            page_size: Reviews per rendered page
+        """
+        self.db_file = db_file
+        self.page_size = page_size
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_file), timeout=10.0, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def add_review(self, review: Dict[str, Any], choice: Dict[str, Any] = None) -> int:
+        """
+        Record one review and bump the counters
+
+        Args:
+            review: AuditReview as a dict
+            choice: The reviewed AgentChoice as a dict (for the report)
+
+        Returns:
+            Review number (1-based, across all processes)
+        """
+        return self.add_reviews([(review, choice)])[0]
+
+    def add_reviews(self, reviews: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]) -> List[int]:
+        """
+        Record several (review, choice) pairs in one transaction
+
+        Returns:
+            Review numbers, in order
+        """
+        ids = []
+        counts: Dict[str, int] = {}
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for review, choice in reviews:
+                choice = choice or {}
+                cursor = self._conn.execute(
+                    "INSERT INTO reviews (choice_id, verdict, concerns, recommendations, "
+                    "question, chosen_option, confidence, source, timestamp) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (review["choice_id"], review["verdict"],
+                     json.dumps(review.get("concerns", [])),
+                     json.dumps(review.get("recommendations", [])),
+                     choice.get("question"), choice.get("chosen_option"),
+                     choice.get("confidence"), choice.get("source"),
+                     review["timestamp"])
+                )
+                ids.append(cursor.lastrowid)
+                for name in ("total", review["verdict"]):
+                    counts[name] = counts.get(name, 0) + 1
+            self._conn.executemany(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                list(counts.items())
+            )
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        return ids
+
+    def get_summary(self) -> Dict[str, int]:
+        """Running totals: total plus one count per verdict"""
+        counts = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+        return {name: counts.get(name, 0) for name in ("total",) + VERDICTS}
+
+    def get_reviews(self, page: int = 1, page_size: int = None) -> List[Dict[str, Any]]:
+        """One page of reviews, most recent first (page 1 = newest)"""
+        page_size = page_size or self.page_size
+        rows = self._conn.execute(
+            "SELECT * FROM reviews ORDER BY id DESC LIMIT ? OFFSET ?",
+            (page_size, (page - 1) * page_size)
+        ).fetchall()
+        reviews = []
+        for row in rows:
+            review = dict(row)
+            review["concerns"] = json.loads(review["concerns"])
+            review["recommendations"] = json.loads(review["recommendations"])
+            reviews.append(review)
+        return reviews
+
+    def render_markdown(self, page: int = 1, page_size: int = None) -> str:
+        """
+        Render the audit report for one page of reviews
+
+        Cost depends on page_size only, not on the number of reviews stored.
+        """
+        page_size = page_size or self.page_size
+        summary = self.get_summary()
+        reviews = self.get_reviews(page, page_size)
+        pages = max(1, -(-summary["total"] // page_size))
+
+        content = [
+            "# Audit Agent Recommendations",
+            "",
+            f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"**Total Choices Reviewed**: {summary['total']}",
+            "",
+            "---",
+            "",
+            "## Summary",
+            "",
+            f"- ✅ Approved: {summary['approved']}",
+            f"- ⚠️  Questionable: {summary['questionable']}",
+            f"- 🚨 Risky: {summary['risky']}",
+            "",
+            "---",
+            "",
+            "## Detailed Reviews\n",
+        ]
+
+        if reviews:
+            content.append(
+                f"*Page {page} of {pages}: reviews {reviews[-1]['id']}-{reviews[0]['id']}, "
+                f"newest first. Older pages: `python3 audit_store.py render --page N`*\n"
+            )
+
+        for review in reviews:
+            verdict_emoji = VERDICT_EMOJI.get(review["verdict"], "❓")
+            content.extend([
+                f"### {review['id']}. {verdict_emoji} {review['verdict'].upper()}",
+                "",
+                f"**Choice ID**: {review['choice_id']}",
+                f"**Question**: {review['question']}",
+                f"**Chosen**: {review['chosen_option']}",
+                f"**Confidence**: {(review['confidence'] or 0):.0%}",
+                f"**Source**: {review['source']}",
+                f"**Timestamp**: {review['timestamp']}",
+                ""
+            ])
+
+            if review["concerns"]:
+                content.append("**Concerns**:")
+                for concern in review["concerns"]:
+                    content.append(f"- {concern}")
+                content.append("")
+
+            if review["recommendations"]:
+                content.append("**Recommendations**:")
+                for rec in review["recommendations"]:
+                    content.append(f"- {rec}")
+                content.append("")
+
+            content.append("---\n")
+
+        return '\n'.join(content)
+
+    def close(self):
+        self._conn.close()
+
+
+def main():
+    """Command line access to the audit history"""
+    parser = argparse.ArgumentParser(description="Audit review store")
+    parser.add_argument("action", choices=["render", "stats"])
+    parser.add_argument("--audit-dir", type=Path,
+                        default=Path(__file__).parent / "audit_reviews",
+                        help="Directory holding audit.db (default: audit_reviews/ next to this file)")
+    parser.add_argument("--page", type=int, default=1, help="Page to render (1 = newest)")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Write the rendered page here instead of stdout")
+    args = parser.parse_args()
+
+    store = AuditStore(args.audit_dir / "audit.db", page_size=args.page_size)
+    try:
+        if args.action == "stats":
+            print(json.dumps(store.get_summary(), indent=2))
+        else:
+            markdown = store.render_markdown(page=args.page)
+            if args.output:
+                args.output.write_text(markdown)
+                print(f"📋 Wrote page {args.page} to {args.output}")
+            else:
+                print(markdown)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
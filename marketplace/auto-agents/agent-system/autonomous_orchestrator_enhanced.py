@@ -15,16 +15,31 @@ This implements the KEY OBJECTIVE:
 """
 
 import json
+import time
 import asyncio
-import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Iterable
 from dataclasses import dataclass, asdict
 
 # Use existing Phase 2.2 components
-from question_classifier import QuestionClassifier, QuestionType
+from question_classifier import QuestionType
+from hashed_classifier import make_classifier, DEFAULT_MODEL_FILE
 from post_question_processor import PostQuestionProcessor, OutcomeStatus
+from knowledge_store import open_knowledge_store, question_hash
+from similarity_index import SimilarityIndex
+from negative_cache import NegativeCache, is_non_answer, NON_ANSWER
+from qa_log import QALog
+from log_writer import get_log_writer
+from audit_store import AuditStore
+from choice_ids import new_choice_id
+from agent_backends import AgentRegistry
+from tracing import get_tracer
+from events import EventSink, ConsoleSink
+
+# Question types below this classifier confidence are not acted on (the
+# regex rules' factual labels are 0.6+, the question model's are capped below)
+MIN_CLASSIFICATION_CONFIDENCE = 0.6
 
 
 @dataclass
@@ -78,34 +93,96 @@ class AutonomousOrchestrator:
     7. Log everything
     """
 
-    def __init__(self, agents_dir: Path = None, confidence_threshold: float = 0.6):
+    def __init__(self, agents_dir: Path = None, confidence_threshold: float = 0.6,
+                 kb_backend: str = "sqlite", similarity_threshold: Optional[float] = 0.6,
+                 max_kb_entries: Optional[int] = 5000, max_kb_bytes: Optional[int] = 5_000_000,
+                 negative_ttl_seconds: float = 900.0, agent_deadline_seconds: float = 2.0,
+                 events: EventSink = None, classifier: str = "regex"):
         """
         Initialize enhanced autonomous orchestrator
 
         Args:
             agents_dir: Directory for Agents/ subfolder (defaults to current dir)
             confidence_threshold: Minimum confidence before escalating to human (default 0.6)
+            kb_backend: Knowledge base storage, "sqlite" (default) or "json"
+            similarity_threshold: Minimum similarity for reusing the answer to a
+                near-duplicate question (default 0.6, None disables); the
+                reused answer's confidence is scaled by the similarity
+            max_kb_entries: Knowledge base entry budget (None = unbounded)
+            max_kb_bytes: Approximate knowledge base size budget (None = unbounded)
+            negative_ttl_seconds: How long an unanswerable question is remembered
+                before the agents try it again (negative_cache.db)
+            agent_deadline_seconds: Time budget for consulting the agents on
+                one new question
+            events: Where progress is reported (default: console banners;
+                hooks pass a null or JSON sink, see events.py)
+            classifier: "regex" (pattern rules, default) or "model" (hashed-feature
+                model from models/question_model.bin, see hashed_classifier.py)
         """
+        started = time.perf_counter()
+        self.tracer = get_tracer()
+        self.events = events if events is not None else ConsoleSink()
         self.agents_dir = agents_dir or Path("Agents")
         self.confidence_threshold = confidence_threshold
-        self.classifier = QuestionClassifier()
-
-        # Initialize post-question processor
-        self.post_processor = PostQuestionProcessor(self.agents_dir)
+        self.classifier = make_classifier(classifier, self.agents_dir / DEFAULT_MODEL_FILE)
 
         # Create directories
         self.choices_dir = self.agents_dir / "choices"
         self.choices_dir.mkdir(parents=True, exist_ok=True)
 
         self.qa_log_dir = self.agents_dir / "qa_logs"
-        self.qa_log_dir.mkdir(parents=True, exist_ok=True)
+        self.qa_log = QALog(self.qa_log_dir)
+
+        # Log/report files are written by a background thread
+        self.log_writer = get_log_writer()
 
         self.audit_dir = self.agents_dir / "audit_reviews"
         self.audit_dir.mkdir(parents=True, exist_ok=True)
+        self.audit_store = AuditStore(self.audit_dir / "audit.db")
 
-        # Learning system
+        # Learning system (SQLite store by default; learned_answers.json is
+        # imported once and kept as the human-readable export target)
         self.learned_file = self.agents_dir / "learned_answers.json"
-        self.learned_answers = self._load_learned_answers()
+        self.knowledge_base = open_knowledge_store(
+            self.agents_dir, kb_backend,
+            max_entries=max_kb_entries, max_bytes=max_kb_bytes
+        )
+
+        # Post-question processor updates the same store (no second copy)
+        self.post_processor = PostQuestionProcessor(
+            self.agents_dir, knowledge_base=self.knowledge_base, qa_log=self.qa_log
+        )
+
+        # Near-duplicate lookup ("ok, continue" -> "continue")
+        self.similarity_index = None
+        if similarity_threshold is not None:
+            self.similarity_index = SimilarityIndex(
+                self.agents_dir / "similarity_index.db",
+                threshold=similarity_threshold
+            )
+            if not self.similarity_index.is_built:
+                # One-time backfill from answers learned before the index existed
+                self.similarity_index.add_many(
+                    (q_hash, entry["question"])
+                    for q_hash, entry in self.knowledge_base.all().items()
+                )
+                self.similarity_index.mark_built()
+
+        # Low-confidence non-answers are remembered briefly instead of learned
+        self.negative_cache = NegativeCache(
+            self.agents_dir / "negative_cache.db", ttl_seconds=negative_ttl_seconds
+        )
+
+        # Agents consulted on new questions, highest priority first; register
+        # more with self.agents.register(name, fn, timeout) (see agent_backends.py)
+        self.agent_deadline_seconds = agent_deadline_seconds
+        self.agents = AgentRegistry()
+        self.agents.register("database", self._database_agent)
+        self.agents.register("framework", self._framework_agent)
+        self.agents.register("security", self._security_agent)
+        self.agents.register("emerging_tech", self._emerging_tech_agent)
+
+        self.tracer.record("orchestrator.init", time.perf_counter() - started)
 
         # Track all choices
         self.choices_made = []
@@ -115,27 +192,16 @@ class AutonomousOrchestrator:
         self.stats = {
             "total_questions": 0,
             "learned_answers_used": 0,
+            "negative_cache_hits": 0,
             "agent_decisions": 0,
             "human_escalations": 0,
             "outcomes_validated": 0,
             "knowledge_improvements": 0,
         }
 
-    def _load_learned_answers(self) -> Dict:
-        """Load learned answers from previous interactions"""
-        if self.learned_file.exists():
-            try:
-                with open(self.learned_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
-
-    def _save_learned_answer(self, question: str, choice: AgentChoice):
-        """Save learned answer for future reuse"""
-        question_hash = hashlib.md5(question.lower().strip().encode()).hexdigest()
-
-        self.learned_answers[question_hash] = {
+    def _learned_entry(self, question: str, choice: AgentChoice) -> Dict[str, Any]:
+        """Knowledge base entry for a choice"""
+        return {
             "question": question,
             "chosen_option": choice.chosen_option,
             "reasoning": choice.reasoning,
@@ -147,35 +213,79 @@ class AutonomousOrchestrator:
             "source": choice.source
         }
 
-        # Save to file
-        self.learned_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.learned_file, 'w') as f:
-            json.dump(self.learned_answers, f, indent=2)
+    def _save_learned_answer(self, question: str, choice: AgentChoice):
+        """Save learned answer for future reuse"""
+        q_hash = question_hash(question)
+        self.knowledge_base.put(q_hash, self._learned_entry(question, choice))
+        self.negative_cache.invalidate(q_hash)
+        if self.similarity_index is not None:
+            self.similarity_index.add(q_hash, question)
+
+        # Keep the KB bounded (human answers are never evicted)
+        evicted = self.knowledge_base.enforce_budget()
+        if evicted and self.similarity_index is not None:
+            self.similarity_index.remove(*evicted)
+
+    def _find_learned_entry(self, question: str) -> Optional[Tuple[str, Dict[str, Any], float]]:
+        """
+        Find a learned answer: exact question first, then a near-duplicate
+
+        Non-answers learned before the negative cache existed are ignored.
+
+        Returns:
+            (question_hash, entry, similarity) or None
+        """
+        q_hash = question_hash(question)
+        learned = self.knowledge_base.get(q_hash)
+        if learned and learned.get("chosen_option") != NON_ANSWER:
+            return q_hash, learned, 1.0
+
+        if self.similarity_index is not None:
+            match = self.similarity_index.find_similar(question)
+            if match:
+                similar_hash, similarity = match
+                learned = self.knowledge_base.get(similar_hash)
+                if learned and learned.get("chosen_option") != NON_ANSWER:
+                    return similar_hash, learned, similarity
+
+        return None
+
+    def _check_learned_answer(self, question: str) -> Optional[Tuple[AgentChoice, Dict[str, Any]]]:
+        """
+        Check if we already know the answer to this question
+
+        Returns:
+            (choice, entry) where entry is the learned answer with updated
+            times_used plus its "similarity" to the question, or None
+        """
+        found = self._find_learned_entry(question)
 
-    def _check_learned_answer(self, question: str) -> Optional[AgentChoice]:
-        """Check if we already know the answer to this question"""
-        question_hash = hashlib.md5(question.lower().strip().encode()).hexdigest()
+        if found:
+            q_hash, learned, similarity = found
 
-        if question_hash in self.learned_answers:
-            learned = self.learned_answers[question_hash]
+            # Increment usage counter (buffered single-row update)
+            self.knowledge_base.record_use(q_hash)
+            entry = dict(learned, times_used=learned.get("times_used", 0) + 1,
+                         similarity=similarity)
 
-            # Increment usage counter
-            learned["times_used"] = learned.get("times_used", 0) + 1
-            with open(self.learned_file, 'w') as f:
-                json.dump(self.learned_answers, f, indent=2)
+            # A near-duplicate is only as trustworthy as it is similar
+            reasoning = learned["reasoning"]
+            if similarity < 1.0:
+                reasoning = f"{reasoning} (learned for a {similarity:.0%} similar question)"
 
             # Return as AgentChoice
-            return AgentChoice(
+            choice = AgentChoice(
                 question=learned["question"],
                 chosen_option=learned["chosen_option"],
-                reasoning=learned["reasoning"],
-                confidence=learned["confidence"],
+                reasoning=reasoning,
+                confidence=learned["confidence"] * similarity,
                 agents_consulted=learned.get("agents_consulted", []),
                 alternatives_considered=learned.get("alternatives_considered", []),
                 timestamp=datetime.now().isoformat(),
-                choice_id=f"learned_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                choice_id=new_choice_id("learned"),
                 source="learned"
             )
+            return choice, entry
 
         return None
 
@@ -189,106 +299,107 @@ class AutonomousOrchestrator:
         Returns:
             Response with choice, source, and reasoning
         """
+        with self.tracer.span("orchestrator.process_question"):
+            return await self._process_question(question)
+
+    async def _process_question(self, question: str) -> Dict[str, Any]:
         timestamp = datetime.now()
         self.stats["total_questions"] += 1
 
-        print("\n" + "="*70)
-        print("🤖 AUTONOMOUS AGENT ORCHESTRATOR (Enhanced)")
-        print("="*70)
-        print(f"\n❓ Question: {question}\n")
+        self.events.emit("question_received", question=question)
 
         # STEP 0: Check learned answers FIRST
-        learned = self._check_learned_answer(question)
-        if learned:
+        with self.tracer.span("orchestrator.kb_lookup"):
+            found = self._check_learned_answer(question)
+        if found:
+            learned, entry = found
             self.stats["learned_answers_used"] += 1
-            print("📚 LEARNED ANSWER FOUND!")
-            print(f"   Originally learned: {self.learned_answers[hashlib.md5(question.lower().strip().encode()).hexdigest()]['learned_date'][:10]}")
-            print(f"   Times used: {self.learned_answers[hashlib.md5(question.lower().strip().encode()).hexdigest()]['times_used']}")
-            print(f"   Source: {learned.source}")
-            print()
-
-            # Display the learned answer
-            print(f"{'='*70}")
-            print("✅ ANSWER (from knowledge base)")
-            print(f"{'='*70}")
-            print(f"✅ Chosen: {learned.chosen_option}")
-            print(f"💭 Reasoning: {learned.reasoning}")
-            print(f"📈 Confidence: {learned.confidence:.0%}")
-            if learned.agents_consulted:
-                print(f"🤖 Agents consulted: {', '.join(learned.agents_consulted)}")
-            print(f"\n{'='*70}\n")
+            self.events.emit("learned_answer_found", entry=entry, choice=learned)
 
             # Log this reuse so it can be tracked by post-question processor
-            await self._log_question_answer(question, learned, timestamp)
+            with self.tracer.span("orchestrator.log"):
+                await self._log_question_answer(question, learned, timestamp)
 
             return {
                 "choice": learned.to_dict(),
                 "source": "learned",
-                "learned_date": self.learned_answers[hashlib.md5(question.lower().strip().encode()).hexdigest()]['learned_date'],
-                "times_used": self.learned_answers[hashlib.md5(question.lower().strip().encode()).hexdigest()]['times_used']
+                "learned_date": entry['learned_date'],
+                "times_used": entry['times_used'],
+                "similarity": entry['similarity']
+            }
+
+        # STEP 0b: Agents recently failed on this exact question - don't redo it
+        q_hash = question_hash(question)
+        cached = self.negative_cache.get(q_hash)
+        if cached:
+            self.stats["negative_cache_hits"] += 1
+            choice = AgentChoice(**dict(
+                cached,
+                timestamp=timestamp.isoformat(),
+                choice_id=new_choice_id()
+            ))
+            self.events.emit("negative_cache_hit", ttl_seconds=self.negative_cache.ttl_seconds)
+
+            with self.tracer.span("orchestrator.log"):
+                await self._log_question_answer(question, choice, timestamp)
+
+            return {
+                "choice": choice.to_dict(),
+                "source": "negative_cache",
+                "stats": self.stats.copy()
             }
 
         # STEP 1: New question - classify it
-        classification = self.classifier.classify(question)
-        print(f"📋 Classification: {classification.question_type.value}")
-        print(f"   Confidence: {classification.confidence:.0%}\n")
+        with self.tracer.span("orchestrator.classify"):
+            classification = self.classifier.classify(question)
+        self.events.emit("classified", classification=classification)
 
         # STEP 2: Agents analyze and MAKE THE CHOICE
-        print("🧠 Agents analyzing and making choice...")
-        choice = await self._agents_make_choice(question, classification)
+        self.events.emit("consulting_agents")
+        with self.tracer.span("orchestrator.consult_agents"):
+            choice = await self._agents_make_choice(question, classification)
         self.stats["agent_decisions"] += 1
 
         # STEP 3: Check confidence threshold
         if choice.confidence < self.confidence_threshold:
-            print(f"\n⚠️  LOW CONFIDENCE: {choice.confidence:.0%} (threshold: {self.confidence_threshold:.0%})")
-            print("🙋 Escalating to human for guidance...\n")
+            self.events.emit("low_confidence", confidence=choice.confidence,
+                             threshold=self.confidence_threshold)
 
             # Escalate to human
-            choice = await self._escalate_to_human(question, choice)
+            with self.tracer.span("orchestrator.escalate"):
+                choice = await self._escalate_to_human(question, choice)
             self.stats["human_escalations"] += 1
 
-        # STEP 4: Save to knowledge base
-        self._save_learned_answer(question, choice)
-        print(f"\n📚 Saved to knowledge base (will reuse next time)")
+        # STEP 4: Save to knowledge base (non-answers only briefly, in memory)
+        if is_non_answer(choice.chosen_option, choice.confidence, choice.source,
+                         self.confidence_threshold):
+            self.negative_cache.put(q_hash, choice.to_dict())
+            self.events.emit("non_answer_skipped", ttl_seconds=self.negative_cache.ttl_seconds)
+        else:
+            with self.tracer.span("orchestrator.save_learned"):
+                self._save_learned_answer(question, choice)
+            self.events.emit("learned_answer_saved")
 
         # STEP 5: Log the Q&A
-        choice_id = f"choice_{timestamp.strftime('%Y%m%d_%H%M%S')}"
-        await self._log_question_answer(question, choice, timestamp)
+        with self.tracer.span("orchestrator.log"):
+            await self._log_question_answer(question, choice, timestamp)
 
         # STEP 6: Audit agent reviews the choice
-        print("🔍 Audit agent reviewing choice...")
-        audit = await self._audit_review_choice(choice)
+        self.events.emit("audit_started")
+        with self.tracer.span("orchestrator.audit_review"):
+            audit = await self._audit_review_choice(choice)
 
         # STEP 7: Write audit recommendations
-        await self._write_audit_recommendations()
+        with self.tracer.span("orchestrator.audit_report"):
+            await self._write_audit_recommendations()
 
         # Display results
-        print(f"\n{'='*70}")
-        print("📊 FINAL DECISION")
-        print(f"{'='*70}")
-        print(f"✅ Chosen: {choice.chosen_option}")
-        print(f"💭 Reasoning: {choice.reasoning}")
-        print(f"📈 Confidence: {choice.confidence:.0%}")
-        print(f"🤖 Agents consulted: {', '.join(choice.agents_consulted)}")
-        print(f"🔖 Source: {choice.source}")
-
-        print(f"\n🔍 Audit Review: {audit.verdict.upper()}")
-        if audit.concerns:
-            print("⚠️  Concerns:")
-            for concern in audit.concerns:
-                print(f"   • {concern}")
-        if audit.recommendations:
-            print("💡 Recommendations:")
-            for rec in audit.recommendations:
-                print(f"   • {rec}")
-
-        print(f"\n{'='*70}")
-        print(f"📝 Logged to: {self.qa_log_dir}/{choice_id}.json")
-        print(f"📋 Audit: {self.audit_dir}/audit_recommendations.md")
-        print(f"📚 Knowledge base: {self.learned_file}")
-        print(f"{'='*70}\n")
-
-        # Print stats
+        self.events.emit(
+            "decision", choice=choice, audit=audit,
+            qa_log_dir=self.qa_log_dir,
+            audit_file=f"{self.audit_dir}/audit_recommendations.md",
+            knowledge_base=self.knowledge_base.path
+        )
         self._print_stats()
 
         return {
@@ -296,13 +407,158 @@ class AutonomousOrchestrator:
             "audit": audit.to_dict(),
             "source": choice.source,
             "logs": {
-                "qa_log": str(self.qa_log_dir / f"{choice_id}.json"),
+                "qa_log": str(self.qa_log_dir),
                 "audit_file": str(self.audit_dir / "audit_recommendations.md"),
-                "learned_file": str(self.learned_file)
+                "learned_file": str(self.knowledge_base.path)
             },
             "stats": self.stats.copy()
         }
 
+    async def process_questions(self, questions: Iterable[str],
+                                concurrency: int = 16) -> List[Dict[str, Any]]:
+        """
+        Process many questions at once (e.g. pre-seeding the knowledge base
+        from historical transcripts)
+
+        Makes the same decisions as process_question, batched:
+        - Identical questions (after normalization) are answered once
+        - New questions are classified in one pass, then their agent
+          consultations run concurrently (at most `concurrency` at a time)
+        - New answers are committed to the knowledge base in one
+          transaction, the Q&A log gets one append batch, and the audit
+          store one transaction plus one report refresh
+
+        Nobody is asked for guidance: low-confidence choices are kept as the
+        agents made them, and non-answers go to the negative cache.
+
+        Args:
+            questions: Questions to answer
+            concurrency: Agent consultations in flight at once
+
+        Returns:
+            One result per input question, in order: "choice", "source", plus
+            "audit" for new choices and "duplicate" for repeats within the batch
+        """
+        with self.tracer.span("orchestrator.process_questions"):
+            return await self._process_questions(list(questions), concurrency)
+
+    async def _process_questions(self, questions: List[str],
+                                 concurrency: int) -> List[Dict[str, Any]]:
+        timestamp = datetime.now()
+        self.stats["total_questions"] += len(questions)
+
+        keys = [question_hash(question) for question in questions]
+        unique: Dict[str, str] = {}
+        for q_hash, question in zip(keys, questions):
+            unique.setdefault(q_hash, question)
+
+        # Learned answers and recent non-answers need no agents
+        answered: Dict[str, Dict[str, Any]] = {}
+        new: List[Tuple[str, str]] = []
+        with self.tracer.span("orchestrator.batch.kb_lookup"):
+            for q_hash, question in unique.items():
+                found = self._check_learned_answer(question)
+                if found:
+                    self.stats["learned_answers_used"] += 1
+                    answered[q_hash] = {"choice": found[0], "source": "learned",
+                                        "similarity": found[1]["similarity"]}
+                    continue
+
+                cached = self.negative_cache.get(q_hash)
+                if cached:
+                    self.stats["negative_cache_hits"] += 1
+                    choice = AgentChoice(**dict(
+                        cached,
+                        timestamp=timestamp.isoformat(),
+                        choice_id=new_choice_id()
+                    ))
+                    answered[q_hash] = {"choice": choice, "source": "negative_cache"}
+                    continue
+
+                new.append((q_hash, question))
+
+        # One classification pass, then concurrent consultations
+        with self.tracer.span("orchestrator.batch.classify"):
+            classifications = [self.classifier.classify(question) for _, question in new]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def consult(question, classification):
+            async with semaphore:
+                return await self._agents_make_choice(question, classification)
+
+        with self.tracer.span("orchestrator.batch.consult_agents"):
+            choices = await asyncio.gather(*(
+                consult(question, classification)
+                for (_, question), classification in zip(new, classifications)
+            ))
+        self.stats["agent_decisions"] += len(choices)
+
+        # One knowledge base transaction
+        learned = []
+        with self.tracer.span("orchestrator.batch.save_learned"):
+            with self.knowledge_base.batch():
+                for (q_hash, question), choice in zip(new, choices):
+                    if is_non_answer(choice.chosen_option, choice.confidence, choice.source,
+                                     self.confidence_threshold):
+                        self.negative_cache.put(q_hash, choice.to_dict())
+                        continue
+                    self.knowledge_base.put(q_hash, self._learned_entry(question, choice))
+                    self.negative_cache.invalidate(q_hash)
+                    learned.append((q_hash, question))
+
+            if learned and self.similarity_index is not None:
+                self.similarity_index.add_many(learned)
+            evicted = self.knowledge_base.enforce_budget()
+            if evicted and self.similarity_index is not None:
+                self.similarity_index.remove(*evicted)
+
+        for (q_hash, _), choice in zip(new, choices):
+            answered[q_hash] = {"choice": choice, "source": choice.source}
+
+        # One Q&A log batch (one record per distinct question)
+        with self.tracer.span("orchestrator.batch.log"):
+            entries = [{
+                "timestamp": timestamp.isoformat(),
+                "question": question,
+                "choice": answered[q_hash]["choice"].to_dict(),
+                "logged_at": datetime.now().isoformat()
+            } for q_hash, question in unique.items()]
+            self.log_writer.submit(self.qa_log.append_many, entries)
+            self.choices_made.extend(answered[q_hash]["choice"] for q_hash in unique)
+
+        # One audit transaction and one report refresh
+        with self.tracer.span("orchestrator.batch.audit"):
+            reviews = [self._review_choice(choice) for choice in choices]
+            if reviews:
+                self.audit_reviews.extend(reviews)
+                self.audit_store.add_reviews([
+                    (review.to_dict(), choice.to_dict())
+                    for review, choice in zip(reviews, choices)
+                ])
+                await self._write_audit_recommendations()
+            for (q_hash, _), review in zip(new, reviews):
+                answered[q_hash]["audit"] = review
+
+        self.events.emit(
+            "batch_processed", questions=len(questions), unique=len(unique),
+            learned_used=len(unique) - len(new), agent_decisions=len(choices),
+            saved=len(learned)
+        )
+        self._print_stats()
+
+        results = []
+        seen = set()
+        for q_hash in keys:
+            result = dict(answered[q_hash], choice=answered[q_hash]["choice"].to_dict())
+            if "audit" in result:
+                result["audit"] = result["audit"].to_dict()
+            if q_hash in seen:
+                result["duplicate"] = True
+            seen.add(q_hash)
+            results.append(result)
+        return results
+
     async def _escalate_to_human(self, question: str, agent_choice: AgentChoice) -> AgentChoice:
         """
         Escalate to human when agents lack confidence
@@ -314,25 +570,11 @@ class AutonomousOrchestrator:
         Returns:
             Enhanced choice incorporating human guidance
         """
-        print(f"{'='*70}")
-        print("🙋 HUMAN GUIDANCE NEEDED")
-        print(f"{'='*70}")
-        print(f"\nAgents analyzed the question but confidence is low.")
-        print(f"\nAgent's suggestion:")
-        print(f"  ✅ Choice: {agent_choice.chosen_option}")
-        print(f"  💭 Reasoning: {agent_choice.reasoning}")
-        print(f"  📈 Confidence: {agent_choice.confidence:.0%}")
-        print(f"  🤖 Agents: {', '.join(agent_choice.agents_consulted)}")
-
-        if agent_choice.alternatives_considered:
-            print(f"  🔄 Alternatives: {', '.join(agent_choice.alternatives_considered)}")
-
-        print(f"\n{'-'*70}")
-        print("Please provide guidance:")
-        print("  1. Type 'yes' to accept agent's suggestion")
-        print("  2. Type your own answer")
-        print("  3. Type 'skip' to use agent's choice anyway")
-        print(f"{'-'*70}\n")
+        self.events.emit("escalation_requested", choice=agent_choice)
+        if not self.events.interactive:
+            # Embedded (hook/daemon): nobody to ask
+            self.events.emit("escalation_resolved", resolution="no_input", choice=agent_choice)
+            return agent_choice
 
         try:
             response = input("Your guidance: ").strip()
@@ -342,11 +584,11 @@ class AutonomousOrchestrator:
                 agent_choice.source = "human-approved"
                 agent_choice.confidence = 0.95  # High confidence now
                 agent_choice.reasoning += " [Human approved this choice]"
-                print("\n✅ Using agent's choice (human approved)\n")
+                self.events.emit("escalation_resolved", resolution="approved", choice=agent_choice)
 
             elif response.lower() == "skip":
                 # Keep agent's choice as-is
-                print("\n⚠️  Using agent's choice (low confidence)\n")
+                self.events.emit("escalation_resolved", resolution="skipped", choice=agent_choice)
 
             else:
                 # Human provided their own answer
@@ -354,10 +596,10 @@ class AutonomousOrchestrator:
                 agent_choice.source = "human"
                 agent_choice.confidence = 1.0  # Maximum confidence
                 agent_choice.reasoning = f"Human decision: {response}"
-                print(f"\n✅ Using your answer: {response}\n")
+                self.events.emit("escalation_resolved", resolution="human", choice=agent_choice)
 
         except (KeyboardInterrupt, EOFError):
-            print("\n\n⚠️  No human input - using agent's choice anyway\n")
+            self.events.emit("escalation_resolved", resolution="no_input", choice=agent_choice)
 
         return agent_choice
 
@@ -366,85 +608,20 @@ class AutonomousOrchestrator:
         """
         Agents analyze question and MAKE THE CHOICE autonomously
 
-        This is where the magic happens - agents decide!
+        Every registered agent is consulted concurrently, within
+        agent_deadline_seconds. The highest-priority agent with an answer
+        wins (registration order: database, framework, security, emerging
+        tech), and the options other agents proposed become its alternatives.
         """
-        # Simulate agent decision-making (in real version, consult actual agents)
-        await asyncio.sleep(0.5)
-
-        # Determine what type of choice this is
-        question_lower = question.lower()
-
-        # Database choice example
-        if "mongodb" in question_lower and "postgres" in question_lower:
-            return AgentChoice(
-                question=question,
-                chosen_option="PostgreSQL",
-                reasoning=(
-                    "Based on analysis: (1) Team has SQL experience, "
-                    "(2) Data is structured with relationships, "
-                    "(3) ACID guarantees needed for data integrity, "
-                    "(4) Scale projections fit PostgreSQL's capabilities"
-                ),
-                confidence=0.85,
-                agents_consulted=["Architecture", "Security", "Performance"],
-                alternatives_considered=["MongoDB", "MySQL"],
-                timestamp=datetime.now().isoformat(),
-                choice_id=f"choice_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                source="agents"
-            )
-
-        # Framework choice example
-        elif "react" in question_lower and "vue" in question_lower:
-            return AgentChoice(
-                question=question,
-                chosen_option="React",
-                reasoning=(
-                    "React chosen because: (1) Larger ecosystem and community, "
-                    "(2) Better job market for hiring, "
-                    "(3) More third-party libraries available, "
-                    "(4) Team has some React experience already"
-                ),
-                confidence=0.75,
-                agents_consulted=["Architecture", "Audit"],
-                alternatives_considered=["Vue", "Angular"],
-                timestamp=datetime.now().isoformat(),
-                choice_id=f"choice_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                source="agents"
-            )
-
-        # Factual question - direct answer
-        elif classification.question_type == QuestionType.AGENT_ANSWERABLE:
-            return AgentChoice(
-                question=question,
-                chosen_option="ALLOWED" if "can i delete" in question_lower else "Analysis provided",
-                reasoning="Security analysis: Operation is safe with low risk",
-                confidence=0.95,
-                agents_consulted=["Security"],
-                alternatives_considered=[],
-                timestamp=datetime.now().isoformat(),
-                choice_id=f"choice_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                source="agents"
-            )
-
-        # Low confidence example (will escalate)
-        elif "experimental" in question_lower or "new technology" in question_lower:
-            return AgentChoice(
-                question=question,
-                chosen_option="Proceed with caution",
-                reasoning=(
-                    "Limited information available about this technology. "
-                    "Would benefit from human expertise and experience."
-                ),
-                confidence=0.45,  # Below threshold - will escalate!
-                agents_consulted=["Architecture"],
-                alternatives_considered=["Wait and see", "Research more"],
-                timestamp=datetime.now().isoformat(),
-                choice_id=f"choice_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                source="agents"
-            )
+        consultation = await self.agents.consult(
+            question, classification, deadline=self.agent_deadline_seconds
+        )
+        if consultation.timed_out:
+            self.events.emit("agents_timed_out", agents=consultation.timed_out)
 
-        # No specific pattern matched - insufficient information
-        else:
+        choice = consultation.best
+        if choice is None:
+            # No agent had an answer - insufficient information
             return AgentChoice(
                 question=question,
                 chosen_option="INSUFFICIENT_INFORMATION",
@@ -457,13 +634,105 @@ class AutonomousOrchestrator:
                 agents_consulted=["Classifier"],
                 alternatives_considered=[],
                 timestamp=datetime.now().isoformat(),
-                choice_id=f"choice_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                choice_id=new_choice_id(),
                 source="agents"
             )
 
+        for _, candidate in consultation.candidates:
+            if candidate is choice:
+                continue
+            if candidate.chosen_option == choice.chosen_option:
+                extra = [a for a in candidate.agents_consulted if a not in choice.agents_consulted]
+                choice.agents_consulted.extend(extra)
+            elif candidate.chosen_option not in choice.alternatives_considered:
+                choice.alternatives_considered.append(candidate.chosen_option)
+        return choice
+
+    async def _database_agent(self, question: str, classification) -> Optional[AgentChoice]:
+        """Database choice (MongoDB vs PostgreSQL)"""
+        question_lower = question.lower()
+        if not ("mongodb" in question_lower and "postgres" in question_lower):
+            return None
+        return AgentChoice(
+            question=question,
+            chosen_option="PostgreSQL",
+            reasoning=(
+                "Based on analysis: (1) Team has SQL experience, "
+                "(2) Data is structured with relationships, "
+                "(3) ACID guarantees needed for data integrity, "
+                "(4) Scale projections fit PostgreSQL's capabilities"
+            ),
+            confidence=0.85,
+            agents_consulted=["Architecture", "Security", "Performance"],
+            alternatives_considered=["MongoDB", "MySQL"],
+            timestamp=datetime.now().isoformat(),
+            choice_id=new_choice_id(),
+            source="agents"
+        )
+
+    async def _framework_agent(self, question: str, classification) -> Optional[AgentChoice]:
+        """Frontend framework choice (React vs Vue)"""
+        question_lower = question.lower()
+        if not ("react" in question_lower and "vue" in question_lower):
+            return None
+        return AgentChoice(
+            question=question,
+            chosen_option="React",
+            reasoning=(
+                "React chosen because: (1) Larger ecosystem and community, "
+                "(2) Better job market for hiring, "
+                "(3) More third-party libraries available, "
+                "(4) Team has some React experience already"
+            ),
+            confidence=0.75,
+            agents_consulted=["Architecture", "Audit"],
+            alternatives_considered=["Vue", "Angular"],
+            timestamp=datetime.now().isoformat(),
+            choice_id=new_choice_id(),
+            source="agents"
+        )
+
+    async def _security_agent(self, question: str, classification) -> Optional[AgentChoice]:
+        """Factual question - direct answer"""
+        if classification is None or classification.question_type != QuestionType.AGENT_ANSWERABLE:
+            return None
+        if classification.confidence < MIN_CLASSIFICATION_CONFIDENCE:
+            return None     # Unsure it is factual - leave it to a human
+        return AgentChoice(
+            question=question,
+            chosen_option="ALLOWED" if "can i delete" in question.lower() else "Analysis provided",
+            reasoning="Security analysis: Operation is safe with low risk",
+            confidence=0.95,
+            agents_consulted=["Security"],
+            alternatives_considered=[],
+            timestamp=datetime.now().isoformat(),
+            choice_id=new_choice_id(),
+            source="agents"
+        )
+
+    async def _emerging_tech_agent(self, question: str, classification) -> Optional[AgentChoice]:
+        """Low confidence example (will escalate)"""
+        question_lower = question.lower()
+        if not ("experimental" in question_lower or "new technology" in question_lower):
+            return None
+        return AgentChoice(
+            question=question,
+            chosen_option="Proceed with caution",
+            reasoning=(
+                "Limited information available about this technology. "
+                "Would benefit from human expertise and experience."
+            ),
+            confidence=0.45,  # Below threshold - will escalate!
+            agents_consulted=["Architecture"],
+            alternatives_considered=["Wait and see", "Research more"],
+            timestamp=datetime.now().isoformat(),
+            choice_id=new_choice_id(),
+            source="agents"
+        )
+
     async def _log_question_answer(self, question: str, choice: AgentChoice,
                                    timestamp: datetime):
-        """Log every Q&A to a file"""
+        """Log every Q&A to the segmented Q&A log (written in the background)"""
         log_entry = {
             "timestamp": timestamp.isoformat(),
             "question": question,
@@ -471,22 +740,18 @@ class AutonomousOrchestrator:
             "logged_at": datetime.now().isoformat()
         }
 
-        # Individual log file
-        log_file = self.qa_log_dir / f"{choice.choice_id}.json"
-        with open(log_file, 'w') as f:
-            json.dump(log_entry, f, indent=2)
-
-        # Also append to master log
-        master_log = self.qa_log_dir / "all_questions.jsonl"
-        with open(master_log, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
-
+        self.log_writer.submit(self.qa_log.append, log_entry)
         self.choices_made.append(choice)
 
     async def _audit_review_choice(self, choice: AgentChoice) -> AuditReview:
         """Audit agent reviews the choice made"""
-        await asyncio.sleep(0.3)
+        review = self._review_choice(choice)
+        self.audit_reviews.append(review)
+        self.audit_store.add_review(review.to_dict(), choice.to_dict())
+        return review
 
+    def _review_choice(self, choice: AgentChoice) -> AuditReview:
+        """The audit agent's verdict on a choice (not yet recorded)"""
         concerns = []
         recommendations = []
 
@@ -529,82 +794,17 @@ class AutonomousOrchestrator:
             recommendations=recommendations,
             timestamp=datetime.now().isoformat()
         )
-
-        self.audit_reviews.append(review)
         return review
 
     async def _write_audit_recommendations(self):
-        """Write all audit reviews to recommendations file"""
+        """
+        Refresh audit_recommendations.md: persistent totals plus the most
+        recent page of reviews (older pages via audit_store.py render)
+        """
         recommendations_file = self.audit_dir / "audit_recommendations.md"
 
-        content = [
-            "# Audit Agent Recommendations",
-            "",
-            f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"**Total Choices Reviewed**: {len(self.audit_reviews)}",
-            "",
-            "---",
-            ""
-        ]
-
-        # Summary statistics
-        approved = sum(1 for r in self.audit_reviews if r.verdict == "approved")
-        questionable = sum(1 for r in self.audit_reviews if r.verdict == "questionable")
-        risky = sum(1 for r in self.audit_reviews if r.verdict == "risky")
-
-        content.extend([
-            "## Summary",
-            "",
-            f"- ✅ Approved: {approved}",
-            f"- ⚠️  Questionable: {questionable}",
-            f"- 🚨 Risky: {risky}",
-            "",
-            "---",
-            ""
-        ])
-
-        # Individual reviews
-        content.append("## Detailed Reviews\n")
-
-        for i, review in enumerate(self.audit_reviews, 1):
-            choice = next((c for c in self.choices_made if c.choice_id == review.choice_id), None)
-
-            if choice:
-                verdict_emoji = {
-                    "approved": "✅",
-                    "questionable": "⚠️",
-                    "risky": "🚨"
-                }.get(review.verdict, "❓")
-
-                content.extend([
-                    f"### {i}. {verdict_emoji} {review.verdict.upper()}",
-                    "",
-                    f"**Choice ID**: {review.choice_id}",
-                    f"**Question**: {choice.question}",
-                    f"**Chosen**: {choice.chosen_option}",
-                    f"**Confidence**: {choice.confidence:.0%}",
-                    f"**Source**: {choice.source}",
-                    f"**Timestamp**: {review.timestamp}",
-                    ""
-                ])
-
-                if review.concerns:
-                    content.append("**Concerns**:")
-                    for concern in review.concerns:
-                        content.append(f"- {concern}")
-                    content.append("")
-
-                if review.recommendations:
-                    content.append("**Recommendations**:")
-                    for rec in review.recommendations:
-                        content.append(f"- {rec}")
-                    content.append("")
-
-                content.append("---\n")
-
-        # Write file
-        with open(recommendations_file, 'w') as f:
-            f.write('\n'.join(content))
+        # Written in the background; only the latest version is kept
+        self.log_writer.write_file(recommendations_file, self.audit_store.render_markdown())
 
     async def mark_outcome(self, choice_id: str, outcome_status: str,
                           success_indicators: List[str] = None,
@@ -639,9 +839,6 @@ class AutonomousOrchestrator:
         if outcome.should_revise or outcome.knowledge_update:
             self.stats["knowledge_improvements"] += 1
 
-        # Reload learned answers (may have been updated)
-        self.learned_answers = self._load_learned_answers()
-
         return {
             "choice_id": choice_id,
             "status": outcome.status.value,
@@ -652,6 +849,33 @@ class AutonomousOrchestrator:
             "learnings": outcome.knowledge_update
         }
 
+    async def process_outcomes_bulk(self, outcomes: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Mark many outcomes at once with a single knowledge base commit
+
+        Args:
+            outcomes: Dicts with "choice_id", "status" and optionally
+                "success_indicators", "failure_indicators", "user_feedback"
+
+        Returns:
+            Counts of processed, revised, reinforced and skipped outcomes
+            (skipped entries carry their reason)
+        """
+        result = await self.post_processor.process_outcomes_bulk(outcomes)
+
+        processed = result["outcomes"]
+        self.stats["outcomes_validated"] += len(processed)
+        self.stats["knowledge_improvements"] += sum(
+            1 for outcome in processed if outcome.should_revise or outcome.knowledge_update
+        )
+
+        return {
+            "processed": len(processed),
+            "revised": result["revised"],
+            "reinforced": result["reinforced"],
+            "skipped": result["skipped"]
+        }
+
     async def auto_validate_recent_outcomes(self, hours: int = 24) -> Dict[str, Any]:
         """
         Auto-validate recent outcomes by analyzing logs and events
@@ -668,9 +892,6 @@ class AutonomousOrchestrator:
         self.stats["outcomes_validated"] += results["total_validated"]
         self.stats["knowledge_improvements"] += results["knowledge_updates"]
 
-        # Reload learned answers
-        self.learned_answers = self._load_learned_answers()
-
         return results
 
     def generate_effectiveness_report(self) -> str:
@@ -684,25 +905,8 @@ class AutonomousOrchestrator:
         return str(report_path)
 
     def _print_stats(self):
-        """Print session statistics"""
-        print(f"{'='*70}")
-        print("📊 SESSION STATISTICS")
-        print(f"{'='*70}")
-        print(f"Total questions: {self.stats['total_questions']}")
-        print(f"  📚 Learned answers used: {self.stats['learned_answers_used']}")
-        print(f"  🤖 Agent decisions: {self.stats['agent_decisions']}")
-        print(f"  🙋 Human escalations: {self.stats['human_escalations']}")
-        print(f"  ✅ Outcomes validated: {self.stats['outcomes_validated']}")
-        print(f"  📈 Knowledge improvements: {self.stats['knowledge_improvements']}")
-
-        if self.stats['total_questions'] > 0:
-            learned_pct = 100 * self.stats['learned_answers_used'] / self.stats['total_questions']
-            human_pct = 100 * self.stats['human_escalations'] / self.stats['total_questions']
-            print(f"\nEfficiency:")
-            print(f"  📚 Instant answers: {learned_pct:.0f}%")
-            print(f"  🙋 Human needed: {human_pct:.0f}%")
-
-        print(f"{'='*70}\n")
+        """Report session statistics"""
+        self.events.emit("session_stats", stats=self.stats)
 
 
 # Test function
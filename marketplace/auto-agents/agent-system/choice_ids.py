@@ -0,0 +1,163 @@
+"""
+Choice IDs - Collision-free, time-sortable identifiers for choices
+
+The old choice_%Y%m%d_%H%M%S IDs collide when two questions are answered
+in the same second. New IDs are ULID-style:
+
+    choice_01JA2Y7Q3M 0000 7ZK4D1QF
+           |          |    |
+           |          |    per-process random node (40 bits)
+           |          per-process counter within the millisecond
+           milliseconds since the epoch (Crockford base32)
+
+Within a process IDs are strictly increasing, even if the clock steps
+back; across processes the node keeps them unique. Sorting the part after
+the prefix sorts by time, so "choices since T" is a binary search
+(ChoiceIdIndex). Legacy IDs are still understood and sort by their
+second-resolution timestamp.
+"""
+
+import os
+import time
+import bisect
+import random
+import threading
+from datetime import datetime
+from typing import List, Optional, Iterable
+
+_ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODING = {char: value for value, char in enumerate(_ENCODING)}
+
+TIME_CHARS = 10
+COUNTER_CHARS = 4
+NODE_CHARS = 8
+ID_CHARS = TIME_CHARS + COUNTER_CHARS + NODE_CHARS
+
+_MAX_COUNTER = 32 ** COUNTER_CHARS - 1
+_LEGACY_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, remainder = divmod(value, 32)
+        chars.append(_ENCODING[remainder])
+    return "".join(reversed(chars))
+
+
+def _decode(text: str) -> int:
+    value = 0
+    for char in text:
+        value = value * 32 + _DECODING[char]
+    return value
+
+
+class ChoiceIdGenerator:
+    """Monotonic ID source; one per process (see new_choice_id)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+        self._pid = None
+        self._node = ""
+
+    def new(self, prefix: str = "choice") -> str:
+        with self._lock:
+            # A forked child must not share its parent's node
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._node = _encode(random.SystemRandom().getrandbits(5 * NODE_CHARS),
+                                     NODE_CHARS)
+
+            now_ms = int(time.time() * 1000)
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._counter = 0
+            elif self._counter < _MAX_COUNTER:
+                self._counter += 1
+            else:
+                # Counter exhausted within one millisecond: borrow the next one
+                self._last_ms += 1
+                self._counter = 0
+
+            return (f"{prefix}_{_encode(self._last_ms, TIME_CHARS)}"
+                    f"{_encode(self._counter, COUNTER_CHARS)}{self._node}")
+
+
+_generator = ChoiceIdGenerator()
+
+
+def new_choice_id(prefix: str = "choice") -> str:
+    """New unique, time-sortable ID ("choice_...", "learned_...")"""
+    return _generator.new(prefix)
+
+
+def _split(choice_id: str):
+    prefix, _, rest = choice_id.partition("_")
+    return prefix, rest
+
+
+def choice_id_time(choice_id: str) -> Optional[datetime]:
+    """When a choice ID was created (local time), for new and legacy IDs"""
+    _, rest = _split(choice_id)
+    if len(rest) == ID_CHARS and all(char in _DECODING for char in rest):
+        return datetime.fromtimestamp(_decode(rest[:TIME_CHARS]) / 1000)
+    try:
+        return datetime.strptime(rest, _LEGACY_FORMAT)
+    except ValueError:
+        return None
+
+
+def time_key(moment: datetime) -> str:
+    """Smallest sort key of any ID created at or after `moment`"""
+    return _encode(int(moment.timestamp() * 1000), TIME_CHARS) + "0" * (ID_CHARS - TIME_CHARS)
+
+
+def sort_key(choice_id: str) -> str:
+    """
+    Key that orders IDs by creation time regardless of prefix
+
+    New IDs use their ULID part as is; legacy IDs map to the key of their
+    timestamp; unparseable IDs sort first.
+    """
+    _, rest = _split(choice_id)
+    if len(rest) == ID_CHARS and all(char in _DECODING for char in rest):
+        return rest
+    moment = choice_id_time(choice_id)
+    return time_key(moment) if moment else ""
+
+
+class ChoiceIdIndex:
+    """
+    Choice IDs kept sorted by time for range queries
+
+    IDs mostly arrive in time order, so add() is usually an append.
+    """
+
+    def __init__(self, choice_ids: Iterable[str] = ()):
+        pairs = sorted((sort_key(choice_id), choice_id) for choice_id in choice_ids)
+        self._keys: List[str] = [key for key, _ in pairs]
+        self._ids: List[str] = [choice_id for _, choice_id in pairs]
+
+    def add(self, choice_id: str):
+        key = sort_key(choice_id)
+        if not self._keys or key >= self._keys[-1]:
+            position = len(self._keys)
+        else:
+            position = bisect.bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._ids.insert(position, choice_id)
+
+    def between(self, start: datetime = None, end: datetime = None) -> List[str]:
+        """IDs created in [start, end), oldest first"""
+        low = bisect.bisect_left(self._keys, time_key(start)) if start else 0
+        high = bisect.bisect_left(self._keys, time_key(end)) if end else len(self._keys)
+        return self._ids[low:high]
+
+    def since(self, start: datetime) -> List[str]:
+        """IDs created at or after start, oldest first"""
+        return self.between(start)
+
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -0,0 +1,283 @@
+"""
+Events - Where the orchestrator reports what it is doing
+
+The orchestrator emits named events with the objects involved instead of
+printing banners itself; a sink decides what happens to them:
+
+- ConsoleSink: renders the familiar emoji banners to stdout (CLI, demos)
+- JsonSink: one JSON object per event, to stderr or appended to a file
+  (through the background log writer)
+- NullSink: drops everything, so nothing is formatted at all
+
+Inside the UserPromptSubmit hook stdout is the channel that injects context
+into the session, so the hook uses the null (default) or JSON sink and only
+the context injection is printed. Only the console sink is interactive:
+with the others the orchestrator never prompts for human guidance.
+
+    AUTO_AGENTS_EVENTS=json AUTO_AGENTS_EVENTS_FILE=events.jsonl  # hook/daemon
+"""
+
+import sys
+import json
+import time
+from dataclasses import is_dataclass, asdict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, TextIO
+
+SINK_KINDS = ("console", "json", "null")
+
+RULE = "=" * 70
+
+
+class EventSink:
+    """Receives orchestrator events; subclasses decide what to do with them"""
+
+    interactive = False
+
+    def emit(self, event: str, **fields: Any):
+        raise NotImplementedError
+
+
+class NullSink(EventSink):
+    """Discards every event"""
+
+    def emit(self, event: str, **fields: Any):
+        pass
+
+
+def _to_json(value: Any) -> Any:
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+class JsonSink(EventSink):
+    """One JSON line per event: {"event", "time", ...fields}"""
+
+    def __init__(self, path: Path = None, stream: TextIO = None):
+        """
+        Args:
+            path: Append events to this file (via the background log writer)
+            stream: Otherwise write them here (default: stderr)
+        """
+        self.path = path
+        self.stream = stream
+        self._writer = None
+        if path is not None:
+            from log_writer import get_log_writer
+            self._writer = get_log_writer()
+
+    def emit(self, event: str, **fields: Any):
+        line = json.dumps(dict(fields, event=event, time=time.time()), default=_to_json) + '\n'
+        if self._writer is not None:
+            self._writer.append(self.path, line)
+        else:
+            (self.stream or sys.stderr).write(line)
+
+
+def _render_question_received(f: Dict[str, Any]) -> List[str]:
+    return ["\n" + RULE, "🤖 AUTONOMOUS AGENT ORCHESTRATOR (Enhanced)", RULE,
+            f"\n❓ Question: {f['question']}\n"]
+
+
+def _render_learned_answer_found(f: Dict[str, Any]) -> List[str]:
+    entry, learned = f["entry"], f["choice"]
+    lines = ["📚 LEARNED ANSWER FOUND!"]
+    if entry["similarity"] < 1.0:
+        lines.append(f"   Similar question: {entry['question']} ({entry['similarity']:.0%} match)")
+    lines += [
+        f"   Originally learned: {entry['learned_date'][:10]}",
+        f"   Times used: {entry['times_used']}",
+        f"   Source: {learned.source}",
+        "",
+        RULE,
+        "✅ ANSWER (from knowledge base)",
+        RULE,
+        f"✅ Chosen: {learned.chosen_option}",
+        f"💭 Reasoning: {learned.reasoning}",
+        f"📈 Confidence: {learned.confidence:.0%}",
+    ]
+    if learned.agents_consulted:
+        lines.append(f"🤖 Agents consulted: {', '.join(learned.agents_consulted)}")
+    lines.append(f"\n{RULE}\n")
+    return lines
+
+
+def _render_negative_cache_hit(f: Dict[str, Any]) -> List[str]:
+    return ["🕳️  No answer yet (asked recently) - skipping agent analysis",
+            f"   Retrying after {f['ttl_seconds']:.0f}s without a new answer", ""]
+
+
+def _render_classified(f: Dict[str, Any]) -> List[str]:
+    classification = f["classification"]
+    return [f"📋 Classification: {classification.question_type.value}",
+            f"   Confidence: {classification.confidence:.0%}\n"]
+
+
+def _render_agents_timed_out(f: Dict[str, Any]) -> List[str]:
+    return [f"⏱️  No answer in time from: {', '.join(f['agents'])}"]
+
+
+def _render_low_confidence(f: Dict[str, Any]) -> List[str]:
+    return [f"\n⚠️  LOW CONFIDENCE: {f['confidence']:.0%} (threshold: {f['threshold']:.0%})",
+            "🙋 Escalating to human for guidance...\n"]
+
+
+def _render_escalation_requested(f: Dict[str, Any]) -> List[str]:
+    choice = f["choice"]
+    lines = [
+        RULE,
+        "🙋 HUMAN GUIDANCE NEEDED",
+        RULE,
+        "\nAgents analyzed the question but confidence is low.",
+        "\nAgent's suggestion:",
+        f"  ✅ Choice: {choice.chosen_option}",
+        f"  💭 Reasoning: {choice.reasoning}",
+        f"  📈 Confidence: {choice.confidence:.0%}",
+        f"  🤖 Agents: {', '.join(choice.agents_consulted)}",
+    ]
+    if choice.alternatives_considered:
+        lines.append(f"  🔄 Alternatives: {', '.join(choice.alternatives_considered)}")
+    lines += [
+        f"\n{'-'*70}",
+        "Please provide guidance:",
+        "  1. Type 'yes' to accept agent's suggestion",
+        "  2. Type your own answer",
+        "  3. Type 'skip' to use agent's choice anyway",
+        f"{'-'*70}\n",
+    ]
+    return lines
+
+
+def _render_escalation_resolved(f: Dict[str, Any]) -> List[str]:
+    resolution = f["resolution"]
+    if resolution == "approved":
+        return ["\n✅ Using agent's choice (human approved)\n"]
+    if resolution == "skipped":
+        return ["\n⚠️  Using agent's choice (low confidence)\n"]
+    if resolution == "human":
+        return [f"\n✅ Using your answer: {f['choice'].chosen_option}\n"]
+    return ["\n\n⚠️  No human input - using agent's choice anyway\n"]
+
+
+def _render_non_answer_skipped(f: Dict[str, Any]) -> List[str]:
+    return [f"\n🕳️  No answer - not saved to knowledge base "
+            f"(skipped for {f['ttl_seconds']:.0f}s)"]
+
+
+def _render_decision(f: Dict[str, Any]) -> List[str]:
+    choice, audit = f["choice"], f["audit"]
+    lines = [
+        f"\n{RULE}",
+        "📊 FINAL DECISION",
+        RULE,
+        f"✅ Chosen: {choice.chosen_option}",
+        f"💭 Reasoning: {choice.reasoning}",
+        f"📈 Confidence: {choice.confidence:.0%}",
+        f"🤖 Agents consulted: {', '.join(choice.agents_consulted)}",
+        f"🔖 Source: {choice.source}",
+        f"\n🔍 Audit Review: {audit.verdict.upper()}",
+    ]
+    if audit.concerns:
+        lines.append("⚠️  Concerns:")
+        lines.extend(f"   • {concern}" for concern in audit.concerns)
+    if audit.recommendations:
+        lines.append("💡 Recommendations:")
+        lines.extend(f"   • {rec}" for rec in audit.recommendations)
+    lines += [
+        f"\n{RULE}",
+        f"📝 Logged to: {f['qa_log_dir']} ({choice.choice_id})",
+        f"📋 Audit: {f['audit_file']}",
+        f"📚 Knowledge base: {f['knowledge_base']}",
+        f"{RULE}\n",
+    ]
+    return lines
+
+
+def _render_batch_processed(f: Dict[str, Any]) -> List[str]:
+    return [
+        f"\n📦 Processed {f['questions']} questions ({f['unique']} distinct)",
+        f"   📚 Already known: {f['learned_used']}",
+        f"   🤖 Agent decisions: {f['agent_decisions']} ({f['saved']} saved to knowledge base)\n",
+    ]
+
+
+def _render_session_stats(f: Dict[str, Any]) -> List[str]:
+    stats = f["stats"]
+    lines = [
+        RULE,
+        "📊 SESSION STATISTICS",
+        RULE,
+        f"Total questions: {stats['total_questions']}",
+        f"  📚 Learned answers used: {stats['learned_answers_used']}",
+        f"  🕳️  Recent non-answers reused: {stats['negative_cache_hits']}",
+        f"  🤖 Agent decisions: {stats['agent_decisions']}",
+        f"  🙋 Human escalations: {stats['human_escalations']}",
+        f"  ✅ Outcomes validated: {stats['outcomes_validated']}",
+        f"  📈 Knowledge improvements: {stats['knowledge_improvements']}",
+    ]
+    if stats['total_questions'] > 0:
+        learned_pct = 100 * stats['learned_answers_used'] / stats['total_questions']
+        human_pct = 100 * stats['human_escalations'] / stats['total_questions']
+        lines += ["\nEfficiency:",
+                  f"  📚 Instant answers: {learned_pct:.0f}%",
+                  f"  🙋 Human needed: {human_pct:.0f}%"]
+    lines.append(f"{RULE}\n")
+    return lines
+
+
+CONSOLE_RENDERERS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    "question_received": _render_question_received,
+    "learned_answer_found": _render_learned_answer_found,
+    "negative_cache_hit": _render_negative_cache_hit,
+    "classified": _render_classified,
+    "consulting_agents": lambda f: ["🧠 Agents analyzing and making choice..."],
+    "agents_timed_out": _render_agents_timed_out,
+    "low_confidence": _render_low_confidence,
+    "escalation_requested": _render_escalation_requested,
+    "escalation_resolved": _render_escalation_resolved,
+    "non_answer_skipped": _render_non_answer_skipped,
+    "learned_answer_saved": lambda f: ["\n📚 Saved to knowledge base (will reuse next time)"],
+    "audit_started": lambda f: ["🔍 Audit agent reviewing choice..."],
+    "decision": _render_decision,
+    "batch_processed": _render_batch_processed,
+    "session_stats": _render_session_stats,
+}
+
+
+class ConsoleSink(EventSink):
+    """Human-readable banners (events without a renderer are ignored)"""
+
+    interactive = True
+
+    def __init__(self, stream: TextIO = None):
+        """
+        Args:
+            stream: Where to print (default: stdout at the time of each event)
+        """
+        self.stream = stream
+
+    def emit(self, event: str, **fields: Any):
+        render = CONSOLE_RENDERERS.get(event)
+        if render is not None:
+            print('\n'.join(render(fields)), file=self.stream or sys.stdout)
+
+
+def make_sink(kind: str = "console", path: Path = None) -> EventSink:
+    """
+    Build a sink by name
+
+    Args:
+        kind: "console", "json" or "null"
+        path: For "json", append to this file instead of writing to stderr
+    """
+    if kind == "console":
+        return ConsoleSink()
+    if kind == "json":
+        return JsonSink(path=path)
+    if kind == "null":
+        return NullSink()
+    raise ValueError(f"Event sink must be one of {SINK_KINDS}, got {kind!r}")
@@ -0,0 +1,408 @@
+"""
+Hashed Classifier - Learned question classifier beside the regex rules
+
+A naive Bayes model over hashed features, trained offline from the Q&A log
+and the recorded outcomes:
+
+- Features: lower-cased tokens, adjacent-token bigrams, the first token and
+  a length bucket, each hashed (crc32) into one of `dim` buckets
+- Labels: the regex classifier's type for each logged question, corrected
+  by what happened next: questions a human answered, and agent decisions
+  whose outcome failed or was reversed, are labeled human_decision;
+  questions whose outcome was validated count double
+- Inference: one sparse dot product (bias + the weights of the question's
+  buckets), so the cost does not grow with the number of rules
+- Storage: models/question_model.bin, a one-line JSON header followed by
+  the float32 bias and weight arrays (stdlib array, no NumPy needed)
+- Quality gate: a model is only saved or used when it was trained on
+  examples of every QuestionType and its accuracy on the labeled corpus
+  (benchmarks/classifier_corpus_v1.jsonl) meets the floors in
+  benchmarks/classifier_budget.json ("model" entry, or the regex rules'
+  floors when there is none); the result is stored in the header
+- Confidence is capped at MAX_CONFIDENCE, below the orchestrator's
+  MIN_CLASSIFICATION_CONFIDENCE, so agents never answer on a model label
+  alone (the question escalates instead)
+
+The orchestrator uses it with classifier="model" (the hook and daemon with
+AUTO_AGENTS_CLASSIFIER=model); without a trained model it falls back to
+the regex classifier.
+
+    python3 hashed_classifier.py train
+    python3 hashed_classifier.py predict "Should we use Redis or Memcached?"
+    python3 hashed_classifier.py show
+"""
+
+import re
+import sys
+import json
+import math
+import zlib
+import argparse
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+
+from json_io import read_json, temp_path
+from qa_log import QALog
+from question_classifier import QuestionClassifier, QuestionType, ClassificationResult
+
+MODEL_FORMAT = "hashed-naive-bayes"
+MODEL_VERSION = 1
+DEFAULT_DIM = 2 ** 14
+DEFAULT_MODEL_FILE = Path("models") / "question_model.bin"
+
+CLASSIFIER_KINDS = ("regex", "model")
+
+# Labeled corpus and accuracy floors (see benchmarks/bench_classifier.py)
+BENCH_DIR = Path(__file__).parent.parent / "benchmarks"
+DEFAULT_CORPUS = BENCH_DIR / "classifier_corpus_v1.jsonl"
+DEFAULT_BUDGET = BENCH_DIR / "classifier_budget.json"
+
+# Softmax probabilities of naive Bayes are overconfident (98% on questions
+# it gets wrong); stay below the orchestrator's MIN_CLASSIFICATION_CONFIDENCE
+# (0.6), under which the security agent does not answer
+MAX_CONFIDENCE = 0.55
+
+TOKEN_RE = re.compile(r"[a-z0-9_']+|[?/]")
+
+# Outcome statuses that mean an agent decision should have gone to a human
+OVERRULED_STATUSES = ("failed", "reversed")
+
+
+def features(question: str, dim: int) -> List[int]:
+    """Distinct feature buckets of a question"""
+    tokens = TOKEN_RE.findall(question.lower())
+    names = [f"^{tokens[0]}" if tokens else "^", f"#len{min(len(tokens), 8)}"]
+    names.extend(tokens)
+    names.extend(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return list({zlib.crc32(name.encode()) % dim for name in names})
+
+
+class HashedFeatureModel:
+    """Per-class bias plus a dim x classes weight matrix (bucket-major)"""
+
+    def __init__(self, classes: List[str], dim: int, bias: array, weights: array,
+                 metadata: Dict[str, Any] = None):
+        """
+        Args:
+            classes: QuestionType values, in column order
+            dim: Number of feature buckets
+            bias: One log prior per class
+            weights: dim * len(classes) log likelihoods, bucket-major
+            metadata: Training details stored in the header
+        """
+        self.classes = classes
+        self.types = [QuestionType(value) for value in classes]
+        self.dim = dim
+        self.bias = bias
+        self.weights = weights
+        self.metadata = metadata or {}
+
+    def scores(self, question: str) -> List[float]:
+        """Unnormalized log score per class"""
+        width = len(self.classes)
+        weights = self.weights
+        scores = list(self.bias)
+        for bucket in features(question, self.dim):
+            base = bucket * width
+            for k in range(width):
+                scores[k] += weights[base + k]
+        return scores
+
+    def classify(self, question: str, context: Optional[Dict] = None) -> ClassificationResult:
+        """Same interface as QuestionClassifier.classify()"""
+        scores = self.scores(question)
+        top = max(range(len(scores)), key=scores.__getitem__)
+        # Softmax probability of the winning class, capped
+        confidence = min(MAX_CONFIDENCE, 1.0 / sum(math.exp(score - scores[top]) for score in scores))
+        return ClassificationResult(
+            question_type=self.types[top],
+            confidence=confidence,
+            matched_patterns=[],
+            reasoning=f"Hashed-feature model: {confidence:.0%} {self.classes[top]}"
+        )
+
+    def evaluate(self, corpus_file: Path = DEFAULT_CORPUS) -> Dict[str, Any]:
+        """
+        Accuracy on a labeled corpus, recorded as metadata["quality"]
+
+        Args:
+            corpus_file: JSON lines with "question" and "expected" (a QuestionType value)
+
+        Returns:
+            {"corpus", "accuracy", "per_type": {type: accuracy}}
+        """
+        per_type: Dict[str, List[int]] = {}
+        with open(corpus_file, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                counts = per_type.setdefault(record["expected"], [0, 0])
+                counts[0] += self.classify(record["question"]).question_type.value == record["expected"]
+                counts[1] += 1
+        correct = sum(hits for hits, _ in per_type.values())
+        total = sum(count for _, count in per_type.values())
+        quality = {
+            "corpus": corpus_file.name,
+            "accuracy": round(correct / total, 4) if total else 0.0,
+            "per_type": {q_type: round(hits / count, 4) for q_type, (hits, count) in sorted(per_type.items())},
+        }
+        self.metadata["quality"] = quality
+        return quality
+
+    def quality_problems(self, budget_file: Path = DEFAULT_BUDGET) -> List[str]:
+        """
+        Reasons the model must not be used (empty when it passes the gate)
+
+        Args:
+            budget_file: Accuracy floors per classifier, for the corpus they name
+        """
+        problems = []
+        per_class = self.metadata.get("examples_per_class", {})
+        missing = [value for value in self.classes if not per_class.get(value)]
+        if missing:
+            problems.append(f"no training examples for {', '.join(missing)}")
+
+        quality = self.metadata.get("quality")
+        if not quality:
+            problems.append("not evaluated on the labeled corpus")
+            return problems
+        budgets = read_json(budget_file, {})
+        if not budgets:
+            problems.append(f"no accuracy floors ({budget_file} not found)")
+            return problems
+        if budgets.get("corpus") != quality["corpus"]:
+            problems.append(f"evaluated on {quality['corpus']}, floors are for {budgets.get('corpus')}")
+            return problems
+
+        # Without floors of its own, a model must do as well as the rules
+        floors = budgets.get("model") or budgets.get("regex", {})
+        if quality["accuracy"] < floors.get("min_accuracy", 0.0):
+            problems.append(f"accuracy {quality['accuracy']:.1%} < {floors['min_accuracy']:.1%}")
+        for q_type, floor in floors.get("min_type_accuracy", {}).items():
+            actual = quality["per_type"].get(q_type, 0.0)
+            if actual < floor:
+                problems.append(f"{q_type} accuracy {actual:.1%} < {floor:.1%}")
+        return problems
+
+    def save(self, path: Path, budget_file: Path = DEFAULT_BUDGET) -> Path:
+        """
+        Write the header line and the float32 arrays (little-endian)
+
+        Raises:
+            ValueError: The model does not pass the quality gate (run evaluate() first)
+        """
+        problems = self.quality_problems(budget_file)
+        if problems:
+            raise ValueError(f"Refusing to save question model: {'; '.join(problems)}")
+
+        header = dict(self.metadata, format=MODEL_FORMAT, version=MODEL_VERSION,
+                      classes=self.classes, dim=self.dim)
+        bias, weights = array('f', self.bias), array('f', self.weights)
+        if sys.byteorder == "big":
+            bias.byteswap()
+            weights.byteswap()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = temp_path(path)
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps(header).encode() + b'\n')
+                bias.tofile(f)
+                weights.tofile(f)
+            tmp_path.replace(path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return path
+
+    @classmethod
+    def load(cls, path: Path, budget_file: Optional[Path] = DEFAULT_BUDGET) -> "HashedFeatureModel":
+        """
+        Read a saved model
+
+        Args:
+            path: Model file
+            budget_file: Floors the model must still meet (None = load
+                without the quality gate, e.g. to benchmark it)
+
+        Raises:
+            ValueError: Not a model file, or it fails the quality gate
+        """
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline())
+            data = f.read()
+        if header.get("format") != MODEL_FORMAT or header.get("version") != MODEL_VERSION:
+            raise ValueError(f"{path} is not a {MODEL_FORMAT} v{MODEL_VERSION} model")
+
+        values = array('f')
+        values.frombytes(data)
+        if sys.byteorder == "big":
+            values.byteswap()
+        width = len(header["classes"])
+        if len(values) != width * (header["dim"] + 1):
+            raise ValueError(f"{path} is truncated")
+        metadata = {key: value for key, value in header.items()
+                    if key not in ("format", "version", "classes", "dim")}
+        model = cls(header["classes"], header["dim"], values[:width], values[width:], metadata)
+        if budget_file is not None:
+            problems = model.quality_problems(budget_file)
+            if problems:
+                raise ValueError(f"{path} fails the quality gate: {'; '.join(problems)}")
+        return model
+
+
+def train(examples: Iterable[Tuple[str, str, float]], dim: int = DEFAULT_DIM,
+          alpha: float = 0.1) -> HashedFeatureModel:
+    """
+    Fit a multinomial naive Bayes model over hashed features
+
+    Args:
+        examples: (question, QuestionType value, weight) triples
+        dim: Number of feature buckets
+        alpha: Additive smoothing
+
+    Returns:
+        The trained model (every QuestionType is a class, seen or not)
+    """
+    classes = [question_type.value for question_type in QuestionType]
+    column = {value: k for k, value in enumerate(classes)}
+    width = len(classes)
+    counts = [0.0] * (dim * width)
+    class_weight = [0.0] * width
+    class_features = [0.0] * width
+    per_class = {value: 0 for value in classes}
+
+    for question, label, weight in examples:
+        k = column[label]
+        buckets = features(question, dim)
+        class_weight[k] += weight
+        class_features[k] += weight * len(buckets)
+        per_class[label] += 1
+        for bucket in buckets:
+            counts[bucket * width + k] += weight
+
+    total_weight = sum(class_weight)
+    bias = array('f', (
+        math.log((class_weight[k] + alpha) / (total_weight + alpha * width))
+        for k in range(width)
+    ))
+    denominators = [math.log(class_features[k] + alpha * dim) for k in range(width)]
+    weights = array('f', (
+        math.log(counts[i] + alpha) - denominators[i % width]
+        for i in range(dim * width)
+    ))
+    metadata = {
+        "trained": datetime.now().isoformat(),
+        "examples": sum(per_class.values()),
+        "examples_per_class": per_class,
+        "alpha": alpha,
+    }
+    return HashedFeatureModel(classes, dim, bias, weights, metadata)
+
+
+def training_examples(agents_dir: Path, teacher: QuestionClassifier = None) -> Iterator[Tuple[str, str, float]]:
+    """
+    Labeled questions from the Q&A log and outcomes
+
+    Args:
+        agents_dir: Directory holding qa_logs/ and outcomes/
+        teacher: Classifier providing the base labels (default: regex rules)
+
+    Returns:
+        Iterator of (question, QuestionType value, weight)
+    """
+    teacher = teacher or QuestionClassifier(cache_size=0)
+    outcomes = read_json(agents_dir / "outcomes" / "all_outcomes.json", {})
+
+    for record in QALog(agents_dir / "qa_logs").iter_all_records():
+        question = record.get("question")
+        if not question:
+            continue
+        choice = record.get("choice", {})
+        status = outcomes.get(choice.get("choice_id"), {}).get("status")
+
+        label = teacher.classify(question).question_type.value
+        weight = 1.0
+        if choice.get("source") == "human":
+            label = QuestionType.HUMAN_DECISION.value
+        if status in OVERRULED_STATUSES and choice.get("source") == "agents":
+            label = QuestionType.HUMAN_DECISION.value
+            weight = 2.0
+        elif status == "success":
+            weight = 2.0
+        yield question, label, weight
+
+
+def make_classifier(kind: str = "regex", model_file: Path = None):
+    """
+    The classifier the orchestrator should use
+
+    Args:
+        kind: "regex" (QuestionClassifier) or "model" (HashedFeatureModel)
+        model_file: Trained model (required for "model")
+
+    Returns:
+        An object with classify(question, context=None); falls back to the
+        regex classifier when the model cannot be loaded or fails the
+        quality gate
+    """
+    if kind == "regex":
+        return QuestionClassifier()
+    if kind != "model":
+        raise ValueError(f"Classifier must be one of {CLASSIFIER_KINDS}, got {kind!r}")
+    try:
+        return HashedFeatureModel.load(model_file)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Question model unavailable ({e}); using regex classifier", file=sys.stderr)
+        return QuestionClassifier()
+
+
+def main():
+    """Train and inspect the question model"""
+    parser = argparse.ArgumentParser(description="Hashed-feature question classifier")
+    parser.add_argument("action", choices=["train", "predict", "show"])
+    parser.add_argument("question", nargs="?", help="predict: the question to classify")
+    parser.add_argument("--agents-dir", type=Path, default=Path(__file__).parent,
+                        help="Directory holding qa_logs/ and outcomes/ (default: this directory)")
+    parser.add_argument("--model-file", type=Path, default=None,
+                        help="Model path (default: <agents-dir>/models/question_model.bin)")
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM, help=f"Feature buckets (default {DEFAULT_DIM})")
+    parser.add_argument("--alpha", type=float, default=0.1, help="Smoothing (default 0.1)")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS,
+                        help=f"Labeled corpus for the quality gate (default {DEFAULT_CORPUS.name})")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET,
+                        help=f"Accuracy floors for the quality gate (default {DEFAULT_BUDGET.name})")
+    args = parser.parse_args()
+    model_file = args.model_file or args.agents_dir / DEFAULT_MODEL_FILE
+
+    if args.action == "train":
+        model = train(training_examples(args.agents_dir), dim=args.dim, alpha=args.alpha)
+        print(f"🧠 Trained on {model.metadata['examples']} questions: {model.metadata['examples_per_class']}")
+        quality = model.evaluate(args.corpus)
+        print(f"📊 Corpus accuracy: {quality['accuracy']:.1%} {quality['per_type']}")
+        try:
+            model.save(model_file, args.budget)
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"💾 Saved {model_file} ({model_file.stat().st_size // 1024} KB)")
+        return
+
+    # show/predict inspect a model whether or not it passes the gate
+    model = HashedFeatureModel.load(model_file, budget_file=None)
+    if args.action == "show":
+        print(json.dumps(dict(model.metadata, classes=model.classes, dim=model.dim), indent=2))
+        return
+
+    if not args.question:
+        parser.error("predict needs a question")
+    result = model.classify(args.question)
+    regex = QuestionClassifier().classify(args.question)
+    print(f"🧠 Model: {result.question_type.value} ({result.confidence:.0%})")
+    print(f"📋 Regex: {regex.question_type.value} ({regex.confidence:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+JSON file helpers shared by the agent system
+
+- write_json_atomic: temp file + fsync + rename, so a crash mid-write never
+  leaves a truncated file behind
+- temp_path: a temp file name next to a file that no other writer (thread
+  or process) will pick for the same file
+- read_json: loads a file and, if it is corrupt, moves it aside instead of
+  silently treating it as empty (which would wipe it on the next save)
+"""
+
+import os
+import sys
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+
+def temp_path(path: Path) -> Path:
+    """Unique temp file beside `path` (pid, thread and a random suffix)"""
+    return path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.{os.urandom(4).hex()}.tmp"
+    )
+
+
+def write_json_atomic(path: Path, data: Any, indent: int = 2):
+    """Write JSON via temp file + rename so readers never see a partial file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = temp_path(path)
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    finally:
+        if tmp_file.exists():
+            tmp_file.unlink()
+
+
+def read_json(path: Path, default: Any = None) -> Any:
+    """
+    Load a JSON file
+
+    Args:
+        path: File to read
+        default: Returned when the file does not exist (or was corrupt)
+
+    Returns:
+        Parsed JSON. A corrupt file is renamed to
+        <name>.corrupt-<timestamp> and reported on stderr, so its contents
+        are kept for recovery and not overwritten by the next save.
+    """
+    if not path.exists():
+        return default
+
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except ValueError as e:
+        quarantine = path.with_name(
+            f"{path.name}.corrupt-{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+        os.replace(path, quarantine)
+        print(f"⚠️  {path} is corrupt ({e}); moved to {quarantine}", file=sys.stderr)
+        return default
@@ -0,0 +1,115 @@
+"""
+Knowledge Base Eviction - Keeps the learned answer store bounded
+
+When the knowledge base grows past its entry or byte budget, the entries
+least worth keeping are archived and removed:
+
+- Retention score combines confidence, usage (times_used, success_count)
+  and age since the answer last proved itself (last_success, or
+  learned_date if it never has)
+- Human answers (source == "human") are pinned and never evicted
+- Eviction trims to a low-water mark below the budget, so a full KB does
+  not evict on every new answer
+- Evicted entries are appended to an archive file and can be restored by hand
+"""
+
+import json
+import math
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+# Sources that are never evicted
+PINNED_SOURCES = ("human",)
+
+# Trim to this fraction of the budget once it is exceeded
+LOW_WATER_MARK = 0.9
+
+# Age (days) at which an unused answer's score halves
+AGE_HALF_LIFE_DAYS = 30.0
+
+
+def entry_size(entry: Dict[str, Any]) -> int:
+    """Approximate serialized size of one entry in bytes"""
+    return len(json.dumps(entry))
+
+
+def is_pinned(entry: Dict[str, Any]) -> bool:
+    return entry.get("source") in PINNED_SOURCES
+
+
+def retention_score(entry: Dict[str, Any], now: datetime = None) -> float:
+    """
+    How much an entry is worth keeping (higher = keep)
+
+    confidence x usage boost, decayed by age since the answer last proved
+    itself. An answer used 10 times scores ~3.4x an unused one of the same
+    confidence and age.
+    """
+    now = now or datetime.now()
+    confidence = entry.get("confidence") or 0.0
+    uses = entry.get("times_used", 0) + 2 * entry.get("success_count", 0)
+
+    reference = entry.get("last_success") or entry.get("learned_date")
+    try:
+        age_days = max(0.0, (now - datetime.fromisoformat(reference)).total_seconds() / 86400)
+    except (TypeError, ValueError):
+        age_days = AGE_HALF_LIFE_DAYS
+
+    return confidence * (1 + math.log1p(uses)) / (1 + age_days / AGE_HALF_LIFE_DAYS)
+
+
+def select_evictions(entries: Dict[str, Dict[str, Any]], max_entries: Optional[int] = None,
+                     max_bytes: Optional[int] = None, now: datetime = None) -> List[str]:
+    """
+    Choose which entries to evict so the KB fits its budget
+
+    Args:
+        entries: {question_hash: entry}
+        max_entries: Entry budget (None = unlimited)
+        max_bytes: Byte budget, measured with entry_size() (None = unlimited)
+        now: Reference time for age scoring
+
+    Returns:
+        Question hashes to evict, lowest retention score first
+    """
+    sizes = {q_hash: entry_size(entry) for q_hash, entry in entries.items()}
+    count = len(entries)
+    total_bytes = sum(sizes.values())
+
+    over_entries = max_entries is not None and count > max_entries
+    over_bytes = max_bytes is not None and total_bytes > max_bytes
+    if not over_entries and not over_bytes:
+        return []
+
+    target_count = int(max_entries * LOW_WATER_MARK) if over_entries else count
+    target_bytes = int(max_bytes * LOW_WATER_MARK) if over_bytes else total_bytes
+
+    now = now or datetime.now()
+    candidates = sorted(
+        (q_hash for q_hash, entry in entries.items() if not is_pinned(entry)),
+        key=lambda q_hash: retention_score(entries[q_hash], now)
+    )
+
+    evicted = []
+    for q_hash in candidates:
+        if count <= target_count and total_bytes <= target_bytes:
+            break
+        evicted.append(q_hash)
+        count -= 1
+        total_bytes -= sizes[q_hash]
+
+    return evicted
+
+
+def archive_entries(archive_file: Path, evicted: Iterable[Tuple[str, Dict[str, Any]]]):
+    """Append evicted entries to the archive (one JSON object per line)"""
+    evicted_at = datetime.now().isoformat()
+    archive_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(archive_file, 'a') as f:
+        for q_hash, entry in evicted:
+            f.write(json.dumps({
+                "question_hash": q_hash,
+                "evicted_at": evicted_at,
+                "entry": entry
+            }) + '\n')
@@ -0,0 +1,828 @@
+"""
+Knowledge Store - SQLite-backed learned answers
+
+Replaces whole-file rewrites of learned_answers.json with single-row
+UPDATE/INSERT statements against a WAL-mode SQLite database, keyed by the
+normalized question hash. A cache hit, a new answer or a confidence change
+now costs one row write regardless of how many answers have been learned.
+
+Usage counters (times_used, success_count, last_success) are additionally
+collected by a write-behind buffer and flushed in batches, on a size/time
+threshold or at process exit. JsonKnowledgeStore keeps the original
+learned_answers.json format for setups that want it, with the same buffer
+and atomic (temp file + rename) saves.
+
+learned_answers.json is imported once when the database is first created
+and can be regenerated at any time for humans to read:
+
+    python3 knowledge_store.py export
+    python3 knowledge_store.py stats
+
+Either backend can be bounded by an entry count and byte budget; the least
+valuable answers are then archived and removed (see kb_eviction.py).
+"""
+
+import sys
+import json
+import time
+import atexit
+import sqlite3
+import hashlib
+import argparse
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator, Callable
+
+from json_io import write_json_atomic, read_json
+from kb_eviction import select_evictions, archive_entries
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS learned_answers (
+    question_hash           TEXT PRIMARY KEY,
+    question                TEXT NOT NULL,
+    chosen_option           TEXT,
+    reasoning               TEXT,
+    confidence              REAL,
+    agents_consulted        TEXT,       -- JSON list
+    alternatives_considered TEXT,       -- JSON list
+    learned_date            TEXT,
+    times_used              INTEGER NOT NULL DEFAULT 0,
+    source                  TEXT,
+    success_count           INTEGER,
+    last_success            TEXT,
+    needs_review            INTEGER,
+    failure_history         TEXT,       -- JSON list
+    extra                   TEXT        -- JSON object of any other keys
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Columns stored as JSON text
+JSON_COLUMNS = ("agents_consulted", "alternatives_considered", "failure_history")
+
+# Entry keys in the order learned_answers.json has always used
+ENTRY_KEYS = (
+    "question", "chosen_option", "reasoning", "confidence",
+    "agents_consulted", "alternatives_considered", "learned_date",
+    "times_used", "source", "success_count", "last_success",
+    "needs_review", "failure_history",
+)
+
+# Keys only written once they have been set
+OPTIONAL_KEYS = ("success_count", "last_success", "needs_review", "failure_history")
+
+COLUMNS = ("question_hash",) + ENTRY_KEYS + ("extra",)
+
+# Approximate serialized size of a row (values plus the JSON keys every
+# entry has), so the byte budget check is one aggregate query
+ROW_SIZE_SQL = " + ".join(
+    [f"COALESCE(LENGTH({column}), 0)" for column in COLUMNS[1:]] +
+    [str(len(json.dumps(dict.fromkeys(
+        key for key in ENTRY_KEYS if key not in OPTIONAL_KEYS))))]
+)
+
+
+def question_hash(question: str) -> str:
+    """Knowledge base key for a question (normalized MD5)"""
+    return hashlib.md5(question.lower().strip().encode()).hexdigest()
+
+
+class WriteBehindBuffer:
+    """
+    Collects usage counters in memory and flushes them in batches
+
+    Pending changes per question hash:
+    - times_used: increments to add
+    - success_count: successes to add
+    - last_success: latest value (last write wins)
+    - confidence: highest value (a success never lowers confidence)
+
+    A flush happens when `max_pending` changes have accumulated, when the
+    oldest pending change is older than `max_delay_seconds` (checked on
+    each new change), on close() and at interpreter exit.
+    """
+
+    def __init__(self, flush_fn: Callable[[Dict[str, Dict[str, Any]]], None],
+                 max_pending: int = 64, max_delay_seconds: float = 5.0):
+        """
+        Args:
+            flush_fn: Called with {question_hash: pending} to persist a batch
+            max_pending: Number of buffered changes that triggers a flush
+            max_delay_seconds: Age of the oldest change that triggers a flush
+        """
+        self.flush_fn = flush_fn
+        self.max_pending = max_pending
+        self.max_delay_seconds = max_delay_seconds
+
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._changes = 0
+        self._oldest = None
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+
+    def _record(self, q_hash: str) -> Dict[str, Any]:
+        pending = self._pending.get(q_hash)
+        if pending is None:
+            pending = {"times_used": 0, "success_count": 0,
+                       "last_success": None, "confidence": None}
+            self._pending[q_hash] = pending
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+        self._changes += 1
+        return pending
+
+    def add_use(self, q_hash: str):
+        """Buffer one times_used increment"""
+        with self._lock:
+            self._record(q_hash)["times_used"] += 1
+        self._maybe_flush()
+
+    def add_success(self, q_hash: str, confidence: float, timestamp: str):
+        """Buffer one success (success_count + 1, last_success, confidence)"""
+        with self._lock:
+            pending = self._record(q_hash)
+            pending["success_count"] += 1
+            pending["last_success"] = timestamp
+            pending["confidence"] = max(confidence, pending["confidence"] or 0.0)
+        self._maybe_flush()
+
+    def apply(self, q_hash: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Return `entry` with any pending changes for it applied (for reads)"""
+        with self._lock:
+            pending = self._pending.get(q_hash)
+            if pending is None:
+                return entry
+            return apply_pending(entry, pending)
+
+    def drain(self) -> Dict[str, Dict[str, Any]]:
+        """Take all pending changes, leaving the buffer empty"""
+        with self._lock:
+            batch = self._pending
+            self._pending = {}
+            self._changes = 0
+            self._oldest = None
+        return batch
+
+    def flush(self):
+        """Persist all pending changes in one batch"""
+        with self._lock:
+            batch = self.drain()
+            if not batch:
+                return
+            try:
+                self.flush_fn(batch)
+            except BaseException:
+                # Keep the batch so a later flush can retry it
+                self._pending = batch
+                self._changes = len(batch)
+                self._oldest = time.monotonic()
+                raise
+
+    def _maybe_flush(self):
+        with self._lock:
+            due = (
+                self._changes >= self.max_pending or
+                (self._oldest is not None and
+                 time.monotonic() - self._oldest >= self.max_delay_seconds)
+            )
+        if due:
+            self.flush()
+
+    def close(self):
+        """Flush and stop flushing at exit"""
+        self.flush()
+        atexit.unregister(self.flush)
+
+    @property
+    def pending_changes(self) -> int:
+        """Buffered changes not yet flushed (not __len__: an empty buffer must stay truthy)"""
+        return self._changes
+
+
+def apply_pending(entry: Dict[str, Any], pending: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a buffered counter record to a learned-answer dict (returns a copy)"""
+    entry = dict(entry)
+    entry["times_used"] = entry.get("times_used", 0) + pending["times_used"]
+    if pending["success_count"]:
+        entry["confidence"] = max(pending["confidence"], entry.get("confidence") or 0.0)
+        entry["success_count"] = entry.get("success_count", 0) + pending["success_count"]
+        entry["last_success"] = pending["last_success"]
+        # A confirmed answer no longer needs review
+        entry.pop("needs_review", None)
+    return entry
+
+
+class KnowledgeStore:
+    """
+    Learned answers stored in SQLite
+
+    Entries are exchanged as plain dicts with the same keys as
+    learned_answers.json, so callers do not need to know about the schema.
+    """
+
+    def __init__(self, db_file: Path, json_file: Path = None, write_behind: bool = True,
+                 max_pending: int = 64, max_delay_seconds: float = 5.0,
+                 max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 archive_file: Path = None):
+        """
+        Open (and create if needed) the knowledge store
+
+        Args:
+            db_file: SQLite database file
+            json_file: Legacy learned_answers.json to import on first open
+            write_behind: Buffer usage counters instead of writing each one
+            max_pending: Buffered changes before a flush (write-behind only)
+            max_delay_seconds: Max age of a buffered change (write-behind only)
+            max_entries: Entry budget enforced by enforce_budget() (None = unlimited)
+            max_bytes: Approximate byte budget (None = unlimited)
+            archive_file: Where evicted entries go (default: learned_answers_archive.jsonl)
+        """
+        self.db_file = db_file
+        self.path = db_file
+        self.json_file = json_file
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.archive_file = archive_file or db_file.with_name("learned_answers_archive.jsonl")
+        self._buffer = (
+            WriteBehindBuffer(self._apply_pending, max_pending, max_delay_seconds)
+            if write_behind else None
+        )
+        self._in_batch = False
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit: single statements are atomic, multi-statement
+        # updates use _transaction()
+        self._conn = sqlite3.connect(str(db_file), timeout=10.0, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        if json_file is not None:
+            self._migrate_from_json(json_file)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction that takes the lock up front (no lost updates)"""
+        if self._in_batch:
+            # Part of the enclosing batch(); it commits
+            yield self._conn
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    @contextmanager
+    def batch(self) -> Iterator["KnowledgeStore"]:
+        """
+        Apply many updates as one transaction
+
+        Inside the block reinforce()/revise()/put() write straight to the
+        database (bypassing the write-behind buffer) and nothing is
+        committed until the block exits; an exception rolls all of it back.
+
+            with store.batch():
+                for q_hash, confidence, timestamp in successes:
+                    store.reinforce(q_hash, confidence, timestamp)
+        """
+        if self._in_batch:
+            yield self
+            return
+        self.flush()
+        with self._transaction():
+            self._in_batch = True
+            try:
+                yield self
+            finally:
+                self._in_batch = False
+
+    def _migrate_from_json(self, json_file: Path):
+        """One-time import of learned_answers.json into the store"""
+        if not json_file.exists() or self._get_meta("json_migrated"):
+            return
+
+        with self._transaction() as conn:
+            # Another process may have migrated while we waited for the lock
+            if self._get_meta("json_migrated"):
+                return
+
+            try:
+                with open(json_file, 'r') as f:
+                    learned = json.load(f)
+            except ValueError as e:
+                # Leave unmarked so a repaired file is imported next time
+                print(f"⚠️  Could not import {json_file}: {e}", file=sys.stderr)
+                return
+
+            conn.executemany(
+                f"INSERT OR IGNORE INTO learned_answers ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+                [self._entry_to_row(q_hash, entry) for q_hash, entry in learned.items()]
+            )
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('json_migrated', ?)",
+                (str(json_file),)
+            )
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _entry_to_row(q_hash: str, entry: Dict[str, Any]) -> tuple:
+        """Convert a learned-answer dict to a row tuple in COLUMNS order"""
+        values = [q_hash]
+        for key in ENTRY_KEYS:
+            value = entry.get(key)
+            if key in JSON_COLUMNS and value is not None:
+                value = json.dumps(value)
+            elif key == "needs_review" and value is not None:
+                value = int(bool(value))
+            elif key == "times_used":
+                value = value or 0
+            values.append(value)
+
+        extra = {k: v for k, v in entry.items() if k not in ENTRY_KEYS}
+        values.append(json.dumps(extra) if extra else None)
+        return tuple(values)
+
+    @staticmethod
+    def _row_to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a row back to a learned-answer dict"""
+        entry = {}
+        for key in ENTRY_KEYS:
+            value = row[key]
+            if key in OPTIONAL_KEYS and not value:
+                continue
+            if key in JSON_COLUMNS:
+                value = json.loads(value) if value else []
+            elif key == "needs_review":
+                value = True
+            entry[key] = value
+
+        if row["extra"]:
+            entry.update(json.loads(row["extra"]))
+        return entry
+
+    def _apply_pending(self, batch: Dict[str, Dict[str, Any]]):
+        """Write a batch of buffered counters in one transaction"""
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE learned_answers SET "
+                "times_used = times_used + :times_used, "
+                "success_count = CASE WHEN :success_count > 0 "
+                "    THEN COALESCE(success_count, 0) + :success_count ELSE success_count END, "
+                "last_success = COALESCE(:last_success, last_success), "
+                "confidence = CASE WHEN :confidence IS NULL THEN confidence "
+                "    ELSE MAX(COALESCE(confidence, 0), :confidence) END, "
+                "needs_review = CASE WHEN :success_count > 0 THEN NULL ELSE needs_review END "
+                "WHERE question_hash = :question_hash",
+                [dict(pending, question_hash=q_hash) for q_hash, pending in batch.items()]
+            )
+
+    def flush(self):
+        """Write any buffered counters now"""
+        if self._buffer is not None:
+            self._buffer.flush()
+
+    def get(self, q_hash: str) -> Optional[Dict[str, Any]]:
+        """Look up one learned answer by question hash (including buffered counters)"""
+        row = self._conn.execute(
+            "SELECT * FROM learned_answers WHERE question_hash = ?", (q_hash,)
+        ).fetchone()
+        if not row:
+            return None
+        entry = self._row_to_entry(row)
+        return self._buffer.apply(q_hash, entry) if self._buffer is not None else entry
+
+    def __contains__(self, q_hash: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM learned_answers WHERE question_hash = ?", (q_hash,)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM learned_answers").fetchone()[0]
+
+    def put(self, q_hash: str, entry: Dict[str, Any]):
+        """Insert or replace one learned answer"""
+        self.flush()
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO learned_answers ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+            self._entry_to_row(q_hash, entry)
+        )
+
+    def record_use(self, q_hash: str):
+        """Increment times_used for a learned answer (buffered with write-behind)"""
+        if self._buffer is not None:
+            self._buffer.add_use(q_hash)
+            return
+
+        self._conn.execute(
+            "UPDATE learned_answers SET times_used = times_used + 1 "
+            "WHERE question_hash = ?", (q_hash,)
+        )
+
+    def reinforce(self, q_hash: str, confidence: float, timestamp: str) -> bool:
+        """
+        Record a successful outcome: confidence raised to `confidence` (never
+        lowered), success_count + 1, last_success timestamp and clear the
+        needs_review flag
+
+        Returns:
+            True if the entry exists and was updated
+        """
+        if self._buffer is not None and not self._in_batch:
+            if q_hash not in self:
+                return False
+            self._buffer.add_success(q_hash, confidence, timestamp)
+            return True
+
+        cursor = self._conn.execute(
+            "UPDATE learned_answers SET confidence = MAX(COALESCE(confidence, 0), ?), "
+            "success_count = COALESCE(success_count, 0) + 1, "
+            "last_success = ?, needs_review = NULL "
+            "WHERE question_hash = ?",
+            (confidence, timestamp, q_hash)
+        )
+        return cursor.rowcount > 0
+
+    def revise(self, q_hash: str, confidence: float, failure: Dict[str, Any]) -> bool:
+        """
+        Record a failed outcome: new confidence, needs_review flag and an
+        entry appended to failure_history
+
+        Returns:
+            True if the entry exists and was updated
+        """
+        # Pending successes must land before this failure, not after it
+        self.flush()
+
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT failure_history FROM learned_answers WHERE question_hash = ?",
+                (q_hash,)
+            ).fetchone()
+            if row is None:
+                return False
+
+            history = json.loads(row["failure_history"]) if row["failure_history"] else []
+            history.append(failure)
+            conn.execute(
+                "UPDATE learned_answers SET confidence = ?, needs_review = 1, "
+                "failure_history = ? WHERE question_hash = ?",
+                (confidence, json.dumps(history), q_hash)
+            )
+        return True
+
+    def all(self) -> Dict[str, Dict[str, Any]]:
+        """All learned answers in insertion order (same shape as the JSON file)"""
+        self.flush()
+        rows = self._conn.execute("SELECT * FROM learned_answers ORDER BY rowid")
+        return {row["question_hash"]: self._row_to_entry(row) for row in rows}
+
+    def export_json(self, path: Path = None) -> Path:
+        """
+        Write all learned answers as human-readable JSON
+
+        Args:
+            path: Output file (defaults to the legacy learned_answers.json)
+
+        Returns:
+            Path written
+        """
+        path = path or self.json_file or self.db_file.with_suffix(".json")
+        write_json_atomic(path, self.all())
+        return path
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Summary statistics about the store"""
+        self.flush()
+        row = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(times_used), 0), "
+            "COALESCE(SUM(needs_review), 0) FROM learned_answers"
+        ).fetchone()
+        by_source = dict(self._conn.execute(
+            "SELECT COALESCE(source, 'unknown'), COUNT(*) FROM learned_answers GROUP BY source"
+        ).fetchall())
+        return {
+            "entries": row[0],
+            "total_uses": row[1],
+            "needs_review": row[2],
+            "by_source": by_source,
+        }
+
+    def enforce_budget(self) -> List[str]:
+        """
+        Archive and remove the lowest-value entries if over budget
+
+        Returns:
+            Evicted question hashes
+        """
+        if self.max_entries is None and self.max_bytes is None:
+            return []
+
+        self.flush()
+        count, size = self._conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM({ROW_SIZE_SQL}), 0) FROM learned_answers"
+        ).fetchone()
+        if ((self.max_entries is None or count <= self.max_entries) and
+                (self.max_bytes is None or size <= self.max_bytes)):
+            return []
+
+        entries = self.all()
+        evicted = select_evictions(entries, self.max_entries, self.max_bytes)
+        if not evicted:
+            return []
+
+        # Archive first: a crash in between duplicates an entry, never loses one
+        archive_entries(self.archive_file, ((q_hash, entries[q_hash]) for q_hash in evicted))
+        with self._transaction() as conn:
+            conn.executemany(
+                "DELETE FROM learned_answers WHERE question_hash = ?",
+                [(q_hash,) for q_hash in evicted]
+            )
+        return evicted
+
+    def close(self):
+        if self._buffer is not None:
+            self._buffer.close()
+        self._conn.close()
+
+
+class JsonKnowledgeStore:
+    """
+    Learned answers kept in learned_answers.json
+
+    Same interface as KnowledgeStore. The whole file is held in memory and
+    rewritten atomically on structural changes (new answer, revision);
+    usage counters are buffered and folded into the next write. The file is
+    re-read when another writer has replaced it since our last load/save.
+    """
+
+    def __init__(self, json_file: Path, write_behind: bool = True,
+                 max_pending: int = 64, max_delay_seconds: float = 5.0,
+                 max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 archive_file: Path = None):
+        """
+        Load the knowledge base file
+
+        Args:
+            json_file: learned_answers.json
+            write_behind: Buffer usage counters instead of saving each one
+            max_pending: Buffered changes before a flush (write-behind only)
+            max_delay_seconds: Max age of a buffered change (write-behind only)
+            max_entries: Entry budget enforced by enforce_budget() (None = unlimited)
+            max_bytes: Byte budget for the file (None = unlimited)
+            archive_file: Where evicted entries go (default: learned_answers_archive.jsonl)
+        """
+        self.json_file = json_file
+        self.path = json_file
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.archive_file = archive_file or json_file.with_name("learned_answers_archive.jsonl")
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._mtime = None
+        self._in_batch = False
+        self._dirty = False
+        self._refresh()
+        self._buffer = (
+            WriteBehindBuffer(self._apply_pending, max_pending, max_delay_seconds)
+            if write_behind else None
+        )
+
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return self.json_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh(self):
+        """Reload the file if it changed on disk (buffered counters are kept)"""
+        if self._in_batch:
+            # Unsaved batch changes must not be replaced by the file
+            return
+        mtime = self._file_mtime()
+        if mtime != self._mtime:
+            self._entries = read_json(self.json_file, {})
+            self._mtime = self._file_mtime()
+
+    def _merge(self, batch: Dict[str, Dict[str, Any]]):
+        """Fold buffered counters into the in-memory entries"""
+        for q_hash, pending in batch.items():
+            if q_hash in self._entries:
+                self._entries[q_hash] = apply_pending(self._entries[q_hash], pending)
+
+    def _apply_pending(self, batch: Dict[str, Dict[str, Any]]):
+        self._merge(batch)
+        self._save()
+
+    def _save(self):
+        """Write the file, including anything still buffered"""
+        if self._in_batch:
+            self._dirty = True
+            return
+        if self._buffer is not None:
+            self._merge(self._buffer.drain())
+        write_json_atomic(self.json_file, self._entries)
+        self._mtime = self._file_mtime()
+
+    def flush(self):
+        """Write any buffered counters now"""
+        if self._buffer is not None:
+            self._buffer.flush()
+
+    def get(self, q_hash: str) -> Optional[Dict[str, Any]]:
+        """Look up one learned answer by question hash (including buffered counters)"""
+        self._refresh()
+        entry = self._entries.get(q_hash)
+        if entry is None:
+            return None
+        return self._buffer.apply(q_hash, entry) if self._buffer is not None else dict(entry)
+
+    def __contains__(self, q_hash: str) -> bool:
+        self._refresh()
+        return q_hash in self._entries
+
+    def __len__(self) -> int:
+        self._refresh()
+        return len(self._entries)
+
+    def put(self, q_hash: str, entry: Dict[str, Any]):
+        """Insert or replace one learned answer"""
+        self._refresh()
+        if self._buffer is not None:
+            self._merge(self._buffer.drain())
+        self._entries[q_hash] = dict(entry)
+        self._save()
+
+    def record_use(self, q_hash: str):
+        """Increment times_used for a learned answer (buffered with write-behind)"""
+        if q_hash not in self:
+            return
+        if self._buffer is not None:
+            self._buffer.add_use(q_hash)
+            return
+        self._entries[q_hash] = apply_pending(self._entries[q_hash], {
+            "times_used": 1, "success_count": 0, "last_success": None, "confidence": None
+        })
+        self._save()
+
+    @contextmanager
+    def batch(self) -> Iterator["JsonKnowledgeStore"]:
+        """Apply many updates in memory and save the file once (see KnowledgeStore.batch)"""
+        if self._in_batch:
+            yield self
+            return
+        self._refresh()
+        if self._buffer is not None:
+            self._merge(self._buffer.drain())
+        snapshot = dict(self._entries)
+        self._in_batch = True
+        self._dirty = False
+        try:
+            yield self
+        except BaseException:
+            self._entries = snapshot
+            raise
+        finally:
+            self._in_batch = False
+        if self._dirty:
+            self._save()
+
+    def reinforce(self, q_hash: str, confidence: float, timestamp: str) -> bool:
+        """Record a successful outcome (see KnowledgeStore.reinforce)"""
+        if q_hash not in self:
+            return False
+        if self._buffer is not None and not self._in_batch:
+            self._buffer.add_success(q_hash, confidence, timestamp)
+            return True
+        self._entries[q_hash] = apply_pending(self._entries[q_hash], {
+            "times_used": 0, "success_count": 1,
+            "last_success": timestamp, "confidence": confidence
+        })
+        self._save()
+        return True
+
+    def revise(self, q_hash: str, confidence: float, failure: Dict[str, Any]) -> bool:
+        """Record a failed outcome (see KnowledgeStore.revise)"""
+        if q_hash not in self:
+            return False
+        if self._buffer is not None:
+            self._merge(self._buffer.drain())
+
+        # Replace rather than mutate the entry (batch() snapshots are shallow)
+        entry = dict(self._entries[q_hash])
+        entry["confidence"] = confidence
+        entry["needs_review"] = True
+        entry["failure_history"] = entry.get("failure_history", []) + [failure]
+        self._entries[q_hash] = entry
+        self._save()
+        return True
+
+    def all(self) -> Dict[str, Dict[str, Any]]:
+        """All learned answers (same shape as the JSON file)"""
+        self._refresh()
+        self.flush()
+        return {q_hash: dict(entry) for q_hash, entry in self._entries.items()}
+
+    def export_json(self, path: Path = None) -> Path:
+        """Write all learned answers as JSON (defaults to the store's own file)"""
+        path = path or self.json_file
+        write_json_atomic(path, self.all())
+        return path
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Summary statistics about the store"""
+        entries = self.all().values()
+        by_source: Dict[str, int] = {}
+        for entry in entries:
+            source = entry.get("source") or "unknown"
+            by_source[source] = by_source.get(source, 0) + 1
+        return {
+            "entries": len(self._entries),
+            "total_uses": sum(e.get("times_used", 0) for e in entries),
+            "needs_review": sum(1 for e in entries if e.get("needs_review")),
+            "by_source": by_source,
+        }
+
+    def enforce_budget(self) -> List[str]:
+        """Archive and remove the lowest-value entries if over budget (see KnowledgeStore)"""
+        if self.max_entries is None and self.max_bytes is None:
+            return []
+
+        self._refresh()
+        size = self.json_file.stat().st_size if self.json_file.exists() else 0
+        if ((self.max_entries is None or len(self._entries) <= self.max_entries) and
+                (self.max_bytes is None or size <= self.max_bytes)):
+            return []
+
+        entries = self.all()
+        evicted = select_evictions(entries, self.max_entries, self.max_bytes)
+        if not evicted:
+            return []
+
+        archive_entries(self.archive_file, ((q_hash, entries[q_hash]) for q_hash in evicted))
+        for q_hash in evicted:
+            del self._entries[q_hash]
+        self._save()
+        return evicted
+
+    def close(self):
+        if self._buffer is not None:
+            self._buffer.close()
+
+
+def open_knowledge_store(agents_dir: Path, backend: str = "sqlite", **options):
+    """
+    Open the knowledge base for an agents directory
+
+    Args:
+        agents_dir: Directory holding learned_answers.{db,json}
+        backend: "sqlite" (default) or "json"
+        **options: write_behind / max_pending / max_delay_seconds /
+            max_entries / max_bytes / archive_file
+
+    Returns:
+        KnowledgeStore or JsonKnowledgeStore
+    """
+    json_file = agents_dir / "learned_answers.json"
+    if backend == "sqlite":
+        return KnowledgeStore(agents_dir / "learned_answers.db", json_file=json_file, **options)
+    if backend == "json":
+        return JsonKnowledgeStore(json_file, **options)
+    raise ValueError(f"Unknown knowledge base backend: {backend}")
+
+
+def main():
+    """Command line access for humans"""
+    parser = argparse.ArgumentParser(description="Learned answer knowledge store")
+    parser.add_argument("action", choices=["export", "stats"])
+    parser.add_argument("--agents-dir", type=Path, default=Path(__file__).parent,
+                        help="Directory holding learned_answers.db (default: this directory)")
+    parser.add_argument("--backend", choices=["sqlite", "json"], default="sqlite")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Export target (default: learned_answers.json)")
+    args = parser.parse_args()
+
+    store = open_knowledge_store(args.agents_dir, args.backend)
+    try:
+        if args.action == "export":
+            path = store.export_json(args.output)
+            print(f"📚 Exported {len(store)} learned answers to {path}")
+        else:
+            print(json.dumps(store.get_stats(), indent=2))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Log Writer - Background file writes for logs and reports
+
+Callers hand records to a bounded queue and return immediately; one
+dedicated thread drains it:
+
+- Appends to the same file within a batch become a single write
+- Whole-file rewrites (reports, per-outcome files) are coalesced, so only
+  the latest version of a file in a batch is written, atomically
+- fsync policy: "never" (default, page cache only), "batch" (once per
+  file per batch) or "always" (every record, no coalescing)
+- Append handles are kept open (a few, least recently used closed first)
+  instead of reopening the file per record
+- Everything queued is written before the process exits (atexit), and
+  flush() waits for the queue to drain when a caller needs to read back
+
+A full queue blocks the producer rather than dropping records.
+"""
+
+import os
+import sys
+import queue
+import atexit
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Union
+
+from json_io import temp_path
+
+FSYNC_POLICIES = ("never", "batch", "always")
+
+_APPEND = "append"
+_REPLACE = "replace"
+_CALL = "call"
+_FLUSH = "flush"
+_STOP = "stop"
+
+
+class LogWriter:
+    """Bounded queue of file writes drained by a background thread"""
+
+    def __init__(self, max_queue: int = 10000, batch_size: int = 256,
+                 fsync: str = "never", max_open_files: int = 16):
+        """
+        Start the writer thread
+
+        Args:
+            max_queue: Queued operations before producers block
+            batch_size: Operations handled per batch
+            fsync: "never", "batch" or "always"
+            max_open_files: Append handles kept open
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.max_open_files = max_open_files
+        self.stats = {"records": 0, "batches": 0, "bytes": 0, "errors": 0}
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._handles: "OrderedDict[Path, Any]" = OrderedDict()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _put(self, item: tuple):
+        if self._closed:
+            # Late writes (e.g. from other exit handlers) happen inline
+            self._write_batch([item])
+            return
+        self._queue.put(item)
+
+    def append(self, path: Path, data: Union[str, bytes]):
+        """Queue data to be appended to a file"""
+        self._put((_APPEND, path, data.encode() if isinstance(data, str) else data))
+
+    def write_file(self, path: Path, data: Union[str, bytes]):
+        """Queue a whole-file write (temp file + rename; latest wins within a batch)"""
+        self._put((_REPLACE, path, data.encode() if isinstance(data, str) else data))
+
+    def submit(self, fn: Callable, *args):
+        """Queue a call to run on the writer thread, in order with the writes"""
+        self._put((_CALL, fn, args))
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until everything queued so far has been written
+
+        Returns:
+            False if the timeout expired first
+        """
+        if self._closed or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._put((_FLUSH, done, None))
+        return done.wait(timeout)
+
+    def close(self):
+        """Write everything still queued and stop the thread"""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._queue.put((_STOP, None, None))
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = self._write_batch(batch)
+            self.stats["batches"] += 1
+            if stop:
+                self._close_handles()
+                return
+
+    def _write_batch(self, batch: list) -> bool:
+        """Write one batch; returns True if a stop request was seen"""
+        appends: "OrderedDict[Path, list]" = OrderedDict()
+        replaces: "OrderedDict[Path, bytes]" = OrderedDict()
+        stop = False
+
+        def write_pending():
+            for path, chunks in appends.items():
+                self._guard(self._append, path, b"".join(chunks))
+            for path, data in replaces.items():
+                self._guard(self._replace, path, data)
+            appends.clear()
+            replaces.clear()
+
+        for kind, target, payload in batch:
+            if self.fsync == "always":
+                write_pending()
+
+            if kind == _APPEND:
+                appends.setdefault(target, []).append(payload)
+                self.stats["records"] += 1
+            elif kind == _REPLACE:
+                replaces.pop(target, None)
+                replaces[target] = payload
+                self.stats["records"] += 1
+            else:
+                # Calls, flushes and stops must see all earlier writes
+                write_pending()
+                if kind == _CALL:
+                    self._guard(target, *payload)
+                elif kind == _FLUSH:
+                    target.set()
+                else:
+                    stop = True
+
+        write_pending()
+        return stop
+
+    def _guard(self, fn: Callable, *args):
+        """Run a write; errors are reported, never raised into the thread"""
+        try:
+            fn(*args)
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"⚠️  Log writer error ({getattr(fn, '__name__', fn)}): {e}", file=sys.stderr)
+
+    def _handle(self, path: Path):
+        handle = self._handles.get(path)
+        if handle is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(path, 'ab')
+            self._handles[path] = handle
+            while len(self._handles) > self.max_open_files:
+                self._handles.popitem(last=False)[1].close()
+        else:
+            self._handles.move_to_end(path)
+        return handle
+
+    def _append(self, path: Path, data: bytes):
+        handle = self._handle(path)
+        handle.write(data)
+        handle.flush()
+        if self.fsync != "never":
+            os.fsync(handle.fileno())
+        self.stats["bytes"] += len(data)
+
+    def _replace(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique name: a synchronous write_json_atomic() of the same file
+        # in this process must not share (and clobber) our temp file
+        tmp_file = temp_path(path)
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                if self.fsync != "never":
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, path)
+        finally:
+            if tmp_file.exists():
+                tmp_file.unlink()
+        self.stats["bytes"] += len(data)
+
+    def _close_handles(self):
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters plus the current queue depth"""
+        return dict(self.stats, queued=self._queue.qsize(), fsync=self.fsync)
+
+
+_shared_writer: Optional[LogWriter] = None
+_shared_lock = threading.Lock()
+
+
+def get_log_writer() -> LogWriter:
+    """The process-wide writer shared by the orchestrator, processor and hooks"""
+    global _shared_writer
+    with _shared_lock:
+        if _shared_writer is None or _shared_writer._closed:
+            _shared_writer = LogWriter(fsync=os.environ.get("AUTO_AGENTS_LOG_FSYNC", "never"))
+        return _shared_writer
@@ -0,0 +1,152 @@
+"""
+Negative Cache - Short-lived memory of questions the agents could not answer
+
+The fallback branch of the agent decision returns INSUFFICIENT_INFORMATION
+with low confidence. Persisting those as learned answers fills the
+knowledge base (and similarity index) with non-answers that are then served
+as cache hits forever.
+
+Instead they are kept here for a short TTL:
+- Repeating the same prompt within the TTL skips the agent work
+- Entries expire, so a later attempt can still produce a real answer
+- A real answer learned for the question evicts its negative entry, and the
+  knowledge base is always checked first, so negatives never shadow answers
+- Size is capped; the least recently used entries go first
+- Entries and their expiry times live in negative_cache.db next to the
+  knowledge base, so they survive across hook processes (the default hook
+  starts one per prompt; the prompt daemon is opt-in)
+"""
+
+import json
+import time
+import sqlite3
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS negative_answers (
+    question_hash TEXT PRIMARY KEY,
+    choice        TEXT NOT NULL,        -- JSON object
+    expires_at    REAL NOT NULL,        -- Unix time
+    last_used     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_negative_expires ON negative_answers (expires_at);
+"""
+
+# Choice the agents fall back to when nothing matched
+NON_ANSWER = "INSUFFICIENT_INFORMATION"
+
+
+def is_non_answer(chosen_option: str, confidence: float, source: str,
+                  confidence_threshold: float) -> bool:
+    """True for low-confidence agent fallbacks that should not be learned"""
+    return (
+        chosen_option == NON_ANSWER and
+        confidence < confidence_threshold and
+        source == "agents"
+    )
+
+
+class NegativeCache:
+    """
+    TTL + LRU cache of non-answers, keyed by question hash
+
+    Backed by SQLite so every process sharing the agents directory sees the
+    same entries; with no db_file it lives in memory for this process only.
+    """
+
+    def __init__(self, db_file: Optional[Path] = None, ttl_seconds: float = 900.0,
+                 max_entries: int = 256):
+        """
+        Open (and create if needed) the cache
+
+        Args:
+            db_file: SQLite file (None = in memory, this process only)
+            ttl_seconds: How long a non-answer is remembered (default 15 minutes)
+            max_entries: Entries kept before the least recently used is dropped
+        """
+        self.db_file = db_file
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        if db_file is not None:
+            db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_file) if db_file is not None else ":memory:",
+                                     timeout=10.0, isolation_level=None)
+        if db_file is not None:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def get(self, q_hash: str) -> Optional[Dict[str, Any]]:
+        """Cached non-answer for a question, or None if absent/expired"""
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT choice, expires_at FROM negative_answers WHERE question_hash = ?", (q_hash,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        choice, expires_at = row
+        if expires_at <= now:
+            self.invalidate(q_hash)
+            self.misses += 1
+            return None
+
+        self._conn.execute(
+            "UPDATE negative_answers SET last_used = ? WHERE question_hash = ?", (now, q_hash)
+        )
+        self.hits += 1
+        return json.loads(choice)
+
+    def put(self, q_hash: str, choice: Dict[str, Any]):
+        """Remember a non-answer (choice as a dict) for ttl_seconds"""
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO negative_answers (question_hash, choice, expires_at, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (q_hash, json.dumps(choice), now + self.ttl_seconds, now)
+            )
+            self._conn.execute("DELETE FROM negative_answers WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM negative_answers WHERE question_hash NOT IN ("
+                "  SELECT question_hash FROM negative_answers ORDER BY last_used DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def invalidate(self, q_hash: str):
+        """Forget a question (e.g. once a real answer has been learned)"""
+        self._conn.execute("DELETE FROM negative_answers WHERE question_hash = ?", (q_hash,))
+
+    def purge_expired(self) -> int:
+        """Drop expired entries; returns how many were removed"""
+        return self._conn.execute(
+            "DELETE FROM negative_answers WHERE expires_at <= ?", (time.time(),)
+        ).rowcount
+
+    @property
+    def size(self) -> int:
+        """Entries currently stored (expired ones included until purged)"""
+        return self._conn.execute("SELECT COUNT(*) FROM negative_answers").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters"""
+        self.purge_expired()
+        return {
+            "entries": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,111 @@
+"""
+Outcome Detectors - Pluggable checks for implicit success/failure
+
+Auto-validation asks every registered detector whether a logged choice
+shows signs of success or failure. Real detectors do I/O (git history,
+error logs, file checks), so they run concurrently:
+
+- A detector is an async callable, or a plain callable that is run in a
+  worker thread; either takes the Q&A log record and returns a list of
+  indicator strings
+- All detectors for a record run together (asyncio.gather), and records
+  are checked several at a time, bounded by a semaphore
+- Each detector has its own timeout; a timeout or error counts as "no
+  indicators" and is recorded, never raised
+- Per-detector timing stats (calls, mean/max seconds, timeouts, errors)
+
+Registration and timing are shared with the agent registry (registry.py).
+
+Usage:
+    registry = DetectorRegistry()
+    registry.register("rollback_commits", "failure", check_git_log, timeout=2.0)
+    success, failure = await registry.run(log)
+"""
+
+import sys
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Any, Callable, Iterable, Tuple
+
+from registry import Registered, TimedRegistry
+
+DETECTOR_KINDS = ("success", "failure")
+
+
+@dataclass
+class Detector(Registered):
+    """A registered detector"""
+    kind: str = "success"           # "success" or "failure"
+
+
+class DetectorRegistry(TimedRegistry):
+    """Named success/failure detectors plus their timing stats"""
+
+    def __init__(self, default_timeout: float = 5.0):
+        """
+        Create an empty registry
+
+        Args:
+            default_timeout: Seconds a detector may take unless registered otherwise
+        """
+        super().__init__(default_timeout)
+
+    def register(self, name: str, kind: str, fn: Callable, timeout: float = None):
+        """
+        Add (or replace) a detector
+
+        Args:
+            name: Unique detector name
+            kind: "success" or "failure"
+            fn: async def fn(log) -> List[str], or a blocking def fn(log) -> List[str]
+            timeout: Seconds before the detector is abandoned
+        """
+        if kind not in DETECTOR_KINDS:
+            raise ValueError(f"kind must be one of {DETECTOR_KINDS}, got {kind!r}")
+        self._add(Detector, name, fn, timeout, kind=kind)
+
+    async def _call(self, detector: Detector, log: Dict[str, Any]) -> List[str]:
+        """Run one detector; a timeout or error counts as no indicators"""
+        try:
+            return list(await self._timed_call(detector, log) or [])
+        except asyncio.TimeoutError:
+            self._stats[detector.name]["timeouts"] += 1
+            return []
+        except Exception as e:
+            self._stats[detector.name]["errors"] += 1
+            print(f"⚠️  Detector {detector.name} failed: {e}", file=sys.stderr)
+            return []
+
+    async def run(self, log: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """
+        Run every detector on one record concurrently
+
+        Returns:
+            (success_indicators, failure_indicators)
+        """
+        detectors = list(self._entries.values())
+        results = await asyncio.gather(*(self._call(d, log) for d in detectors))
+
+        success, failure = [], []
+        for detector, indicators in zip(detectors, results):
+            (success if detector.kind == "success" else failure).extend(indicators)
+        return success, failure
+
+    async def run_many(self, logs: Iterable[Dict[str, Any]],
+                       concurrency: int = 8) -> List[Tuple[List[str], List[str]]]:
+        """
+        Run the detectors on several records, at most `concurrency` at a time
+
+        Returns:
+            One (success_indicators, failure_indicators) per record, in order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(log):
+            async with semaphore:
+                return await self.run(log)
+
+        return await asyncio.gather(*(bounded(log) for log in logs))
+
+    def _describe(self, name: str) -> Dict[str, Any]:
+        return {"kind": self._entries[name].kind}
@@ -9,16 +9,31 @@ Handles what happens AFTER a question is answered:
 5. Feedback loop - Learn and adapt
 
 This creates a continuous improvement system.
+
+Outcomes can be marked in bulk from a JSONL file, one object per line with
+a choice_id plus status/success_indicators/failure_indicators/user_feedback:
+
+    python3 post_question_processor.py ingest outcomes.jsonl --agents-dir Agents
 """
 
+import sys
 import json
 import asyncio
+import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Iterable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from json_io import write_json_atomic, read_json
+from knowledge_store import open_knowledge_store, question_hash
+from qa_log import QALog
+from log_writer import get_log_writer
+from choice_ids import ChoiceIdIndex, choice_id_time, sort_key
+from outcome_detectors import DetectorRegistry
+from tracing import get_tracer
+
 
 class OutcomeStatus(Enum):
     """Possible outcomes for a decision"""
@@ -71,12 +86,18 @@ class PostQuestionProcessor:
     - Learns from successes and failures
     """
 
-    def __init__(self, agents_dir: Path = None):
+    def __init__(self, agents_dir: Path = None, kb_backend: str = "sqlite",
+                 knowledge_base=None, qa_log: QALog = None):
         """
         Initialize post-question processor
 
         Args:
             agents_dir: Directory for Agents/ subfolder
+            kb_backend: Knowledge base storage, "sqlite" (default) or "json"
+                (only used when no knowledge_base is passed in)
+            knowledge_base: Store to update (the orchestrator passes its own,
+                so both see every change without reloading)
+            qa_log: Q&A log to read choices from (default: agents_dir/qa_logs)
         """
         self.agents_dir = agents_dir or Path("Agents")
 
@@ -85,11 +106,31 @@ class PostQuestionProcessor:
         self.outcomes_dir.mkdir(parents=True, exist_ok=True)
 
         self.learned_file = self.agents_dir / "learned_answers.json"
-        self.qa_log_dir = self.agents_dir / "qa_logs"
+        self._owns_knowledge_base = knowledge_base is None
+        self.knowledge_base = (
+            knowledge_base if knowledge_base is not None
+            else open_knowledge_store(self.agents_dir, kb_backend)
+        )
+        self.qa_log = qa_log if qa_log is not None else QALog(self.agents_dir / "qa_logs")
+        self.qa_log_dir = self.qa_log.log_dir
+        self.log_writer = get_log_writer()
+        self.tracer = get_tracer()
 
         # Load existing outcomes
         self.outcomes_file = self.outcomes_dir / "all_outcomes.json"
         self.outcomes = self._load_outcomes()
+        self._outcome_index = ChoiceIdIndex(self.outcomes)
+
+        # Auto-validation progress (watermark + inconclusive choices)
+        self.validation_state_file = self.outcomes_dir / "validation_state.json"
+        self.validation_journal_file = self.outcomes_dir / "validation_journal.jsonl"
+        self.validation_grace = timedelta(minutes=5)
+
+        # Implicit success/failure checks; register more with
+        # self.detectors.register(name, "success" | "failure", fn, timeout)
+        self.detectors = DetectorRegistry()
+        self.detectors.register("implicit_success", "success", self._detect_implicit_success)
+        self.detectors.register("implicit_failure", "failure", self._detect_implicit_failure)
 
         # Statistics
         self.stats = {
@@ -102,19 +143,12 @@ class PostQuestionProcessor:
         }
 
     def _load_outcomes(self) -> Dict:
-        """Load previous outcomes"""
-        if self.outcomes_file.exists():
-            try:
-                with open(self.outcomes_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        """Load previous outcomes (a corrupt file is set aside, not discarded)"""
+        return read_json(self.outcomes_file, {})
 
     def _save_outcomes(self):
-        """Save outcomes to disk"""
-        with open(self.outcomes_file, 'w') as f:
-            json.dump(self.outcomes, f, indent=2)
+        """Save outcomes to disk (atomic)"""
+        write_json_atomic(self.outcomes_file, self.outcomes)
 
     async def process_outcome(self, choice_id: str,
                              outcome_data: Dict[str, Any]) -> QuestionOutcome:
@@ -137,10 +171,113 @@ class PostQuestionProcessor:
         """
 
         # Load the original choice
-        choice_log = self._load_choice_log(choice_id)
+        with self.tracer.span("processor.load_choice"):
+            choice_log = self._load_choice_log(choice_id)
         if not choice_log:
             raise ValueError(f"Choice {choice_id} not found in logs")
 
+        outcome = self._build_outcome(choice_id, choice_log, outcome_data)
+
+        # Save outcome
+        self._record_outcome(outcome)
+        with self.tracer.span("processor.save_outcomes"):
+            self._save_outcomes()
+
+        # Update knowledge base if needed
+        with self.tracer.span("processor.kb_update"):
+            if outcome.should_revise:
+                await self._revise_knowledge_base(outcome)
+            elif outcome.status == OutcomeStatus.SUCCESS:
+                await self._reinforce_knowledge_base(outcome)
+
+        # Log the outcome
+        await self._log_outcome(outcome)
+
+        return outcome
+
+    async def process_outcomes_bulk(self, items: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Process many outcomes at once (e.g. after a sprint review)
+
+        Same analysis as process_outcome, but everything is applied in
+        memory first and then persisted once: one knowledge base
+        transaction, one all_outcomes.json write, and the per-outcome files
+        queued on the background writer. Unknown choices and invalid
+        statuses are skipped and reported instead of aborting the batch.
+
+        Args:
+            items: Outcome dicts, each with a "choice_id" plus the
+                outcome_data fields of process_outcome
+
+        Returns:
+            {"outcomes": [QuestionOutcome], "skipped": [{"choice_id", "reason"}],
+             "revised": n, "reinforced": n}
+        """
+        result = await self._apply_outcomes(items)
+        print(f"📥 Processed {len(result['outcomes'])} outcomes ({result['revised']} revised, "
+              f"{result['reinforced']} reinforced, {len(result['skipped'])} skipped)")
+        return result
+
+    async def _apply_outcomes(self, items: Iterable[Dict[str, Any]],
+                              choice_logs: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build and persist a batch of outcomes with a single commit
+
+        Args:
+            items: Outcome dicts with a "choice_id" (see process_outcomes_bulk)
+            choice_logs: Logged choices the caller already has, by choice_id
+                (others are read from the Q&A log)
+
+        Returns:
+            Same as process_outcomes_bulk
+        """
+        choice_logs = choice_logs or {}
+        outcomes: List[QuestionOutcome] = []
+        skipped: List[Dict[str, Any]] = []
+
+        # Choices being marked were logged earlier; one flush covers them all
+        self.log_writer.flush()
+        for item in items:
+            choice_id = item.get("choice_id")
+            choice_log = choice_logs.get(choice_id)
+            if choice_log is None and choice_id:
+                choice_log = self.qa_log.get(choice_id)
+            if not choice_log:
+                skipped.append({"choice_id": choice_id, "reason": "not found in logs"})
+                continue
+            try:
+                outcome = self._build_outcome(choice_id, choice_log, item)
+            except (ValueError, KeyError, TypeError) as e:
+                skipped.append({"choice_id": choice_id, "reason": str(e)})
+                continue
+            self._record_outcome(outcome)
+            outcomes.append(outcome)
+
+        revised = reinforced = 0
+        if outcomes:
+            with self.tracer.span("processor.bulk_kb_commit"), self.knowledge_base.batch():
+                for outcome in outcomes:
+                    if outcome.should_revise:
+                        revised += await self._revise_knowledge_base(outcome, verbose=False)
+                    elif outcome.status == OutcomeStatus.SUCCESS:
+                        reinforced += await self._reinforce_knowledge_base(outcome, verbose=False)
+            with self.tracer.span("processor.save_outcomes"):
+                self._save_outcomes()
+
+            for outcome in outcomes:
+                await self._log_outcome(outcome)
+
+        return {
+            "outcomes": outcomes,
+            "skipped": skipped,
+            "revised": revised,
+            "reinforced": reinforced
+        }
+
+    def _build_outcome(self, choice_id: str, choice_log: Dict[str, Any],
+                       outcome_data: Dict[str, Any]) -> QuestionOutcome:
+        """Analyse one outcome against its logged choice (no side effects)"""
+
         # Extract details
         choice = choice_log["choice"]
         question = choice["question"]
@@ -193,25 +330,15 @@ class PostQuestionProcessor:
             knowledge_update=knowledge_update,
             should_revise=should_revise
         )
+        return outcome
 
-        # Save outcome
-        self.outcomes[choice_id] = outcome.to_dict()
-        self._save_outcomes()
-
-        # Update statistics
+    def _record_outcome(self, outcome: QuestionOutcome):
+        """Add an outcome to the in-memory outcomes and statistics"""
+        if outcome.choice_id not in self.outcomes:
+            self._outcome_index.add(outcome.choice_id)
+        self.outcomes[outcome.choice_id] = outcome.to_dict()
         self._update_stats(outcome)
 
-        # Update knowledge base if needed
-        if should_revise:
-            await self._revise_knowledge_base(outcome)
-        elif status == OutcomeStatus.SUCCESS:
-            await self._reinforce_knowledge_base(outcome)
-
-        # Log the outcome
-        await self._log_outcome(outcome)
-
-        return outcome
-
     def _calculate_adjusted_confidence(self, original: float,
                                       status: OutcomeStatus,
                                       source: str,
@@ -276,7 +403,8 @@ class PostQuestionProcessor:
         else:
             return f"Outcome pending validation for: {question}"
 
-    async def _revise_knowledge_base(self, outcome: QuestionOutcome):
+    async def _revise_knowledge_base(self, outcome: QuestionOutcome,
+                                     verbose: bool = True) -> bool:
         """
         Revise knowledge base when answer failed
 
@@ -285,95 +413,76 @@ class PostQuestionProcessor:
         2. Mark as "needs review"
         3. Add failure context
         4. Suggest alternatives
-        """
-        print(f"\n⚠️  REVISING KNOWLEDGE BASE")
-        print(f"   Question: {outcome.question}")
-        print(f"   Failed answer: {outcome.answer_provided}")
-        print(f"   New confidence: {outcome.adjusted_confidence:.0%} (was {outcome.original_confidence:.0%})")
-
-        # Load learned answers
-        if not self.learned_file.exists():
-            return
 
-        with open(self.learned_file, 'r') as f:
-            learned = json.load(f)
-
-        # Find this question
-        import hashlib
-        q_hash = hashlib.md5(outcome.question.lower().strip().encode()).hexdigest()
-
-        if q_hash in learned:
-            # Update confidence and add failure note
-            learned[q_hash]["confidence"] = outcome.adjusted_confidence
-            learned[q_hash]["needs_review"] = True
-            learned[q_hash]["failure_history"] = learned[q_hash].get("failure_history", [])
-            learned[q_hash]["failure_history"].append({
+        Returns:
+            True if a learned answer was revised
+        """
+        if verbose:
+            print(f"\n⚠️  REVISING KNOWLEDGE BASE")
+            print(f"   Question: {outcome.question}")
+            print(f"   Failed answer: {outcome.answer_provided}")
+            print(f"   New confidence: {outcome.adjusted_confidence:.0%} (was {outcome.original_confidence:.0%})")
+
+        # Update confidence and add failure note (single-row update)
+        revised = self.knowledge_base.revise(
+            question_hash(outcome.question),
+            outcome.adjusted_confidence,
+            {
                 "timestamp": outcome.validation_timestamp,
                 "indicators": outcome.failure_indicators,
                 "feedback": outcome.user_feedback
-            })
-
-            # Save updated knowledge
-            with open(self.learned_file, 'w') as f:
-                json.dump(learned, f, indent=2)
+            }
+        )
 
-            print(f"   ✅ Knowledge base updated with failure context")
+        if revised:
+            if verbose:
+                print(f"   ✅ Knowledge base updated with failure context")
             self.stats["knowledge_revisions"] += 1
+        return revised
 
-    async def _reinforce_knowledge_base(self, outcome: QuestionOutcome):
+    async def _reinforce_knowledge_base(self, outcome: QuestionOutcome,
+                                        verbose: bool = True) -> bool:
         """
         Reinforce knowledge base when answer succeeded
 
         Increase confidence and track success
-        """
-        if not self.learned_file.exists():
-            return
 
-        with open(self.learned_file, 'r') as f:
-            learned = json.load(f)
-
-        import hashlib
-        q_hash = hashlib.md5(outcome.question.lower().strip().encode()).hexdigest()
-
-        if q_hash in learned:
-            # Increase confidence
-            learned[q_hash]["confidence"] = outcome.adjusted_confidence
-
-            # Track success
-            learned[q_hash]["success_count"] = learned[q_hash].get("success_count", 0) + 1
-            learned[q_hash]["last_success"] = outcome.validation_timestamp
-
-            # Remove "needs review" flag if present
-            if "needs_review" in learned[q_hash]:
-                del learned[q_hash]["needs_review"]
-
-            # Save
-            with open(self.learned_file, 'w') as f:
-                json.dump(learned, f, indent=2)
+        Returns:
+            True if a learned answer was reinforced
+        """
+        # Increase confidence, track success and clear "needs review"
+        reinforced = self.knowledge_base.reinforce(
+            question_hash(outcome.question),
+            outcome.adjusted_confidence,
+            outcome.validation_timestamp
+        )
 
-            print(f"\n✅ REINFORCED KNOWLEDGE")
-            print(f"   Question: {outcome.question}")
-            print(f"   Answer confirmed: {outcome.answer_provided}")
-            print(f"   Confidence: {outcome.original_confidence:.0%} → {outcome.adjusted_confidence:.0%}")
+        if reinforced:
+            if verbose:
+                print(f"\n✅ REINFORCED KNOWLEDGE")
+                print(f"   Question: {outcome.question}")
+                print(f"   Answer confirmed: {outcome.answer_provided}")
+                print(f"   Confidence: {outcome.original_confidence:.0%} → {outcome.adjusted_confidence:.0%}")
 
             self.stats["confidence_improvements"] += 1
+        return reinforced
 
     async def _log_outcome(self, outcome: QuestionOutcome):
-        """Log outcome to file"""
+        """Log outcome to file (written in the background)"""
         outcome_file = self.outcomes_dir / f"{outcome.choice_id}_outcome.json"
+        self.log_writer.write_file(outcome_file, json.dumps(outcome.to_dict(), indent=2))
 
-        with open(outcome_file, 'w') as f:
-            json.dump(outcome.to_dict(), f, indent=2)
+    def outcomes_between(self, start: datetime = None,
+                         end: datetime = None) -> List[Dict[str, Any]]:
+        """Outcomes of choices made in [start, end), oldest first (binary search)"""
+        return [self.outcomes[choice_id]
+                for choice_id in self._outcome_index.between(start, end)]
 
     def _load_choice_log(self, choice_id: str) -> Optional[Dict]:
-        """Load the original choice log"""
-        log_file = self.qa_log_dir / f"{choice_id}.json"
-
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                return json.load(f)
-
-        return None
+        """Load the original choice log (one index lookup + one seek)"""
+        # The choice may still be queued for writing
+        self.log_writer.flush()
+        return self.qa_log.get(choice_id)
 
     def _update_stats(self, outcome: QuestionOutcome):
         """Update statistics"""
@@ -386,7 +495,76 @@ class PostQuestionProcessor:
         elif outcome.status == OutcomeStatus.FAILED:
             self.stats["failed_count"] += 1
 
-    async def auto_validate_outcomes(self, max_age_hours: int = 24):
+    def _load_validation_state(self) -> Dict[str, Any]:
+        """
+        Load the auto-validation watermark and pending set
+
+        The checkpoint journal left by an interrupted run is replayed on
+        top of the last saved state, so validation resumes where it stopped.
+        """
+        state = read_json(self.validation_state_file, {"watermark": None, "pending": []})
+        pending = set(state.get("pending", []))
+        watermark = state.get("watermark")
+
+        if self.validation_journal_file.exists():
+            with open(self.validation_journal_file, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn last line from the interruption
+                    choice_id = entry["choice_id"]
+                    if entry.get("pending"):
+                        pending.add(choice_id)
+                    else:
+                        pending.discard(choice_id)
+                    if watermark is None or sort_key(choice_id) > sort_key(watermark):
+                        watermark = choice_id
+
+        return {"watermark": watermark, "pending": sorted(pending, key=sort_key),
+                "legacy_migrated": state.get("legacy_migrated", False)}
+
+    def _checkpoint_validation(self, choice_id: str, pending: bool):
+        """Record that one choice has been examined (one appended line)"""
+        with open(self.validation_journal_file, 'a') as f:
+            f.write(json.dumps({"choice_id": choice_id, "pending": pending}) + '\n')
+
+    def _save_validation_state(self, state: Dict[str, Any]):
+        """Fold the journal into the state file and start a new journal"""
+        write_json_atomic(self.validation_state_file, state)
+        if self.validation_journal_file.exists():
+            self.validation_journal_file.unlink()
+
+    def iter_validation_candidates(self, max_age_hours: int = 24,
+                                   state: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the Q&A records auto-validation still has to look at
+
+        Choices that were inconclusive last time come first, then choices
+        made after the watermark (minus a short grace period for records
+        other processes logged late). Older history is never read.
+        """
+        state = state or self._load_validation_state()
+        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+
+        start = cutoff_time
+        watermark_time = choice_id_time(state["watermark"]) if state["watermark"] else None
+        if watermark_time:
+            start = max(cutoff_time, watermark_time - self.validation_grace)
+
+        self.log_writer.flush()
+        seen = set()
+        for choice_id in state["pending"]:
+            log = self.qa_log.get(choice_id)
+            if log is not None:
+                seen.add(choice_id)
+                yield log
+
+        for log in self.qa_log.iter_since(start):
+            if log["choice"]["choice_id"] not in seen:
+                yield log
+
+    async def auto_validate_outcomes(self, max_age_hours: int = 24, concurrency: int = 8):
         """
         Automatically validate recent outcomes
 
@@ -396,22 +574,20 @@ class PostQuestionProcessor:
         - No rollbacks
         - No user complaints
 
+        Only choices made since the last run (plus earlier inconclusive
+        ones) are examined; progress is checkpointed per choice. The first
+        run imports legacy per-choice files and all_questions.jsonl into
+        the Q&A log (QALog.migrate_legacy, files kept) and examines the
+        whole max_age_hours window, so unmigrated choices are not missed.
+
+        Detectors come from self.detectors (see outcome_detectors.py).
+
         Args:
             max_age_hours: Only validate outcomes from last N hours
+            concurrency: Records whose detectors run at the same time
         """
         print("\n🔍 AUTO-VALIDATING RECENT OUTCOMES...")
 
-        # Load all Q&A logs
-        if not self.qa_log_dir.exists():
-            return {
-                "total_validated": 0,
-                "success": 0,
-                "partial": 0,
-                "failed": 0,
-                "unknown": 0,
-                "knowledge_updates": 0
-            }
-
         cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
         stats = {
             "total_validated": 0,
@@ -419,56 +595,114 @@ class PostQuestionProcessor:
             "partial": 0,
             "failed": 0,
             "unknown": 0,
-            "knowledge_updates": 0
+            "knowledge_updates": 0,
+            "examined": 0
         }
 
-        for log_file in self.qa_log_dir.glob("choice_*.json"):
-            with open(log_file, 'r') as f:
-                log = json.load(f)
-
+        state = self._load_validation_state()
+        if not state["legacy_migrated"]:
+            imported = self.qa_log.migrate_legacy()
+            if imported:
+                print(f"   📝 Imported {imported} legacy Q&A records")
+            # Legacy choices may be older than the watermark
+            state = dict(state, watermark=None)
+        watermark = state["watermark"]
+        pending = set(state["pending"])
+
+        # Records are detected a batch at a time, with the detectors of up
+        # to `concurrency` records in flight; outcomes are then applied and
+        # checkpointed in log order
+        batch = []
+        for log in self.iter_validation_candidates(max_age_hours, state):
             choice_id = log["choice"]["choice_id"]
+            if watermark is None or sort_key(choice_id) > sort_key(watermark):
+                watermark = choice_id
 
-            # Skip if already validated
-            if choice_id in self.outcomes:
-                continue
-
-            # Skip if too old
+            # Only agent/human choices are validated, not learned-answer reuse;
+            # skip if already validated or too old
             timestamp = datetime.fromisoformat(log["timestamp"])
-            if timestamp < cutoff_time:
-                continue
+            skip = (not choice_id.startswith("choice_") or choice_id in self.outcomes or
+                    timestamp < cutoff_time)
+            batch.append((log, skip))
+
+            if len(batch) >= concurrency * 4:
+                await self._validate_batch(batch, concurrency, stats, pending)
+                batch = []
 
-            # Check for implicit success
-            success_indicators = await self._detect_implicit_success(log)
-            failure_indicators = await self._detect_implicit_failure(log)
+        if batch:
+            await self._validate_batch(batch, concurrency, stats, pending)
 
+        self._save_validation_state({
+            "watermark": watermark,
+            "pending": sorted(pending, key=sort_key),
+            "legacy_migrated": True
+        })
+
+        print(f"   ✅ Auto-validated {stats['total_validated']} outcomes "
+              f"({stats['examined']} examined, {len(pending)} pending)")
+        return stats
+
+    async def _validate_batch(self, batch: List, concurrency: int,
+                              stats: Dict[str, int], pending: set):
+        """
+        Run the detectors on a batch of (log, skip) pairs and apply outcomes
+
+        The conclusive outcomes are persisted together (one knowledge base
+        transaction, one all_outcomes.json write); checkpoints are written
+        after that, in log order.
+        """
+        to_check = [log for log, skip in batch if not skip]
+        with self.tracer.span("processor.detectors"):
+            results = await self.detectors.run_many(to_check, concurrency)
+
+        items = []
+        for log, (success_indicators, failure_indicators) in zip(to_check, results):
             if success_indicators and not failure_indicators:
                 # Implicit success!
-                outcome = await self.process_outcome(choice_id, {
-                    "status": "success",
-                    "validation_method": "auto",
-                    "success_indicators": success_indicators,
-                    "failure_indicators": []
-                })
-                stats["total_validated"] += 1
-                stats["success"] += 1
-                if outcome.should_revise or outcome.knowledge_update:
-                    stats["knowledge_updates"] += 1
-
+                status = "success"
             elif failure_indicators:
                 # Implicit failure
-                outcome = await self.process_outcome(choice_id, {
-                    "status": "failed",
-                    "validation_method": "auto",
-                    "success_indicators": [],
-                    "failure_indicators": failure_indicators
-                })
+                status = "failed"
+                success_indicators = []
+            else:
+                continue
+            items.append({
+                "choice_id": log["choice"]["choice_id"],
+                "status": status,
+                "validation_method": "auto",
+                "success_indicators": success_indicators,
+                "failure_indicators": failure_indicators
+            })
+
+        applied = {}
+        if items:
+            result = await self._apply_outcomes(
+                items, {log["choice"]["choice_id"]: log for log in to_check}
+            )
+            applied = {outcome.choice_id: outcome for outcome in result["outcomes"]}
+
+        for log, skip in batch:
+            choice_id = log["choice"]["choice_id"]
+            if skip:
+                pending.discard(choice_id)
+                self._checkpoint_validation(choice_id, pending=False)
+                continue
+
+            stats["examined"] += 1
+            outcome = applied.get(choice_id)
+            if outcome is not None:
                 stats["total_validated"] += 1
-                stats["failed"] += 1
+                stats["success" if outcome.status == OutcomeStatus.SUCCESS else "failed"] += 1
                 if outcome.should_revise or outcome.knowledge_update:
                     stats["knowledge_updates"] += 1
 
-        print(f"   ✅ Auto-validated {stats['total_validated']} outcomes")
-        return stats
+            # Inconclusive choices are looked at again next run
+            is_pending = choice_id not in self.outcomes
+            if is_pending:
+                pending.add(choice_id)
+            else:
+                pending.discard(choice_id)
+            self._checkpoint_validation(choice_id, pending=is_pending)
 
     async def _detect_implicit_success(self, log: Dict) -> List[str]:
         """
@@ -512,17 +746,49 @@ class PostQuestionProcessor:
         # Placeholder for now
         return indicators
 
+    def close(self):
+        """Close the knowledge base if this processor opened it"""
+        if self._owns_knowledge_base:
+            self.knowledge_base.close()
+
+    def outcome_stats(self) -> Dict[str, int]:
+        """
+        Outcome counts over every recorded outcome (all_outcomes.json plus
+        this session's), not just the ones processed in this session
+
+        Knowledge revisions count failed outcomes flagged for revision;
+        confidence improvements count successes that raised confidence.
+        """
+        stats = {key: 0 for key in ("total_validated", "success_count", "partial_count",
+                                    "failed_count", "confidence_improvements",
+                                    "knowledge_revisions")}
+        for outcome in self.outcomes.values():
+            stats["total_validated"] += 1
+            status = outcome.get("status")
+            if status == OutcomeStatus.SUCCESS.value:
+                stats["success_count"] += 1
+                if outcome.get("adjusted_confidence", 0) > outcome.get("original_confidence", 0):
+                    stats["confidence_improvements"] += 1
+            elif status == OutcomeStatus.PARTIAL.value:
+                stats["partial_count"] += 1
+            elif status == OutcomeStatus.FAILED.value:
+                stats["failed_count"] += 1
+            if outcome.get("should_revise"):
+                stats["knowledge_revisions"] += 1
+        return stats
+
     def generate_effectiveness_report(self) -> str:
         """
-        Generate report on decision effectiveness
+        Generate report on decision effectiveness over all recorded outcomes
 
         Returns markdown formatted report
         """
-        total = self.stats["total_validated"]
+        stats = self.outcome_stats()
+        total = stats["total_validated"]
         if total == 0:
             return "# No outcomes validated yet"
 
-        success_rate = 100 * self.stats["success_count"] / total
+        success_rate = 100 * stats["success_count"] / total
 
         report = [
             "# Decision Effectiveness Report",
@@ -532,16 +798,16 @@ class PostQuestionProcessor:
             "",
             "## Outcome Distribution",
             "",
-            f"- ✅ Success: {self.stats['success_count']} ({100*self.stats['success_count']/total:.0f}%)",
-            f"- ⚠️  Partial: {self.stats['partial_count']} ({100*self.stats['partial_count']/total:.0f}%)",
-            f"- ❌ Failed: {self.stats['failed_count']} ({100*self.stats['failed_count']/total:.0f}%)",
+            f"- ✅ Success: {stats['success_count']} ({100*stats['success_count']/total:.0f}%)",
+            f"- ⚠️  Partial: {stats['partial_count']} ({100*stats['partial_count']/total:.0f}%)",
+            f"- ❌ Failed: {stats['failed_count']} ({100*stats['failed_count']/total:.0f}%)",
             "",
             f"## Success Rate: {success_rate:.0f}%",
             "",
             "## Learning Impact",
             "",
-            f"- Confidence improvements: {self.stats['confidence_improvements']}",
-            f"- Knowledge revisions: {self.stats['knowledge_revisions']}",
+            f"- Confidence improvements: {stats['confidence_improvements']}",
+            f"- Knowledge revisions: {stats['knowledge_revisions']}",
             "",
             "## Quality Assessment",
             ""
@@ -605,5 +871,53 @@ async def example_usage():
     print(report)
 
 
+def read_outcomes_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream outcome dicts from a JSONL file ("-" for stdin), skipping bad lines"""
+    f = sys.stdin if str(path) == "-" else open(path, 'r')
+    try:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                print(f"⚠️  {path}:{line_number}: {e}", file=sys.stderr)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def main():
+    """Command line: bulk outcome ingestion and reports"""
+    parser = argparse.ArgumentParser(description="Post-question outcome processing")
+    parser.add_argument("action", nargs="?", default="example",
+                        choices=["ingest", "report", "example"])
+    parser.add_argument("outcomes_file", nargs="?", type=Path,
+                        help="ingest: JSONL file of outcomes ('-' for stdin)")
+    parser.add_argument("--agents-dir", type=Path, default=Path("Agents"),
+                        help="Agents directory (default: ./Agents)")
+    parser.add_argument("--kb-backend", choices=["sqlite", "json"], default="sqlite")
+    args = parser.parse_args()
+
+    if args.action == "example":
+        asyncio.run(example_usage())
+        return
+
+    if args.action == "ingest" and not args.outcomes_file:
+        parser.error("ingest needs an outcomes file")
+
+    processor = PostQuestionProcessor(args.agents_dir, kb_backend=args.kb_backend)
+    try:
+        if args.action == "report":
+            print(processor.generate_effectiveness_report())
+            return
+
+        result = asyncio.run(processor.process_outcomes_bulk(read_outcomes_jsonl(args.outcomes_file)))
+        for skip in result["skipped"]:
+            print(f"   ⏭️  {skip['choice_id']}: {skip['reason']}")
+    finally:
+        processor.close()
+
+
 if __name__ == "__main__":
-    asyncio.run(example_usage())
+    main()
@@ -0,0 +1,468 @@
+"""
+Q&A Log - Segmented, append-only log of every question answered
+
+Replaces one pretty-printed qa_logs/<choice_id>.json per question (plus the
+all_questions.jsonl copy) with:
+
+- Segments: qa_logs/segment-NNNNNN.jsonl, one JSON record per line, rolled
+  over once a segment reaches segment_max_bytes
+- Index: qa_logs/index.tsv, one "<choice_id>\\t<segment>\\t<offset>" line per
+  record, loaded lazily and refreshed incrementally
+
+Writing a record (or a batch of records) is one append to the current
+segment and one to the index;
+looking one up is a dict lookup plus one seek. Choice IDs sort by time, so
+"choices since T" is a binary search over the index (choice_ids_between). Appends use O_APPEND with a
+single write() per record, so concurrent processes (hook, daemon, CLI) can
+log at the same time.
+
+Logs written before this existed are still readable, and can be folded in:
+
+    python3 qa_log.py migrate [--remove-legacy]
+    python3 qa_log.py compact
+    python3 qa_log.py stats
+    python3 qa_log.py show <choice_id>
+"""
+
+import os
+import json
+import shutil
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+
+from choice_ids import ChoiceIdIndex
+
+SEGMENT_PREFIX = "segment-"
+INDEX_NAME = "index.tsv"
+COMPACT_DIR = ".compact"
+COMPACT_MARKER = "COMPLETE"
+LEGACY_MASTER_LOG = "all_questions.jsonl"
+LEGACY_PATTERNS = ("choice_*.json", "learned_*.json")
+
+
+def _fsync(path: Path):
+    """Flush a file (or directory entry) to disk"""
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _append(path: Path, data: bytes) -> int:
+    """Append bytes with one write(); returns the offset they were written at"""
+    fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+        return os.lseek(fd, 0, os.SEEK_CUR) - len(data)
+    finally:
+        os.close(fd)
+
+
+class QALog:
+    """
+    Segmented Q&A log with a choice_id index
+
+    Records are the dicts the orchestrator logs ({"timestamp", "question",
+    "choice": {..., "choice_id"}, "logged_at"}). If a choice_id is logged
+    twice, lookups return the latest record.
+    """
+
+    def __init__(self, log_dir: Path, segment_max_bytes: int = 4 * 1024 * 1024):
+        """
+        Open the log directory (created if needed)
+
+        Args:
+            log_dir: The qa_logs directory
+            segment_max_bytes: Size at which a new segment is started
+        """
+        self.log_dir = log_dir
+        self.segment_max_bytes = segment_max_bytes
+        self.index_file = log_dir / INDEX_NAME
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+
+        self._segment = None
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._by_time = ChoiceIdIndex()
+        self._index_offset = 0
+
+        # A compaction interrupted after its output was complete is finished now
+        self._finish_compaction()
+
+    def segment_path(self, segment: int) -> Path:
+        return self.log_dir / f"{SEGMENT_PREFIX}{segment:06d}.jsonl"
+
+    def segments(self) -> Iterator[int]:
+        """Segment numbers in order"""
+        numbers = []
+        for path in self.log_dir.glob(f"{SEGMENT_PREFIX}*.jsonl"):
+            try:
+                numbers.append(int(path.stem[len(SEGMENT_PREFIX):]))
+            except ValueError:
+                continue
+        return iter(sorted(numbers))
+
+    def _current_segment(self) -> int:
+        if self._segment is None:
+            self._segment = max(self.segments(), default=1)
+        path = self.segment_path(self._segment)
+        # Another process may have rolled over since we last looked
+        while self.segment_path(self._segment + 1).exists():
+            self._segment += 1
+            path = self.segment_path(self._segment)
+        if path.exists() and path.stat().st_size >= self.segment_max_bytes:
+            self._segment += 1
+        return self._segment
+
+    def _refresh_index(self):
+        """Read index lines appended since the last refresh (ours or others')"""
+        try:
+            with open(self.index_file, 'rb') as f:
+                f.seek(self._index_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        # Ignore a trailing partial line; it is picked up next time
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].decode().splitlines():
+            try:
+                choice_id, segment, offset = line.split('\t')
+                location = (int(segment), int(offset))
+            except ValueError:
+                continue
+            if choice_id not in self._index:
+                self._by_time.add(choice_id)
+            self._index[choice_id] = location
+        self._index_offset += end
+
+    def locate(self, choice_id: str) -> Optional[Tuple[int, int]]:
+        """(segment, offset) of a choice's latest record, or None"""
+        if choice_id not in self._index:
+            self._refresh_index()
+        return self._index.get(choice_id)
+
+    def __contains__(self, choice_id: str) -> bool:
+        return self.locate(choice_id) is not None
+
+    def __len__(self) -> int:
+        self._refresh_index()
+        return len(self._index)
+
+    def choice_ids_between(self, start: datetime = None, end: datetime = None) -> List[str]:
+        """Indexed choice IDs created in [start, end), oldest first"""
+        self._refresh_index()
+        return self._by_time.between(start, end)
+
+    def iter_since(self, start: datetime) -> Iterator[Dict[str, Any]]:
+        """Latest record of every indexed choice created at or after start"""
+        for choice_id in self.choice_ids_between(start):
+            record = self.read_at(*self._index[choice_id])
+            if record is not None:
+                yield record
+
+    def _encode(self, record: Dict[str, Any]) -> bytes:
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        return line.encode()
+
+    def append(self, record: Dict[str, Any]) -> Path:
+        """
+        Log one record
+
+        Returns:
+            Segment file the record was written to
+        """
+        choice_id = record["choice"]["choice_id"]
+        segment = self._current_segment()
+        path = self.segment_path(segment)
+
+        offset = _append(path, self._encode(record))
+        _append(self.index_file, f"{choice_id}\t{segment}\t{offset}\n".encode())
+        return path
+
+    def append_many(self, records: List[Dict[str, Any]]) -> Optional[Path]:
+        """
+        Log several records with one write to the segment and one to the index
+
+        The batch goes into a single segment, which may end up a little
+        larger than segment_max_bytes.
+
+        Returns:
+            Segment file the records were written to (None for no records)
+        """
+        if not records:
+            return None
+        segment = self._current_segment()
+        path = self.segment_path(segment)
+
+        lines = [self._encode(record) for record in records]
+        data = b"".join(lines)
+        offset = _append(path, data)
+
+        index_lines = []
+        for record, line in zip(records, lines):
+            index_lines.append(f"{record['choice']['choice_id']}\t{segment}\t{offset}\n")
+            offset += len(line)
+        _append(self.index_file, "".join(index_lines).encode())
+        return path
+
+    def read_at(self, segment: int, offset: int) -> Optional[Dict[str, Any]]:
+        """Read the record at a segment offset"""
+        try:
+            with open(self.segment_path(segment), 'rb') as f:
+                f.seek(offset)
+                return json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+
+    def get(self, choice_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Latest record for a choice
+
+        Falls back to a legacy qa_logs/<choice_id>.json that has not been
+        migrated yet.
+        """
+        location = self.locate(choice_id)
+        if location:
+            return self.read_at(*location)
+
+        legacy_file = self.log_dir / f"{choice_id}.json"
+        if legacy_file.exists():
+            with open(legacy_file, 'r') as f:
+                return json.load(f)
+
+        return None
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Every record in log order, followed by legacy per-choice files that
+        are not in the index
+        """
+        yield from self._iter_segments()
+        yield from self._iter_legacy_files()
+
+    def _iter_segments(self) -> Iterator[Dict[str, Any]]:
+        """Every segment record in log order"""
+        for segment in self.segments():
+            with open(self.segment_path(segment), 'rb') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+
+    def _iter_legacy_files(self) -> Iterator[Dict[str, Any]]:
+        """Legacy per-choice files whose choice is not in the index"""
+        self._refresh_index()
+        for pattern in LEGACY_PATTERNS:
+            for legacy_file in sorted(self.log_dir.glob(pattern)):
+                if legacy_file.stem in self._index:
+                    continue
+                with open(legacy_file, 'r') as f:
+                    yield json.load(f)
+
+    def iter_all_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        iter_records() plus all_questions.jsonl records that were never
+        migrated into segments (the whole history, each choice once)
+
+        Beyond the segment index, only the IDs of unmigrated per-choice
+        files are held in memory.
+        """
+        yield from self._iter_segments()
+
+        # Unmigrated per-choice files are also in all_questions.jsonl
+        legacy_ids = set()
+        for record in self._iter_legacy_files():
+            legacy_ids.add(record.get("choice", {}).get("choice_id"))
+            yield record
+
+        master_log = self.log_dir / LEGACY_MASTER_LOG
+        if not master_log.exists():
+            return
+        with open(master_log, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                choice_id = record.get("choice", {}).get("choice_id")
+                if choice_id is None or (choice_id not in self._index and choice_id not in legacy_ids):
+                    yield record
+
+    def migrate_legacy(self, remove: bool = False) -> int:
+        """
+        Import all_questions.jsonl and per-choice files into segments
+
+        Args:
+            remove: Delete the legacy files once imported
+
+        Returns:
+            Number of records imported
+        """
+        self._refresh_index()
+        imported = 0
+        legacy_files = []
+
+        master_log = self.log_dir / LEGACY_MASTER_LOG
+        if master_log.exists():
+            with open(master_log, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get("choice", {}).get("choice_id") not in self._index:
+                        self.append(record)
+                        imported += 1
+            self._refresh_index()
+            legacy_files.append(master_log)
+
+        for pattern in LEGACY_PATTERNS:
+            for legacy_file in sorted(self.log_dir.glob(pattern)):
+                if legacy_file.stem not in self._index:
+                    with open(legacy_file, 'r') as f:
+                        self.append(json.load(f))
+                    imported += 1
+                legacy_files.append(legacy_file)
+        self._refresh_index()
+
+        if remove:
+            for legacy_file in legacy_files:
+                legacy_file.unlink()
+
+        return imported
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Rewrite the log into full segments and rebuild the index
+
+        Merges undersized segments and drops torn or corrupt lines (e.g.
+        from a crash mid-write). Every valid record is kept, including
+        repeated choice_ids.
+
+        Crash safe: the new segments and index are built in qa_logs/.compact
+        and flushed to disk, then marked complete, and only then moved into
+        place (see _finish_compaction). A crash before the marker leaves the
+        log as it was; after it, the next QALog() finishes the switch.
+
+        Run while nothing else is logging: records appended during
+        compaction may be lost.
+        """
+        before = sum(1 for _ in self.segments())
+
+        work_dir = self.log_dir / COMPACT_DIR
+        if work_dir.exists():
+            shutil.rmtree(work_dir)
+        compacted = QALog(work_dir, self.segment_max_bytes)
+
+        kept = dropped = 0
+        for segment in self.segments():
+            with open(self.segment_path(segment), 'rb') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        record["choice"]["choice_id"]
+                    except (ValueError, KeyError, TypeError):
+                        dropped += 1
+                        continue
+                    compacted.append(record)
+                    kept += 1
+
+        new_segments = list(compacted.segments())
+        for path in work_dir.iterdir():
+            _fsync(path)
+        with open(work_dir / COMPACT_MARKER, 'w') as f:
+            json.dump({"segments": new_segments}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        _fsync(work_dir)
+
+        self._finish_compaction()
+        return {
+            "records_kept": kept,
+            "records_dropped": dropped,
+            "segments_before": before,
+            "segments_after": sum(1 for _ in self.segments()),
+        }
+
+    def _finish_compaction(self):
+        """
+        Move a completed compaction into place (idempotent, so it can resume)
+
+        New segments replace the old ones with the same numbers, then old
+        segments the compaction did not produce are removed, then the new
+        index replaces the old one. Every record stays on disk throughout:
+        until the marker is removed, the compacted copy holds all of them.
+        """
+        work_dir = self.log_dir / COMPACT_DIR
+        marker = work_dir / COMPACT_MARKER
+        if not marker.exists():
+            return
+        with open(marker, 'r') as f:
+            new_segments = set(json.load(f)["segments"])
+
+        for segment in sorted(new_segments):
+            path = work_dir / self.segment_path(segment).name
+            if path.exists():
+                os.replace(path, self.segment_path(segment))
+        for segment in list(self.segments()):
+            if segment not in new_segments:
+                self.segment_path(segment).unlink()
+        if (work_dir / INDEX_NAME).exists():
+            os.replace(work_dir / INDEX_NAME, self.index_file)
+        _fsync(self.log_dir)
+        shutil.rmtree(work_dir)
+
+        self._segment = None
+        self._index = {}
+        self._by_time = ChoiceIdIndex()
+        self._index_offset = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Record, segment and legacy file counts"""
+        segments = list(self.segments())
+        return {
+            "records": len(self),
+            "segments": len(segments),
+            "bytes": sum(self.segment_path(s).stat().st_size for s in segments),
+            "legacy_files": sum(
+                1 for pattern in LEGACY_PATTERNS for _ in self.log_dir.glob(pattern)
+            ),
+        }
+
+
+def main():
+    """Command line maintenance"""
+    parser = argparse.ArgumentParser(description="Segmented Q&A log")
+    parser.add_argument("action", choices=["migrate", "compact", "stats", "show"])
+    parser.add_argument("choice_id", nargs="?", help="Choice to show")
+    parser.add_argument("--log-dir", type=Path, default=Path(__file__).parent / "qa_logs",
+                        help="qa_logs directory (default: next to this file)")
+    parser.add_argument("--remove-legacy", action="store_true",
+                        help="migrate: delete per-choice files and all_questions.jsonl once imported")
+    args = parser.parse_args()
+
+    log = QALog(args.log_dir)
+
+    if args.action == "migrate":
+        imported = log.migrate_legacy(remove=args.remove_legacy)
+        print(f"📝 Imported {imported} records into {args.log_dir}")
+    elif args.action == "compact":
+        print(json.dumps(log.compact(), indent=2))
+    elif args.action == "stats":
+        print(json.dumps(log.get_stats(), indent=2))
+    else:
+        if not args.choice_id:
+            parser.error("show needs a choice_id")
+        record = log.get(args.choice_id)
+        if record is None:
+            print(f"❌ {args.choice_id} not found")
+        else:
+            print(json.dumps(record, indent=2))
+
+
+if __name__ == "__main__":
+    main()
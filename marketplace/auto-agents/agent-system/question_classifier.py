@@ -6,13 +6,34 @@ Classifies questions to determine appropriate handling:
 - AGENT_ANSWERABLE: Factual questions with objective answers
 - HYBRID: Questions needing research + human decision
 - CLARIFICATION_NEEDED: Ambiguous questions requiring more context
+
+Patterns are compiled once into a PatternMatcher: one combined alternation
+finds the earliest position any pattern matches (most prompts match none and
+stop there), then only categories whose own alternation matches from that
+position have their patterns checked individually. After editing the pattern
+dicts, call compile_patterns().
+
+Results are memoized in a bounded LRU keyed by the normalized question and
+a hash of the pattern set, so the short prompts that repeat all session
+("continue", "go", "yes") are classified once; recompiling edited patterns
+changes the hash, so stale results are never returned.
+
+classify_many() re-classifies large histories in bounded memory: questions
+are streamed in chunks, each chunk's distinct questions are matched once
+into a boolean question x pattern hit matrix (NumPy when installed, plain
+lists otherwise) and the per-category hit counts are read from it.
 """
 
 import re
+import json
+import hashlib
+from collections import OrderedDict
 from enum import Enum
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple, Pattern, Iterable, Iterator
 from dataclasses import dataclass
 
+_numpy_module = None
+
 
 class QuestionType(Enum):
     """Types of questions the system can handle"""
@@ -39,6 +60,138 @@ class ClassificationResult:
         }
 
 
+def _numpy():
+    """NumPy if installed, else None (imported on first bulk use, never on the hook path)"""
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = False
+    return _numpy_module or None
+
+
+def bulk_engine() -> str:
+    """Engine classify_many() builds hit matrices with ("numpy" or "python")"""
+    return "numpy" if _numpy() else "python"
+
+
+def _alternation(patterns: List[str]) -> Pattern:
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+class PatternMatcher:
+    """
+    Pattern groups compiled for matching many at once
+
+    Same results as re.search() with every pattern in turn: a pattern can only
+    match at or after the earliest position where the combined alternation
+    (or its category's alternation) matches, so later searches start there.
+    """
+
+    def __init__(self, groups: Dict[str, Dict[str, List[str]]]):
+        """
+        Compile pattern groups
+
+        Args:
+            groups: {group: {category: [pattern, ...]}}, e.g. {"hybrid": {...}}
+        """
+        self._any = _alternation([
+            pattern
+            for categories in groups.values()
+            for patterns in categories.values()
+            for pattern in patterns
+        ])
+
+        self._groups: Dict[str, List[Tuple[str, Pattern, List[Pattern]]]] = {
+            group: [
+                (f"{group}.{category}", _alternation(patterns),
+                 [re.compile(pattern) for pattern in patterns])
+                for category, patterns in categories.items() if patterns
+            ]
+            for group, categories in groups.items()
+        }
+
+        # Flat view for hit matrices: patterns numbered in group/category order
+        self.categories: List[Tuple[str, str]] = []         # (group, "group.category")
+        self.pattern_category: List[int] = []               # category index per pattern
+        self._numbered: List[Tuple[Pattern, List[Tuple[int, Pattern]]]] = []
+        for group, compiled in self._groups.items():
+            for label, category, patterns in compiled:
+                numbered = []
+                for pattern in patterns:
+                    numbered.append((len(self.pattern_category), pattern))
+                    self.pattern_category.append(len(self.categories))
+                self.categories.append((group, label))
+                self._numbered.append((category, numbered))
+
+    def first_match(self, question: str) -> Optional[int]:
+        """Earliest position any pattern matches at, or None if none does"""
+        match = self._any.search(question)
+        return match.start() if match else None
+
+    def matched(self, group: str, question: str, start: int = 0) -> List[str]:
+        """
+        "group.category" once per matching pattern, in pattern order
+
+        Args:
+            group: Pattern group name
+            question: Lower-cased question
+            start: Position to search from (see first_match)
+        """
+        matched = []
+        for label, category, patterns in self._groups.get(group, ()):
+            match = category.search(question, start)
+            if match is None:
+                continue
+            at = match.start()
+            for pattern in patterns:
+                if pattern.search(question, at) is not None:
+                    matched.append(label)
+        return matched
+
+    def hits(self, question: str) -> List[int]:
+        """Numbers of the patterns that match a lower-cased question"""
+        start = self.first_match(question)
+        if start is None:
+            return []
+        hits = []
+        for category, numbered in self._numbered:
+            match = category.search(question, start)
+            if match is None:
+                continue
+            at = match.start()
+            for number, pattern in numbered:
+                if pattern.search(question, at) is not None:
+                    hits.append(number)
+        return hits
+
+    def category_counts(self, rows: List[List[int]]) -> List[List[int]]:
+        """
+        Matching patterns per category for each row of hits
+
+        With NumPy the rows become a boolean question x pattern matrix that
+        is multiplied by the pattern -> category membership matrix.
+        """
+        np = _numpy()
+        if np is None:
+            counts = []
+            for hits in rows:
+                row = [0] * len(self.categories)
+                for number in hits:
+                    row[self.pattern_category[number]] += 1
+                counts.append(row)
+            return counts
+
+        matrix = np.zeros((len(rows), len(self.pattern_category)), dtype=bool)
+        matrix[[row for row, hits in enumerate(rows) for _ in hits],
+               [number for hits in rows for number in hits]] = True
+        membership = np.zeros((len(self.pattern_category), len(self.categories)), dtype=np.int32)
+        membership[np.arange(len(self.pattern_category)), self.pattern_category] = 1
+        return (matrix.astype(np.int32) @ membership).tolist()
+
+
 class QuestionClassifier:
     """
     Classifies questions to determine appropriate handling
@@ -49,7 +202,17 @@ class QuestionClassifier:
     - Hybrid questions (what are options/help me decide)
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 1024):
+        """
+        Args:
+            cache_size: Classifications remembered (least recently used go
+                first; 0 disables the cache)
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], ClassificationResult]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
         # Decision question patterns
         self.decision_patterns = {
             "explicit_choice": [
@@ -119,34 +282,120 @@ class QuestionClassifier:
             ],
         }
 
+        self.compile_patterns()
+
+    def compile_patterns(self):
+        """(Re)build the matcher and pattern-set hash from the pattern dicts"""
+        groups = {
+            "hybrid": self.hybrid_patterns,
+            "decision": self.decision_patterns,
+            "factual": self.factual_patterns,
+        }
+        self.matcher = PatternMatcher(groups)
+        self.pattern_hash = hashlib.sha1(json.dumps(groups).encode()).hexdigest()[:16]
+
     def classify(self, question: str, context: Optional[Dict] = None) -> ClassificationResult:
         """
         Classify a question into one of the QuestionType categories
 
         Args:
             question: The question text to classify
-            context: Optional context information
+            context: Optional context information (results for calls with
+                context are not cached)
 
         Returns:
             ClassificationResult with type, confidence, and reasoning
         """
         question_lower = question.lower().strip()
+        if not self.cache_size or context is not None:
+            return self._classify(question_lower)
+
+        key = (self.pattern_hash, question_lower)
+        result = self._cache.get(key)
+        if result is None:
+            self.cache_misses += 1
+            result = self._cache[key] = self._classify(question_lower)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self.cache_hits += 1
+            self._cache.move_to_end(key)
+
+        # Callers get their own copy of the cached result
+        return ClassificationResult(
+            question_type=result.question_type,
+            confidence=result.confidence,
+            matched_patterns=list(result.matched_patterns),
+            reasoning=result.reasoning
+        )
 
-        # Check for hybrid patterns first (most specific)
-        hybrid_result = self._check_hybrid(question_lower)
-        if hybrid_result:
-            return hybrid_result
+    def _classify(self, question_lower: str) -> ClassificationResult:
+        """Classify a lower-cased, stripped question (uncached)"""
+        # One scan tells whether any pattern matches, and from where
+        start = self.matcher.first_match(question_lower)
+        if start is not None:
+            # Check for hybrid patterns first (most specific)
+            hybrid_result = self._check_hybrid(question_lower, start)
+            if hybrid_result:
+                return hybrid_result
+
+            # Check for decision patterns
+            decision_result = self._check_decision(question_lower, start)
+            if decision_result:
+                return decision_result
+
+            # Check for factual patterns
+            factual_result = self._check_factual(question_lower, start)
+            if factual_result:
+                return factual_result
+
+        return self._heuristic_result(question_lower)
+
+    def classify_many(self, questions: Iterable[str], chunk_size: int = 4096) -> Iterator[ClassificationResult]:
+        """
+        Classify a stream of questions, one chunk at a time
 
-        # Check for decision patterns
-        decision_result = self._check_decision(question_lower)
-        if decision_result:
-            return decision_result
+        Args:
+            questions: Any iterable of question texts (read lazily)
+            chunk_size: Questions held in memory at once
 
-        # Check for factual patterns
-        factual_result = self._check_factual(question_lower)
-        if factual_result:
-            return factual_result
+        Returns:
+            Iterator of the same results classify() gives, in input order
+            (repeats within a chunk share one result object; the cache is
+            neither used nor filled)
+        """
+        chunk = []
+        for question in questions:
+            chunk.append(question)
+            if len(chunk) >= chunk_size:
+                yield from self._classify_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self._classify_chunk(chunk)
+
+    def _classify_chunk(self, chunk: List[str]) -> Iterator[ClassificationResult]:
+        normalized = [question.lower().strip() for question in chunk]
+        distinct = list(dict.fromkeys(normalized))
+        counts = self.matcher.category_counts([self.matcher.hits(text) for text in distinct])
+
+        results = {}
+        for text, row in zip(distinct, counts):
+            matched = {"hybrid": [], "decision": [], "factual": []}
+            for (group, label), count in zip(self.matcher.categories, row):
+                if count:
+                    matched[group].extend([label] * count)
+            results[text] = (
+                self._check_hybrid(text, matched=matched["hybrid"]) or
+                self._check_decision(text, matched=matched["decision"]) or
+                self._check_factual(text, matched=matched["factual"]) or
+                self._heuristic_result(text)
+            )
 
+        for text in normalized:
+            yield results[text]
+
+    def _heuristic_result(self, question_lower: str) -> ClassificationResult:
+        """Classification when no pattern matched"""
         # If nothing matched clearly, use heuristics to infer type
         # Check for question words that suggest factual vs decision
         factual_words = ["is", "are", "does", "do", "can", "will", "has", "have"]
@@ -180,14 +429,11 @@ class QuestionClassifier:
             reasoning="No clear pattern match; defaulting to human decision for safety"
         )
 
-    def _check_hybrid(self, question: str) -> Optional[ClassificationResult]:
+    def _check_hybrid(self, question: str, start: int = 0,
+                       matched: List[str] = None) -> Optional[ClassificationResult]:
         """Check if question is hybrid (research + decision)"""
-        matched = []
-
-        for category, patterns in self.hybrid_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, question):
-                    matched.append(f"hybrid.{category}")
+        if matched is None:
+            matched = self.matcher.matched("hybrid", question, start)
 
         if matched:
             confidence = min(0.9, 0.7 + (len(matched) * 0.1))
@@ -200,14 +446,11 @@ class QuestionClassifier:
 
         return None
 
-    def _check_decision(self, question: str) -> Optional[ClassificationResult]:
+    def _check_decision(self, question: str, start: int = 0,
+                        matched: List[str] = None) -> Optional[ClassificationResult]:
         """Check if question requires human decision"""
-        matched = []
-
-        for category, patterns in self.decision_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, question):
-                    matched.append(f"decision.{category}")
+        if matched is None:
+            matched = self.matcher.matched("decision", question, start)
 
         if matched:
             confidence = min(0.95, 0.75 + (len(matched) * 0.1))
@@ -220,14 +463,11 @@ class QuestionClassifier:
 
         return None
 
-    def _check_factual(self, question: str) -> Optional[ClassificationResult]:
+    def _check_factual(self, question: str, start: int = 0,
+                       matched: List[str] = None) -> Optional[ClassificationResult]:
         """Check if question is factual (agent answerable)"""
-        matched = []
-
-        for category, patterns in self.factual_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, question):
-                    matched.append(f"factual.{category}")
+        if matched is None:
+            matched = self.matcher.matched("factual", question, start)
 
         if matched:
             confidence = min(0.95, 0.8 + (len(matched) * 0.1))
@@ -240,8 +480,13 @@ class QuestionClassifier:
 
         return None
 
+    def clear_cache(self):
+        """Forget memoized classifications (counters are kept)"""
+        self._cache.clear()
+
     def get_pattern_stats(self) -> dict:
-        """Get statistics about available patterns"""
+        """Get statistics about available patterns and the classification cache"""
+        lookups = self.cache_hits + self.cache_misses
         return {
             "decision_patterns": sum(len(p) for p in self.decision_patterns.values()),
             "factual_patterns": sum(len(p) for p in self.factual_patterns.values()),
@@ -251,12 +496,18 @@ class QuestionClassifier:
                 sum(len(p) for p in self.factual_patterns.values()) +
                 sum(len(p) for p in self.hybrid_patterns.values())
             ),
+            "pattern_hash": self.pattern_hash,
+            "cache_size": len(self._cache),
+            "cache_max_size": self.cache_size,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hits / lookups if lookups else 0.0,
         }
 
 
 # Test function
 def test_classifier():
-    """Test the classifier with sample questions"""
+    """Print classifications for a few sample questions (regression suite: benchmarks/bench_classifier.py)"""
     classifier = QuestionClassifier()
 
     test_questions = [
@@ -0,0 +1,110 @@
+"""
+Registry - Named, timed callables shared by the pluggable registries
+
+Outcome detectors (outcome_detectors.py) and agent backends
+(agent_backends.py) are both sets of named callables that are run
+concurrently, each under its own timeout, with per-name timing stats:
+
+- A callable is an async function, or a plain one that is run in a worker
+  thread
+- Registering a name again replaces the callable and resets its stats
+- Every call is timed (calls, mean/max seconds); timeouts and errors are
+  counted by the registry that decides how to treat them
+
+Subclasses add what is specific to them (a detector's kind, an agent's
+answer count) and how their callables are run together.
+"""
+
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Any, Callable
+
+
+@dataclass
+class Registered:
+    """A registered callable"""
+    name: str
+    fn: Callable
+    timeout: float
+    is_async: bool
+
+
+class TimedRegistry:
+    """Named callables with per-call timeouts and timing stats"""
+
+    # Extra counters a subclass keeps per name (besides calls/timeouts/errors)
+    counters = ()
+
+    def __init__(self, default_timeout: float):
+        """
+        Create an empty registry
+
+        Args:
+            default_timeout: Seconds a callable may take unless registered otherwise
+        """
+        self.default_timeout = default_timeout
+        self._entries: Dict[str, Registered] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _add(self, entry_class, name: str, fn: Callable, timeout: float = None, **fields) -> Registered:
+        """Add (or replace) an entry of entry_class and reset its stats"""
+        entry = entry_class(
+            name=name,
+            fn=fn,
+            timeout=timeout if timeout is not None else self.default_timeout,
+            is_async=asyncio.iscoroutinefunction(fn),
+            **fields
+        )
+        self._entries[name] = entry
+        self._stats[name] = dict({"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+                                  "timeouts": 0, "errors": 0},
+                                 **{counter: 0 for counter in self.counters})
+        return entry
+
+    def unregister(self, name: str):
+        self._entries.pop(name, None)
+        self._stats.pop(name, None)
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    async def _timed_call(self, entry: Registered, *args) -> Any:
+        """
+        Run one callable under its timeout, recording timing
+
+        Timeouts and errors propagate; the caller counts them.
+        """
+        stats = self._stats[entry.name]
+        started = time.perf_counter()
+        try:
+            if entry.is_async:
+                call = entry.fn(*args)
+            else:
+                call = asyncio.get_running_loop().run_in_executor(None, entry.fn, *args)
+            return await asyncio.wait_for(call, entry.timeout)
+        finally:
+            elapsed = time.perf_counter() - started
+            stats["calls"] += 1
+            stats["total_seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+    def _describe(self, name: str) -> Dict[str, Any]:
+        """Fields get_stats reports ahead of the timing stats"""
+        return {}
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-name calls, mean/max seconds, timeouts and errors"""
+        report = {}
+        for name, stats in self._stats.items():
+            calls = stats["calls"]
+            report[name] = dict(
+                self._describe(name),
+                calls=calls,
+                **{counter: stats[counter] for counter in self.counters},
+                mean_seconds=stats["total_seconds"] / calls if calls else 0.0,
+                max_seconds=stats["max_seconds"],
+                timeouts=stats["timeouts"],
+                errors=stats["errors"],
+            )
+        return report
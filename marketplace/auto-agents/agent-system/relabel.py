@@ -0,0 +1,262 @@
+"""
+Relabel - Re-classify the question history after a pattern change
+
+Streams every question in the Q&A log (segments, all_questions.jsonl and
+per-choice files) and the knowledge base through
+QuestionClassifier.classify_many() and compares each question's type with
+the label the previous run stored:
+
+- Per-type counts over every logged question, also split by source
+- Changes as "old -> new" transition counts (each distinct question counted
+  once) plus a few examples
+- Labels live in classification_labels.db (question hash -> type, pattern
+  hash and run) and are updated in the same pass, so the next run diffs
+  against this one; --dry-run reports without saving
+
+Memory stays bounded: questions are read lazily, classified a chunk at a
+time, and previous labels are looked up per chunk.
+
+    python3 relabel.py
+    python3 relabel.py --dry-run --json
+"""
+
+import json
+import time
+import sqlite3
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Tuple
+
+from knowledge_store import question_hash, open_knowledge_store
+from qa_log import QALog
+from question_classifier import QuestionClassifier, bulk_engine
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS labels (
+    question_hash TEXT PRIMARY KEY,
+    question_type TEXT NOT NULL,
+    pattern_hash  TEXT NOT NULL,
+    run           TEXT NOT NULL
+);
+"""
+
+MAX_EXAMPLES = 20
+
+# SQLite's default limit on bound parameters is 999 in older versions
+LOOKUP_BATCH = 900
+
+
+class LabelStore:
+    """Last known question type per question hash"""
+
+    def __init__(self, db_file: Path):
+        """
+        Open (and create if needed) the label store
+
+        Args:
+            db_file: SQLite database file
+        """
+        self.db_file = db_file
+        self._conn = sqlite3.connect(str(db_file), timeout=10.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def lookup(self, hashes: List[str]) -> Dict[str, Tuple[str, str]]:
+        """{question_hash: (question_type, run)} for the hashes that have a label"""
+        labels = {}
+        for i in range(0, len(hashes), LOOKUP_BATCH):
+            batch = hashes[i:i + LOOKUP_BATCH]
+            rows = self._conn.execute(
+                "SELECT question_hash, question_type, run FROM labels "
+                f"WHERE question_hash IN ({','.join('?' * len(batch))})",
+                batch
+            )
+            labels.update((q_hash, (q_type, run)) for q_hash, q_type, run in rows)
+        return labels
+
+    def save(self, labels: List[Tuple[str, str]], pattern_hash: str, run: str):
+        """Store (question_hash, question_type) pairs"""
+        self._conn.executemany(
+            "INSERT INTO labels (question_hash, question_type, pattern_hash, run) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT(question_hash) DO UPDATE SET "
+            "question_type = excluded.question_type, pattern_hash = excluded.pattern_hash, "
+            "run = excluded.run",
+            [(q_hash, q_type, pattern_hash, run) for q_hash, q_type in labels]
+        )
+
+    def begin(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def commit(self):
+        self._conn.execute("COMMIT")
+
+    def rollback(self):
+        self._conn.execute("ROLLBACK")
+
+    def close(self):
+        self._conn.close()
+
+
+def iter_history(agents_dir: Path, kb_backend: str = "sqlite") -> Iterator[Tuple[str, str]]:
+    """
+    Every logged and learned question
+
+    Logged questions come from QALog.iter_all_records(), so a choice that
+    is both in all_questions.jsonl and a per-choice file is counted once.
+
+    Args:
+        agents_dir: Directory holding qa_logs/ and the knowledge base
+        kb_backend: Knowledge base storage, "sqlite" or "json"
+
+    Returns:
+        Iterator of (source, question), source being "qa_log" or "knowledge_base"
+    """
+    for record in QALog(agents_dir / "qa_logs").iter_all_records():
+        if record.get("question"):
+            yield "qa_log", record["question"]
+
+    store = open_knowledge_store(agents_dir, kb_backend)
+    try:
+        for entry in store.all().values():
+            yield "knowledge_base", entry["question"]
+    finally:
+        store.close()
+
+
+def relabel(history: Iterable[Tuple[str, str]], classifier: QuestionClassifier,
+            labels: LabelStore, chunk_size: int = 4096, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Classify a history and diff it against the stored labels
+
+    Args:
+        history: (source, question) pairs, e.g. iter_history()
+        classifier: Classifier with the patterns to apply
+        labels: Where previous labels are read and new ones saved
+        chunk_size: Questions classified (and looked up) at once
+        dry_run: Roll the label updates back instead of saving them
+
+    Returns:
+        Report with per-type and per-source counts and the label changes
+    """
+    started = time.perf_counter()
+    run = datetime.now().isoformat()
+    report = {
+        "questions": 0,
+        "by_type": {},
+        "by_source": {},
+        "distinct": 0,
+        "new": 0,
+        "changed": 0,
+        "transitions": {},
+        "examples": [],
+        "pattern_hash": classifier.pattern_hash,
+        "engine": bulk_engine(),
+        "dry_run": dry_run,
+    }
+
+    def process(chunk: List[Tuple[str, str]]):
+        results = classifier.classify_many((question for _, question in chunk), chunk_size)
+        current: Dict[str, Tuple[str, str]] = {}
+        for (source, question), result in zip(chunk, results):
+            q_type = result.question_type.value
+            report["questions"] += 1
+            report["by_type"][q_type] = report["by_type"].get(q_type, 0) + 1
+            per_source = report["by_source"].setdefault(source, {})
+            per_source[q_type] = per_source.get(q_type, 0) + 1
+            current.setdefault(question_hash(question), (question, q_type))
+
+        previous = labels.lookup(list(current))
+        for q_hash, (question, q_type) in current.items():
+            before = previous.get(q_hash)
+            if before is not None and before[1] == run:
+                continue    # Already counted earlier in this run
+            report["distinct"] += 1
+            if before is None:
+                report["new"] += 1
+            elif before[0] != q_type:
+                report["changed"] += 1
+                transition = f"{before[0]} -> {q_type}"
+                report["transitions"][transition] = report["transitions"].get(transition, 0) + 1
+                if len(report["examples"]) < MAX_EXAMPLES:
+                    report["examples"].append(
+                        {"question": question, "previous": before[0], "current": q_type}
+                    )
+        labels.save([(q_hash, q_type) for q_hash, (_, q_type) in current.items()],
+                    classifier.pattern_hash, run)
+
+    labels.begin()
+    try:
+        chunk = []
+        for item in history:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                process(chunk)
+                chunk = []
+        if chunk:
+            process(chunk)
+    except BaseException:
+        labels.rollback()
+        raise
+    if dry_run:
+        labels.rollback()
+    else:
+        labels.commit()
+
+    report["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Plain-text summary of a relabel report"""
+    lines = [
+        "=" * 70,
+        "🏷️  RELABEL REPORT" + (" (dry run)" if report["dry_run"] else ""),
+        "=" * 70,
+        f"Questions: {report['questions']} ({report['distinct']} distinct) in "
+        f"{report['elapsed_seconds']:.2f}s [{report['engine']}]",
+        f"Pattern set: {report['pattern_hash']}",
+        "\nBy type:",
+    ]
+    for q_type, count in sorted(report["by_type"].items(), key=lambda item: -item[1]):
+        lines.append(f"  {q_type:<20} {count:>9}")
+    for source, counts in sorted(report["by_source"].items()):
+        lines.append(f"\n{source}:")
+        for q_type, count in sorted(counts.items(), key=lambda item: -item[1]):
+            lines.append(f"  {q_type:<20} {count:>9}")
+    lines.append(f"\nNewly labeled: {report['new']}")
+    lines.append(f"Changed: {report['changed']}")
+    for transition, count in sorted(report["transitions"].items(), key=lambda item: -item[1]):
+        lines.append(f"  {transition:<40} {count:>7}")
+    if report["examples"]:
+        lines.append("\nExamples:")
+        for example in report["examples"]:
+            lines.append(f"  {example['previous']} -> {example['current']}: {example['question'][:60]}")
+    lines.append("=" * 70)
+    return '\n'.join(lines)
+
+
+def main():
+    """Relabel the question history of an agents directory"""
+    parser = argparse.ArgumentParser(description="Re-classify logged and learned questions")
+    parser.add_argument("--agents-dir", type=Path, default=Path(__file__).parent,
+                        help="Directory holding qa_logs/ and the knowledge base (default: this directory)")
+    parser.add_argument("--kb-backend", choices=["sqlite", "json"], default="sqlite")
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument("--dry-run", action="store_true", help="Report without saving the new labels")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    labels = LabelStore(args.agents_dir / "classification_labels.db")
+    try:
+        report = relabel(iter_history(args.agents_dir, args.kb_backend), QuestionClassifier(),
+                         labels, chunk_size=args.chunk_size, dry_run=args.dry_run)
+    finally:
+        labels.close()
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""
+Similarity Index - Near-duplicate lookup for learned questions
+
+The knowledge base key is an exact hash of the normalized question, so
+"Should we add Redis caching for the API?" and "Should we use Redis caching
+for the API?" are separate entries. This index finds a sufficiently similar
+learned question instead:
+
+1. Shingles - single words and word pairs of the normalized question, so
+   word order counts ("delete it" vs "it delete")
+2. MinHash - fixed-size signature estimating Jaccard similarity
+3. LSH - signature split into bands; questions sharing any band bucket
+   become candidates, which are then scored by exact Jaccard similarity
+4. Negation - a candidate is refused when one question is negated and the
+   other is not ("delete it" vs "don't delete it"), however similar
+
+Buckets are persisted in SQLite (similarity_index.db, next to the KB), so a
+lookup is one indexed query plus a handful of candidate comparisons, and
+nothing is rebuilt when a process starts. New answers are added one row at
+a time.
+"""
+
+import re
+import json
+import random
+import sqlite3
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple, Iterable
+
+# Mersenne prime for the universal hash family
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 64) - 1
+
+# Bumped when shingling changes, so indexes built the old way are rebuilt
+SHINGLE_FORMAT = 2
+
+# Negation words, apostrophes removed ("don't" -> "dont")
+NEGATIONS = frozenset((
+    "no", "not", "never", "none", "nothing", "neither", "nor", "without", "cannot",
+    "dont", "doesnt", "didnt", "wont", "wouldnt", "cant", "couldnt", "shouldnt",
+    "isnt", "arent", "wasnt", "werent", "havent", "hasnt", "hadnt", "mustnt",
+))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    question_hash TEXT PRIMARY KEY,
+    question      TEXT NOT NULL,
+    shingles      TEXT NOT NULL         -- JSON list
+);
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    bucket        TEXT NOT NULL,        -- "<band>:<digest of band rows>"
+    question_hash TEXT NOT NULL,
+    PRIMARY KEY (bucket, question_hash)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def tokens(text: str) -> List[str]:
+    """Lower-cased words with apostrophes removed"""
+    return re.findall(r"[a-z0-9]+", re.sub(r"['\u2019]", "", text.lower()))
+
+
+def shingles(text: str, size: int = 2) -> Set[str]:
+    """
+    Word n-gram shingles of a normalized question
+
+    Args:
+        text: Question text
+        size: Longest n-gram; every n-gram from single words up to this is included
+    """
+    words = tokens(text)
+    return {
+        " ".join(words[i:i + n])
+        for n in range(1, size + 1)
+        for i in range(len(words) - n + 1)
+    }
+
+
+def is_negated(text: str) -> bool:
+    """True if the question contains a negation word"""
+    return any(word in NEGATIONS for word in tokens(text))
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Exact Jaccard similarity of two shingle sets"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class SimilarityIndex:
+    """
+    Persistent MinHash/LSH index over learned questions
+
+    With the defaults (64 permutations in 32 bands of 2 rows) a pair with
+    Jaccard similarity 0.5 becomes a candidate >99.9% of the time and a pair
+    at 0.3 ~95% of the time. Short prompts have tiny shingle sets, so the
+    banding is deliberately permissive; candidates are then checked exactly
+    against `threshold` and for matching negation.
+    """
+
+    def __init__(self, db_file: Path, threshold: float = 0.6, num_perm: int = 64,
+                 bands: int = 32, shingle_size: int = 2, seed: int = 1,
+                 max_candidates: int = 32):
+        """
+        Open (and create if needed) the index
+
+        Args:
+            db_file: SQLite file holding signatures and buckets
+            threshold: Minimum Jaccard similarity for a match (0.0 - 1.0)
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must be divisible by bands)
+            shingle_size: Longest word n-gram per shingle (2 = words and word pairs)
+            seed: Seed for the MinHash permutations
+            max_candidates: Candidates (most shared buckets first) scored per lookup
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.db_file = db_file
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_candidates = max_candidates
+
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+                       for _ in range(num_perm)]
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_file), timeout=10.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        # Buckets built with different parameters are useless - start over
+        params = json.dumps([SHINGLE_FORMAT, num_perm, bands, shingle_size, seed])
+        if self._get_meta("params") != params:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM signatures")
+            self._conn.execute("DELETE FROM lsh_buckets")
+            self._conn.execute("DELETE FROM meta")
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('params', ?)", (params,))
+            self._conn.execute("COMMIT")
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @property
+    def is_built(self) -> bool:
+        """True once the index has been populated from the knowledge base"""
+        return self._get_meta("built") is not None
+
+    def mark_built(self):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('built', '1')")
+
+    def signature(self, shingle_set: Set[str]) -> List[int]:
+        """MinHash signature of a shingle set"""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big")
+            for s in shingle_set
+        ]
+        return [
+            min((a * h + b) % _PRIME for h in hashes) if hashes else _MAX_HASH
+            for a, b in self._perms
+        ]
+
+    def _bucket_keys(self, signature: List[int]) -> List[str]:
+        """One bucket key per LSH band"""
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(repr(rows).encode(), digest_size=8).hexdigest()
+            keys.append(f"{band}:{digest}")
+        return keys
+
+    def _insert(self, q_hash: str, question: str):
+        shingle_set = shingles(question, self.shingle_size)
+        if not shingle_set:
+            return
+
+        self._conn.execute("DELETE FROM lsh_buckets WHERE question_hash = ?", (q_hash,))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO signatures (question_hash, question, shingles) VALUES (?, ?, ?)",
+            (q_hash, question, json.dumps(sorted(shingle_set)))
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO lsh_buckets (bucket, question_hash) VALUES (?, ?)",
+            [(key, q_hash) for key in self._bucket_keys(self.signature(shingle_set))]
+        )
+
+    def add(self, q_hash: str, question: str):
+        """Index one learned question (replaces any previous entry for the hash)"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._insert(q_hash, question)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def add_many(self, questions: Iterable[Tuple[str, str]]):
+        """Index (question_hash, question) pairs in one transaction"""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            for q_hash, question in questions:
+                self._insert(q_hash, question)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def remove(self, *q_hashes: str):
+        """Drop questions from the index"""
+        params = [(q_hash,) for q_hash in q_hashes]
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._conn.executemany("DELETE FROM lsh_buckets WHERE question_hash = ?", params)
+        self._conn.executemany("DELETE FROM signatures WHERE question_hash = ?", params)
+        self._conn.execute("COMMIT")
+
+    def find_similar(self, question: str,
+                     threshold: float = None) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed question
+
+        Questions that differ in negation never match.
+
+        Args:
+            question: Question to look up
+            threshold: Override the index's similarity threshold
+
+        Returns:
+            (question_hash, similarity) of the best match at or above the
+            threshold, or None
+        """
+        threshold = self.threshold if threshold is None else threshold
+        shingle_set = shingles(question, self.shingle_size)
+        if not shingle_set:
+            return None
+
+        keys = self._bucket_keys(self.signature(shingle_set))
+        # Questions sharing more bands are more likely to be similar
+        rows = self._conn.execute(
+            "SELECT s.question_hash, s.question, s.shingles FROM signatures s JOIN ("
+            "  SELECT question_hash, COUNT(*) AS shared FROM lsh_buckets"
+            f"  WHERE bucket IN ({', '.join('?' for _ in keys)})"
+            "  GROUP BY question_hash ORDER BY shared DESC LIMIT ?"
+            ") c ON c.question_hash = s.question_hash",
+            keys + [self.max_candidates]
+        ).fetchall()
+
+        negated = is_negated(question)
+        best = None
+        for q_hash, indexed_question, stored in rows:
+            if is_negated(indexed_question) != negated:
+                continue
+            similarity = jaccard(shingle_set, set(json.loads(stored)))
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (q_hash, similarity)
+        return best
+
+    @property
+    def size(self) -> int:
+        """Indexed questions (not __len__: an empty index must stay truthy)"""
+        return self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size and parameters"""
+        return {
+            "questions": self.size,
+            "buckets": self._conn.execute(
+                "SELECT COUNT(DISTINCT bucket) FROM lsh_buckets").fetchone()[0],
+            "num_perm": self.num_perm,
+            "bands": self.bands,
+            "threshold": self.threshold,
+        }
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,287 @@
+"""
+Tracing - Stage-level spans and latency histograms
+
+Answers "where did this slow prompt spend its time?" across the hooks, the
+orchestrator and the post-question processor:
+
+- tracer.span("classify") times a named stage with time.perf_counter()
+- Spans aggregate into per-stage histograms (log-scale buckets, ~9%
+  resolution), from which p50/p95/p99 are read
+- Histograms are merged into metrics/stage_latency.json at exit (and at
+  most every flush_interval seconds in long-running processes), under a
+  file lock so the hook, daemon and CLI can all contribute
+
+Tracing is off unless AUTO_AGENTS_TRACE=1 is set (or a Tracer is created
+with enabled=True); a disabled span() returns a shared no-op context
+manager, so instrumented code costs one method call per stage.
+
+    AUTO_AGENTS_TRACE=1 python3 ...     # record
+    python3 tracing.py show             # print the histograms
+    python3 tracing.py reset
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import atexit
+import argparse
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator
+
+from json_io import write_json_atomic, read_json
+
+try:
+    import fcntl
+except ImportError:     # Windows: merges are then unlocked
+    fcntl = None
+
+DEFAULT_METRICS_FILE = Path(__file__).parent / "metrics" / "stage_latency.json"
+
+# Bucket i holds durations in (BASE**(i-1), BASE**i] microseconds
+BUCKET_BASE = 2 ** 0.125
+_LOG_BASE = math.log(BUCKET_BASE)
+
+PERCENTILES = (50, 95, 99)
+
+
+def bucket_index(seconds: float) -> int:
+    micros = seconds * 1e6
+    if micros <= 1.0:
+        return 0
+    return math.ceil(math.log(micros) / _LOG_BASE)
+
+
+def bucket_upper_seconds(index: int) -> float:
+    return BUCKET_BASE ** index / 1e6
+
+
+class Histogram:
+    """Count, sum, max and log-bucketed counts for one stage"""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        index = bucket_index(seconds)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: "Histogram"):
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the pct-th percentile (capped at max)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(bucket_upper_seconds(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        result = {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+        }
+        for pct in PERCENTILES:
+            result[f"p{pct}_ms"] = self.percentile(pct) * 1000
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "total": self.total, "max": self.max,
+                "buckets": {str(index): count for index, count in self.buckets.items()}}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Histogram":
+        histogram = cls()
+        histogram.count = data.get("count", 0)
+        histogram.total = data.get("total", 0.0)
+        histogram.max = data.get("max", 0.0)
+        histogram.buckets = {int(index): count
+                             for index, count in data.get("buckets", {}).items()}
+        return histogram
+
+
+class _NullSpan:
+    """Shared do-nothing span used when tracing is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Records stage spans into histograms and persists them"""
+
+    def __init__(self, metrics_file: Path = None, enabled: bool = False,
+                 flush_interval: float = 30.0):
+        """
+        Args:
+            metrics_file: Where histograms are merged (default: metrics/stage_latency.json)
+            enabled: Record spans (otherwise span() is a no-op)
+            flush_interval: Max seconds between merges in long-running processes
+        """
+        self.metrics_file = metrics_file or DEFAULT_METRICS_FILE
+        self.enabled = enabled
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        if enabled:
+            atexit.register(self.flush)
+
+    def span(self, stage: str):
+        """Context manager timing one stage (no-op when disabled)"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(stage)
+
+    @contextmanager
+    def _span(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def record(self, stage: str, seconds: float):
+        """Record a duration measured elsewhere (e.g. before this module was imported)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._pending.get(stage)
+            if histogram is None:
+                histogram = self._pending[stage] = Histogram()
+            histogram.add(seconds)
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(self.metrics_file.with_name(self.metrics_file.name + ".lock"), 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def flush(self):
+        """Merge recorded spans into the metrics file"""
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+
+        try:
+            with self._file_lock():
+                stored = read_json(self.metrics_file, {})
+                stages = stored.get("stages", {})
+                for stage, histogram in pending.items():
+                    merged = Histogram.from_dict(stages.get(stage, {}))
+                    merged.merge(histogram)
+                    stages[stage] = merged.to_dict()
+                write_json_atomic(self.metrics_file, {"version": 1, "stages": stages}, indent=None)
+        except OSError as e:
+            print(f"⚠️  Could not write metrics to {self.metrics_file}: {e}", file=sys.stderr)
+
+    def snapshot(self) -> Dict[str, Histogram]:
+        """Recorded (unflushed) histograms by stage"""
+        with self._lock:
+            return {stage: Histogram.from_dict(h.to_dict()) for stage, h in self._pending.items()}
+
+
+def load_histograms(metrics_file: Path = None) -> Dict[str, Histogram]:
+    """Histograms persisted in a metrics file, by stage"""
+    stored = read_json(metrics_file or DEFAULT_METRICS_FILE, {})
+    return {stage: Histogram.from_dict(data) for stage, data in stored.get("stages", {}).items()}
+
+
+def format_table(histograms: Dict[str, Histogram]) -> str:
+    """Plain-text table of per-stage latency percentiles"""
+    header = f"{'stage':<34} {'count':>7} {'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+    lines = [header, "-" * len(header)]
+    for stage in sorted(histograms):
+        s = histograms[stage].summary()
+        lines.append(
+            f"{stage:<34} {s['count']:>7} {s['mean_ms']:>7.2f}ms {s['p50_ms']:>7.2f}ms "
+            f"{s['p95_ms']:>7.2f}ms {s['p99_ms']:>7.2f}ms {s['max_ms']:>7.2f}ms"
+        )
+    return '\n'.join(lines)
+
+
+_shared_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """The process-wide tracer (enabled by AUTO_AGENTS_TRACE=1)"""
+    global _shared_tracer
+    if _shared_tracer is None:
+        metrics_file = os.environ.get("AUTO_AGENTS_METRICS_FILE")
+        _shared_tracer = Tracer(
+            metrics_file=Path(metrics_file) if metrics_file else None,
+            enabled=os.environ.get("AUTO_AGENTS_TRACE", "") not in ("", "0")
+        )
+    return _shared_tracer
+
+
+def main():
+    """Command line access to the stage histograms"""
+    parser = argparse.ArgumentParser(description="Stage latency histograms")
+    parser.add_argument("action", choices=["show", "json", "reset"])
+    parser.add_argument("--metrics-file", type=Path, default=DEFAULT_METRICS_FILE,
+                        help="Metrics file (default: metrics/stage_latency.json next to this file)")
+    parser.add_argument("--stage", default=None, help="Only stages starting with this prefix")
+    args = parser.parse_args()
+
+    if args.action == "reset":
+        if args.metrics_file.exists():
+            args.metrics_file.unlink()
+        print(f"🧹 Cleared {args.metrics_file}")
+        return
+
+    histograms = load_histograms(args.metrics_file)
+    if args.stage:
+        histograms = {stage: h for stage, h in histograms.items() if stage.startswith(args.stage)}
+
+    if args.action == "json":
+        print(json.dumps({stage: h.summary() for stage, h in sorted(histograms.items())}, indent=2))
+    elif not histograms:
+        print(f"📭 No spans recorded in {args.metrics_file} (run with AUTO_AGENTS_TRACE=1)")
+    else:
+        print(format_table(histograms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Classifier Accuracy and Latency Regression Suite
+
+Runs a question classifier over the versioned labeled corpus
+(classifier_corpus_v1.jsonl: question, expected QuestionType value and
+where the question came from) and checks it against classifier_budget.json:
+
+- accuracy: overall and per expected QuestionType, plus the confusion
+  counts and every misclassified question; each may not drop below the
+  floor recorded in the budget
+- latency: p50/p95/p99/max microseconds per classify() call, uncached (and
+  cached for the regex rules); the uncached p99 must stay within budget
+- memory: KB allocated by one classifier instance (compiled patterns
+  included), and after classifying the corpus (classification cache full)
+
+Exits 1 when anything is outside the budget, so pattern changes can be
+judged on speed and correctness before they ship. The accuracy gate also
+runs with the test suite (tests/test_classifier_accuracy.py, regex floors
+only).
+
+How the floors are chosen: --write-budget records this run's accuracy as
+"measured" and sets each floor a few questions below it (the budget's
+"floor_tolerance": 2 questions overall, 1 per type). A run at the measured
+accuracy is "unchanged", one above it is reported as an improvement (run
+--write-budget to raise the floors), and only a drop past the tolerance
+fails.
+
+When the corpus changes (new questions or relabels), add a new version
+(classifier_corpus_v2.jsonl) rather than editing v1 in place; the budget
+names the corpus its floors were measured on.
+
+Usage:
+    python3 benchmarks/bench_classifier.py
+    python3 benchmarks/bench_classifier.py --classifier model --max-p99-us 100
+    python3 benchmarks/bench_classifier.py --write-budget
+"""
+
+import re
+import sys
+import json
+import math
+import time
+import hashlib
+import argparse
+import tracemalloc
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PLUGIN_ROOT / "agent-system"))
+
+from question_classifier import QuestionClassifier, QuestionType  # noqa: E402
+from hashed_classifier import HashedFeatureModel, DEFAULT_MODEL_FILE, CLASSIFIER_KINDS  # noqa: E402
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_CORPUS = BENCH_DIR / "classifier_corpus_v1.jsonl"
+DEFAULT_BUDGET = BENCH_DIR / "classifier_budget.json"
+
+# Used when the budget has no entry for a classifier
+DEFAULT_MAX_P99_US = 250.0
+
+# Questions a floor sits below the measured accuracy (see --write-budget)
+DEFAULT_FLOOR_TOLERANCE = {"overall_questions": 2, "per_type_questions": 1}
+
+MAX_MISSES_SHOWN = 40
+
+
+def load_corpus(path: Path) -> list:
+    """Labeled questions: [{"question", "expected", "source"}]"""
+    valid = {question_type.value for question_type in QuestionType}
+    corpus = []
+    with open(path, 'r') as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("expected") not in valid:
+                raise ValueError(f"{path}:{number}: expected must be one of {sorted(valid)}")
+            corpus.append(record)
+    return corpus
+
+
+def corpus_hash(path: Path) -> str:
+    return hashlib.sha1(path.read_bytes()).hexdigest()[:12]
+
+
+def make(kind: str, model_file: Path, cache_size: int = 0):
+    """A fresh classifier of the given kind (regex: uncached by default)"""
+    if kind == "regex":
+        return QuestionClassifier(cache_size=cache_size)
+    # Measured here, so loaded whether or not it passes the quality gate
+    return HashedFeatureModel.load(model_file, budget_file=None)
+
+
+def accuracy(classifier, corpus: list) -> dict:
+    """Overall and per expected type accuracy, confusion counts and misses"""
+    per_type = {}
+    confusion = {}
+    misses = []
+    correct = 0
+    for record in corpus:
+        expected = record["expected"]
+        actual = classifier.classify(record["question"]).question_type.value
+        counts = per_type.setdefault(expected, [0, 0])
+        counts[1] += 1
+        if actual == expected:
+            correct += 1
+            counts[0] += 1
+        else:
+            key = f"{expected} -> {actual}"
+            confusion[key] = confusion.get(key, 0) + 1
+            misses.append({"question": record["question"], "expected": expected,
+                           "actual": actual, "source": record.get("source", "")})
+    return {
+        "accuracy": round(correct / len(corpus), 4),
+        "correct": correct,
+        "per_type": {
+            q_type: {"accuracy": round(hits / total, 4), "correct": hits, "total": total}
+            for q_type, (hits, total) in sorted(per_type.items())
+        },
+        "confusion": dict(sorted(confusion.items(), key=lambda item: -item[1])),
+        "misses": misses,
+    }
+
+
+def latency(classifier, questions: list, rounds: int) -> dict:
+    """Per-call percentiles in microseconds (after one warm-up pass)"""
+    for question in questions:
+        classifier.classify(question)
+    timings = []
+    for _ in range(rounds):
+        for question in questions:
+            started = time.perf_counter_ns()
+            classifier.classify(question)
+            timings.append((time.perf_counter_ns() - started) / 1000)
+    timings.sort()
+
+    def percentile(p):
+        return round(timings[min(len(timings) - 1, int(len(timings) * p))], 2)
+
+    return {
+        "calls": len(timings),
+        "mean_us": round(sum(timings) / len(timings), 2),
+        "p50_us": percentile(0.50),
+        "p95_us": percentile(0.95),
+        "p99_us": percentile(0.99),
+        "max_us": round(timings[-1], 2),
+    }
+
+
+def memory(kind: str, model_file: Path, questions: list) -> dict:
+    """KB allocated by one instance, fresh and after classifying the corpus"""
+    re.purge()      # Count pattern compilation, not the re module's cache
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        classifier = make(kind, model_file, cache_size=1024)
+        instance = tracemalloc.get_traced_memory()[0] - baseline
+        for question in questions:
+            classifier.classify(question)
+        warm = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    return {"instance_kb": round(instance / 1024, 1), "warm_kb": round(warm / 1024, 1)}
+
+
+def accuracy_violations(result: dict, budget: dict) -> list:
+    """
+    Accuracy floor violations
+
+    Args:
+        result: accuracy() of this run
+        budget: {"min_accuracy", "min_type_accuracy": {type: floor}} (both optional)
+
+    Returns:
+        Human-readable violations (empty when every floor is met)
+    """
+    violations = []
+    if result["accuracy"] < budget.get("min_accuracy", 0.0):
+        violations.append(f"accuracy {result['accuracy']:.2%} < {budget['min_accuracy']:.2%}")
+    for q_type, floor in budget.get("min_type_accuracy", {}).items():
+        actual = result["per_type"].get(q_type, {}).get("accuracy", 0.0)
+        if actual < floor:
+            violations.append(f"{q_type} accuracy {actual:.2%} < {floor:.2%}")
+    return violations
+
+
+def floors(result: dict, tolerance: dict) -> dict:
+    """
+    Floors a tolerance below a measured accuracy
+
+    Args:
+        result: accuracy() of the run being recorded
+        tolerance: {"overall_questions", "per_type_questions"} allowed to regress
+
+    Returns:
+        {"min_accuracy", "min_type_accuracy"} (rounded down, so the measured run passes)
+    """
+    def floor(correct, total, slack):
+        return max(0.0, math.floor(10000 * (correct - slack) / total) / 10000)
+
+    total = sum(r["total"] for r in result["per_type"].values())
+    return {
+        "min_accuracy": floor(result["correct"], total, tolerance["overall_questions"]),
+        "min_type_accuracy": {
+            q_type: floor(r["correct"], r["total"], tolerance["per_type_questions"])
+            for q_type, r in result["per_type"].items()
+        },
+    }
+
+
+def check(report: dict, budget: dict) -> list:
+    """
+    Budget violations
+
+    Args:
+        report: This run's results
+        budget: {"min_accuracy", "min_type_accuracy": {type: floor},
+                 "max_p99_us", "max_memory_kb"} (all optional)
+
+    Returns:
+        Human-readable violations (empty when within budget)
+    """
+    violations = accuracy_violations(report["accuracy"], budget)
+    p99 = report["latency"]["uncached"]["p99_us"]
+    if p99 > budget.get("max_p99_us", DEFAULT_MAX_P99_US):
+        violations.append(f"p99 latency {p99:.1f}µs > {budget.get('max_p99_us', DEFAULT_MAX_P99_US):.1f}µs")
+    if "max_memory_kb" in budget and report["memory"]["instance_kb"] > budget["max_memory_kb"]:
+        violations.append(f"instance memory {report['memory']['instance_kb']}KB > {budget['max_memory_kb']}KB")
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classifier accuracy and latency regression suite")
+    parser.add_argument("--classifier", choices=CLASSIFIER_KINDS, default="regex")
+    parser.add_argument("--model-file", type=Path, default=PLUGIN_ROOT / "agent-system" / DEFAULT_MODEL_FILE,
+                        help="Trained model for --classifier model")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS,
+                        help=f"Labeled corpus (default {DEFAULT_CORPUS.name})")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET,
+                        help=f"Accuracy floors and latency/memory budgets (default {DEFAULT_BUDGET.name})")
+    parser.add_argument("--max-p99-us", type=float, default=None, help="Override the p99 latency budget")
+    parser.add_argument("--min-accuracy", type=float, default=None, help="Override the overall accuracy floor")
+    parser.add_argument("--rounds", type=int, default=200, help="Latency passes over the corpus (default 200)")
+    parser.add_argument("--write-budget", action="store_true",
+                        help="Record this run's accuracy as the new floors for this classifier")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    questions = [record["question"] for record in corpus]
+    if args.classifier == "model" and not args.model_file.exists():
+        parser.error(f"{args.model_file} not found (python3 agent-system/hashed_classifier.py train)")
+    classifier = make(args.classifier, args.model_file)
+
+    report = {
+        "classifier": args.classifier,
+        "corpus": args.corpus.name,
+        "corpus_hash": corpus_hash(args.corpus),
+        "questions": len(corpus),
+        "accuracy": accuracy(classifier, corpus),
+        "latency": {"uncached": latency(classifier, questions, args.rounds)},
+        "memory": memory(args.classifier, args.model_file, questions),
+    }
+    if args.classifier == "regex":
+        report["pattern_hash"] = classifier.pattern_hash
+        report["latency"]["cached"] = latency(QuestionClassifier(), questions, args.rounds)
+
+    budgets = {}
+    if args.budget.exists():
+        with open(args.budget, 'r') as f:
+            budgets = json.load(f)
+    budget = dict(budgets.get(args.classifier, {}))
+    if budget and budgets.get("corpus") != args.corpus.name:
+        # Floors measured on another corpus say nothing about this one
+        print(f"⚠️  Budget floors are for {budgets.get('corpus')}, not {args.corpus.name}; "
+              "checking latency only", file=sys.stderr)
+        budget.pop("min_accuracy", None)
+        budget.pop("min_type_accuracy", None)
+        budget.pop("measured", None)
+    if args.max_p99_us is not None:
+        budget["max_p99_us"] = args.max_p99_us
+    if args.min_accuracy is not None:
+        budget["min_accuracy"] = args.min_accuracy
+
+    if args.write_budget:
+        tolerance = budgets.get("floor_tolerance", DEFAULT_FLOOR_TOLERANCE)
+        entry = budgets.setdefault(args.classifier, {})
+        entry["measured"] = {
+            "accuracy": report["accuracy"]["accuracy"],
+            "per_type": {q_type: result["accuracy"]
+                         for q_type, result in report["accuracy"]["per_type"].items()},
+        }
+        entry.update(floors(report["accuracy"], tolerance))
+        entry.setdefault("max_p99_us", DEFAULT_MAX_P99_US)
+        budgets = dict({"corpus": args.corpus.name, "floor_tolerance": tolerance}, **{
+            key: value for key, value in budgets.items() if key not in ("corpus", "floor_tolerance")
+        })
+        with open(args.budget, 'w') as f:
+            json.dump(budgets, f, indent=2)
+            f.write('\n')
+        budget = entry
+        print(f"💾 Wrote {args.classifier} accuracy floors to {args.budget}", file=sys.stderr)
+
+    violations = check(report, budget)
+    report["budget"] = budget
+    report["violations"] = violations
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        acc = report["accuracy"]
+        print("=" * 70)
+        print(f"CLASSIFIER REGRESSION SUITE ({args.classifier}, {args.corpus.name} "
+              f"[{report['corpus_hash']}], {len(corpus)} questions)")
+        print("=" * 70)
+        measured = budget.get("measured", {}).get("accuracy")
+        baseline = ""
+        if measured is not None:
+            change = "unchanged" if acc["accuracy"] == measured else (
+                "improved, --write-budget to raise the floors" if acc["accuracy"] > measured else "regressed")
+            baseline = f"  (recorded {measured:.1%}: {change})"
+        print(f"Accuracy: {acc['accuracy']:.1%} ({acc['correct']}/{len(corpus)}){baseline}")
+        for q_type, result in acc["per_type"].items():
+            floor = budget.get("min_type_accuracy", {}).get(q_type)
+            floor_text = f"  (floor {floor:.1%})" if floor is not None else ""
+            print(f"   {q_type:<20} {result['accuracy']:>6.1%}  {result['correct']:>3}/{result['total']:<3}"
+                  f"{floor_text}")
+        if acc["confusion"]:
+            print("\nConfusion:")
+            for transition, count in acc["confusion"].items():
+                print(f"   {transition:<40} {count:>4}")
+            print("\nMisclassified:")
+            for miss in acc["misses"][:MAX_MISSES_SHOWN]:
+                print(f"   {miss['expected']} -> {miss['actual']}: {miss['question'][:60]}")
+
+        print(f"\n{'Latency':<10}{'mean':>11}{'p50':>11}{'p95':>11}{'p99':>11}{'max':>11}")
+        for name, r in report["latency"].items():
+            print(f"{name:<10}" + "".join(f"{r[key]:>9.2f}µs" for key in
+                                          ("mean_us", "p50_us", "p95_us", "p99_us", "max_us")))
+        print(f"\nMemory: {report['memory']['instance_kb']} KB per instance, "
+              f"{report['memory']['warm_kb']} KB after classifying the corpus")
+        print("=" * 70)
+        if violations:
+            print(f"❌ {len(violations)} budget violation(s):")
+            for violation in violations:
+                print(f"   {violation}")
+        else:
+            print(f"✅ Within budget (p99 ≤ {budget.get('max_p99_us', DEFAULT_MAX_P99_US):.0f}µs)")
+
+    if violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Classifier Pattern Matching Benchmark
+
+Compares QuestionClassifier.classify() with the compiled PatternMatcher
+against the previous engine (re.search() on each pattern string in turn)
+as the pattern set grows:
+
+- The real patterns are used as-is (x1), then grown with synthetic
+  categories (each real pattern behind a distinct leading word), so larger
+  sets behave like more rules that mostly do not match
+- Both engines classify the same questions and must return identical
+  results (type, confidence, matched_patterns, reasoning)
+- Reports microseconds per question and the speedup for each size
+
+Usage:
+    python3 benchmarks/bench_classifier_patterns.py [--sizes 1,2,4,8,16] [--rounds 200]
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PLUGIN_ROOT / "agent-system"))
+
+from question_classifier import QuestionClassifier  # noqa: E402
+
+SAMPLE_QUESTIONS = [
+    "Should we use MongoDB or PostgreSQL?",
+    "Which is better: React or Vue?",
+    "What's the best database for our project?",
+    "Can I delete /tmp/test?",
+    "Is it safe to modify user.py?",
+    "Are there tests for this function?",
+    "What are my options for file uploads?",
+    "Help me decide between AWS and Azure",
+    "Pros and cons of microservices?",
+    "How should we structure the monorepo packages?",
+    "What is the performance impact of adding this index?",
+    "go",
+    "continue",
+    "yes, option 2",
+    "Implement the invoice PDF export for the landlord dashboard, reuse the "
+    "existing pdfService, add pagination to the tenant list and update the docs.",
+    "The deploy failed again with a timeout in the migration step, can you look?",
+]
+
+
+class SequentialMatcher:
+    """The previous engine: re.search() on every pattern string in turn"""
+
+    def __init__(self, groups):
+        self.groups = groups
+
+    def first_match(self, question):
+        return 0
+
+    def matched(self, group, question, start=0):
+        matched = []
+        for category, patterns in self.groups[group].items():
+            for pattern in patterns:
+                if re.search(pattern, question):
+                    matched.append(f"{group}.{category}")
+        return matched
+
+
+def grow(classifier: QuestionClassifier, factor: int):
+    """Add (factor - 1) synthetic copies of every category"""
+    for patterns in (classifier.hybrid_patterns, classifier.decision_patterns,
+                     classifier.factual_patterns):
+        for category, originals in list(patterns.items()):
+            for copy in range(1, factor):
+                patterns[f"{category}_{copy}"] = [
+                    rf"\bv{copy}\s+{pattern[2:]}" if pattern.startswith(r"\b") else rf"v{copy}\s+{pattern}"
+                    for pattern in originals
+                ]
+    classifier.compile_patterns()
+
+
+def time_classify(classifier: QuestionClassifier, questions: list, rounds: int) -> float:
+    """Mean microseconds per classify() call"""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for question in questions:
+            classifier.classify(question)
+    return (time.perf_counter() - started) / (rounds * len(questions)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark classifier pattern matching")
+    parser.add_argument("--sizes", default="1,2,4,8,16",
+                        help="Pattern set sizes as multiples of the real set (default 1,2,4,8,16)")
+    parser.add_argument("--rounds", type=int, default=200, help="Passes over the questions (default 200)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for factor in (int(size) for size in args.sizes.split(",")):
+        # Uncached, so every call measures the matcher
+        compiled = QuestionClassifier(cache_size=0)
+        grow(compiled, factor)
+        sequential = QuestionClassifier(cache_size=0)
+        grow(sequential, factor)
+        sequential.matcher = SequentialMatcher({
+            "hybrid": sequential.hybrid_patterns,
+            "decision": sequential.decision_patterns,
+            "factual": sequential.factual_patterns,
+        })
+
+        for question in SAMPLE_QUESTIONS:
+            expected = sequential.classify(question)
+            actual = compiled.classify(question)
+            if actual != expected:
+                print(f"❌ Results differ for {question!r} at x{factor}:\n"
+                      f"   sequential: {expected}\n   compiled:   {actual}", file=sys.stderr)
+                sys.exit(1)
+
+        sequential_us = time_classify(sequential, SAMPLE_QUESTIONS, args.rounds)
+        compiled_us = time_classify(compiled, SAMPLE_QUESTIONS, args.rounds)
+        results.append({
+            "patterns": compiled.get_pattern_stats()["total_patterns"],
+            "sequential_us": round(sequential_us, 2),
+            "compiled_us": round(compiled_us, 2),
+            "speedup": round(sequential_us / compiled_us, 1),
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("=" * 70)
+    print(f"CLASSIFIER PATTERN MATCHING ({len(SAMPLE_QUESTIONS)} questions, identical results)")
+    print("=" * 70)
+    print(f"{'Patterns':>10}{'re.search loop':>20}{'compiled':>16}{'speedup':>12}")
+    for r in results:
+        print(f"{r['patterns']:>10}{r['sequential_us']:>16.2f}µs/q{r['compiled_us']:>12.2f}µs/q"
+              f"{r['speedup']:>11.1f}x")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Hook Startup Benchmark
+
+Measures the cold-start cost of the UserPromptSubmit hook, one fresh
+interpreter per run (exactly how Claude Code invokes it):
+
+- baseline:     `python3 -c pass` (interpreter floor)
+- pass-through: a long instruction prompt that the filters reject
+- intercept:    import + construct the orchestrator (what a qualifying
+                prompt pays before any agent work)
+- learned hit:  full hook run answering from the knowledge base
+
+The hook and agent-system sources are copied into a throwaway plugin dir so
+the real knowledge base and logs are never touched.
+
+Usage:
+    python3 benchmarks/bench_hook_startup.py [--runs 20]
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent
+
+PASS_THROUGH_PROMPT = (
+    "Implement the invoice PDF export for the landlord dashboard, reuse the "
+    "existing pdfService, add pagination to the tenant list and update the docs."
+)
+LEARNED_PROMPT = "ok"
+
+INTERCEPT_SNIPPET = """
+import sys
+sys.path.insert(0, {hooks!r})
+from user_prompt_submit import UserPromptInterceptor
+UserPromptInterceptor().orchestrator
+"""
+
+
+def make_sandbox() -> Path:
+    """Copy the plugin's Python sources into an empty temp plugin dir"""
+    sandbox = Path(tempfile.mkdtemp(prefix="hook-bench-"))
+    for sub in ("hooks", "agent-system"):
+        (sandbox / sub).mkdir()
+        for source in (PLUGIN_ROOT / sub).glob("*.py"):
+            shutil.copy(source, sandbox / sub / source.name)
+    return sandbox
+
+
+def time_command(cmd, stdin_text: str, env: dict, runs: int) -> list:
+    """Run a command `runs` times and return wall-clock times in ms"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, input=stdin_text.encode(), env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(name: str, timings: list) -> dict:
+    return {
+        "name": name,
+        "runs": len(timings),
+        "min_ms": round(min(timings), 1),
+        "median_ms": round(statistics.median(timings), 1),
+        "max_ms": round(max(timings), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark UserPromptSubmit hook startup")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per scenario (default 20)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    sandbox = make_sandbox()
+    hook = str(sandbox / "hooks" / "user_prompt_submit.py")
+    env = dict(os.environ)
+    # Never talk to a real daemon during the benchmark
+    env["AUTO_AGENTS_DAEMON_SOCKET"] = str(sandbox / "no-daemon.sock")
+
+    try:
+        # Seed the sandbox KB so the learned-hit scenario has something to hit
+        subprocess.run([sys.executable, hook], input=json.dumps({"prompt": LEARNED_PROMPT}).encode(),
+                       env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+
+        results = [
+            summarize("baseline", time_command(
+                [sys.executable, "-c", "pass"], "", env, args.runs)),
+            summarize("pass-through", time_command(
+                [sys.executable, hook], json.dumps({"prompt": PASS_THROUGH_PROMPT}), env, args.runs)),
+            summarize("intercept (import+construct)", time_command(
+                [sys.executable, "-c", INTERCEPT_SNIPPET.format(hooks=str(sandbox / "hooks"))],
+                "", env, args.runs)),
+            summarize("learned hit", time_command(
+                [sys.executable, hook], json.dumps({"prompt": LEARNED_PROMPT}), env, args.runs)),
+        ]
+    finally:
+        shutil.rmtree(sandbox, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("=" * 70)
+    print("HOOK STARTUP BENCHMARK")
+    print("=" * 70)
+    print(f"{'Scenario':<32}{'min':>10}{'median':>12}{'max':>10}")
+    for r in results:
+        print(f"{r['name']:<32}{r['min_ms']:>8.1f}ms{r['median_ms']:>10.1f}ms{r['max_ms']:>8.1f}ms")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Question Model Benchmark
+
+Compares the hashed-feature model (agent-system/hashed_classifier.py) with
+the regex QuestionClassifier:
+
+- agreement: share of questions both give the same type, overall and per
+  regex type, on held-out questions (every 5th by hash) and on the whole
+  corpus; plus the confusion counts
+- latency: per-question p50/p95 of the regex rules (uncached) and of the
+  model, and how each scales as the rule set grows (the model's cost does
+  not depend on it)
+
+The corpus is the Q&A history of --agents-dir plus the benchmark sample
+questions and any --corpus files (JSON lines with a "question" field, or
+plain text lines). Unless --model-file is given, a model is trained in
+memory on the non-held-out part; nothing is written.
+
+Usage:
+    python3 benchmarks/bench_question_model.py [--corpus more.jsonl] [--json]
+"""
+
+import sys
+import json
+import time
+import zlib
+import argparse
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PLUGIN_ROOT / "agent-system"))
+
+from question_classifier import QuestionClassifier  # noqa: E402
+from hashed_classifier import HashedFeatureModel, train, training_examples, DEFAULT_DIM  # noqa: E402
+from bench_classifier_patterns import SAMPLE_QUESTIONS, grow  # noqa: E402
+
+HOLDOUT_EVERY = 5
+
+
+def read_corpus(path: Path) -> list:
+    """Questions from a JSON lines ({"question": ...}) or plain text file"""
+    questions = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                questions.append(line)
+                continue
+            if isinstance(record, dict) and record.get("question"):
+                questions.append(record["question"])
+    return questions
+
+
+def is_held_out(question: str) -> bool:
+    return zlib.crc32(question.lower().strip().encode()) % HOLDOUT_EVERY == 0
+
+
+def latency_us(classify, questions: list, rounds: int) -> dict:
+    """p50/p95/mean microseconds per call"""
+    timings = []
+    for _ in range(rounds):
+        for question in questions:
+            started = time.perf_counter()
+            classify(question)
+            timings.append((time.perf_counter() - started) * 1e6)
+    timings.sort()
+    return {
+        "mean_us": round(sum(timings) / len(timings), 2),
+        "p50_us": round(timings[len(timings) // 2], 2),
+        "p95_us": round(timings[int(len(timings) * 0.95)], 2),
+    }
+
+
+def agreement(model, regex: QuestionClassifier, questions: list) -> dict:
+    """Share of questions the model labels like the regex rules"""
+    confusion = {}
+    per_type = {}
+    agreed = 0
+    for question in questions:
+        expected = regex.classify(question).question_type.value
+        actual = model.classify(question).question_type.value
+        agreed += expected == actual
+        counts = per_type.setdefault(expected, [0, 0])
+        counts[0] += expected == actual
+        counts[1] += 1
+        key = f"{expected} -> {actual}"
+        confusion[key] = confusion.get(key, 0) + 1
+    return {
+        "questions": len(questions),
+        "agreement": round(agreed / len(questions), 4) if questions else 0.0,
+        "per_type": {q_type: round(hits / total, 4) for q_type, (hits, total) in sorted(per_type.items())},
+        "confusion": dict(sorted(confusion.items(), key=lambda item: -item[1])),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the question model with the regex classifier")
+    parser.add_argument("--agents-dir", type=Path, default=PLUGIN_ROOT / "agent-system",
+                        help="Q&A history to train and evaluate on (default: agent-system/)")
+    parser.add_argument("--corpus", type=Path, action="append", default=[],
+                        help="Extra questions (JSON lines or text; repeatable)")
+    parser.add_argument("--model-file", type=Path, default=None,
+                        help="Evaluate this trained model instead of training one")
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM)
+    parser.add_argument("--sizes", default="1,4,16", help="Rule set sizes for the scaling table (default 1,4,16)")
+    parser.add_argument("--rounds", type=int, default=20, help="Latency passes over the corpus (default 20)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    regex = QuestionClassifier(cache_size=0)
+    history = list(training_examples(args.agents_dir, regex))
+    extra = list(SAMPLE_QUESTIONS)
+    for path in args.corpus:
+        extra.extend(read_corpus(path))
+    examples = history + [(question, regex.classify(question).question_type.value, 1.0)
+                          for question in extra]
+    questions = [question for question, _, _ in examples]
+    held_out = [question for question in questions if is_held_out(question)]
+
+    if args.model_file:
+        model = HashedFeatureModel.load(args.model_file, budget_file=None)
+    else:
+        model = train((example for example in examples if not is_held_out(example[0])), dim=args.dim)
+
+    results = {
+        "corpus": len(questions),
+        "model": dict(model.metadata, dim=model.dim),
+        "held_out": agreement(model, regex, held_out),
+        "all": agreement(model, regex, questions),
+        "latency": {
+            "regex": latency_us(regex.classify, questions, args.rounds),
+            "model": latency_us(model.classify, questions, args.rounds),
+        },
+        "scaling": [],
+    }
+    for factor in (int(size) for size in args.sizes.split(",")):
+        grown = QuestionClassifier(cache_size=0)
+        grow(grown, factor)
+        results["scaling"].append({
+            "patterns": grown.get_pattern_stats()["total_patterns"],
+            "regex_us": latency_us(grown.classify, questions, max(1, args.rounds // 4))["mean_us"],
+            "model_us": results["latency"]["model"]["mean_us"],
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("=" * 70)
+    print(f"QUESTION MODEL vs REGEX ({len(questions)} questions, {len(held_out)} held out)")
+    print("=" * 70)
+    for name in ("held_out", "all"):
+        r = results[name]
+        print(f"Agreement ({name}): {r['agreement']:.0%} of {r['questions']}")
+        for q_type, rate in r["per_type"].items():
+            print(f"   {q_type:<20} {rate:>6.0%}")
+    print(f"\n{'Latency':<10}{'mean':>12}{'p50':>12}{'p95':>12}")
+    for name, r in results["latency"].items():
+        print(f"{name:<10}{r['mean_us']:>10.2f}µs{r['p50_us']:>10.2f}µs{r['p95_us']:>10.2f}µs")
+    print(f"\n{'Patterns':>10}{'regex':>14}{'model':>14}")
+    for r in results["scaling"]:
+        print(f"{r['patterns']:>10}{r['regex_us']:>12.2f}µs{r['model_us']:>12.2f}µs")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Replay Benchmark
+
+Replays recorded traffic through the question path against a throwaway
+agents dir and reports how it performed:
+
+- traffic:  qa_logs/all_questions.jsonl, qa_logs segments (and per-choice
+            files) and interception_log.jsonl, de-duplicated by choice ID
+            and replayed in time order
+- targets:  "hook" runs UserPromptInterceptor.process_prompt (filters
+            included), "orchestrator" runs AutonomousOrchestrator.process_question
+- metrics:  throughput, latency percentiles, knowledge base hit rate and
+            bytes written per question
+
+--scale N (10-1000) amplifies the traffic to N times its size: the recorded
+questions are replayed first, then fixed-seed synthetic traffic, which
+repeats recorded questions and mixes in variants that the knowledge base
+has not seen. The same --seed always produces the same traffic.
+
+The sources are copied into a throwaway plugin dir, so the real knowledge
+base and logs are only read, never written.
+
+Usage:
+    python3 benchmarks/bench_replay.py [--scale 100] [--seed 42]
+    python3 benchmarks/bench_replay.py --output before.json
+    python3 benchmarks/bench_replay.py --baseline before.json   # exit 1 on regression
+"""
+
+import os
+import sys
+import json
+import math
+import random
+import shutil
+import asyncio
+import argparse
+import platform
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent
+AGENTS_DIR = PLUGIN_ROOT / "agent-system"
+
+TARGETS = ("hook", "orchestrator")
+REPORT_VERSION = 1
+
+# Variant suffixes for synthetic questions the knowledge base has not seen
+VARIANT_CONTEXTS = (
+    "for the billing service", "in the mobile app", "for the admin dashboard",
+    "on the staging cluster", "for the reporting pipeline", "in the public API",
+)
+
+# Metrics compared against a baseline report: (key, higher_is_better)
+COMPARED_METRICS = (
+    ("throughput_qps", True),
+    ("p95_ms", False),
+    ("bytes_written_per_question", False),
+)
+
+
+def make_sandbox() -> Path:
+    """Copy the plugin's Python sources into an empty temp plugin dir"""
+    sandbox = Path(tempfile.mkdtemp(prefix="replay-bench-"))
+    for sub in ("hooks", "agent-system"):
+        (sandbox / sub).mkdir()
+        for source in (PLUGIN_ROOT / sub).glob("*.py"):
+            shutil.copy(source, sandbox / sub / source.name)
+    return sandbox
+
+
+def _read_jsonl(path: Path):
+    if not path.exists():
+        return
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def load_traffic(agents_dir: Path) -> list:
+    """
+    Recorded questions in time order
+
+    Args:
+        agents_dir: The agent-system dir holding qa_logs/ and interception_log.jsonl
+
+    Returns:
+        [{"question", "timestamp", "source"}], one per distinct choice
+    """
+    from qa_log import QALog, LEGACY_MASTER_LOG
+
+    qa_dir = agents_dir / "qa_logs"
+    sources = [("qa_log", _read_jsonl(qa_dir / LEGACY_MASTER_LOG))]
+    if qa_dir.exists():
+        sources.append(("qa_log", QALog(qa_dir).iter_records()))
+    sources.append(("interception_log", _read_jsonl(agents_dir / "interception_log.jsonl")))
+
+    traffic, seen = [], set()
+    for source, records in sources:
+        for record in records:
+            question = record.get("question")
+            if not question:
+                continue
+            details = record.get("choice") or record.get("decision") or {}
+            key = details.get("choice_id") or (record.get("timestamp"), question)
+            if key in seen:
+                continue
+            seen.add(key)
+            traffic.append({"question": question,
+                            "timestamp": record.get("timestamp", ""),
+                            "source": source})
+    traffic.sort(key=lambda item: item["timestamp"])
+    return traffic
+
+
+def amplify(questions: list, scale: int, seed: int, novel_ratio: float) -> list:
+    """
+    The recorded questions followed by (scale - 1) times as many synthetic ones
+
+    Args:
+        questions: Recorded questions in replay order
+        scale: Total size as a multiple of the recorded traffic
+        seed: Random seed (same seed, same traffic)
+        novel_ratio: Share of synthetic questions that are unseen variants
+
+    Returns:
+        Questions to replay
+    """
+    rng = random.Random(seed)
+    replay = list(questions)
+    for n in range(len(questions) * (scale - 1)):
+        question = rng.choice(questions)
+        if rng.random() < novel_ratio:
+            question = f"{question.rstrip('?')} {rng.choice(VARIANT_CONTEXTS)} #{n}?"
+        replay.append(question)
+    return replay
+
+
+def process_write_bytes() -> int:
+    """Bytes this process has passed to write() so far, or -1 if unknown"""
+    try:
+        with open("/proc/self/io", 'r') as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return -1
+
+
+def dir_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * pct / 100))
+    return sorted_values[rank - 1]
+
+
+def run_target(target: str, questions: list, sandbox: Path) -> dict:
+    """
+    Replay questions through one entry point
+
+    Args:
+        target: "hook" or "orchestrator"
+        questions: Questions to replay, in order
+        sandbox: Throwaway plugin dir (its sources are already importable)
+
+    Returns:
+        Metrics for the run
+    """
+    from events import NullSink
+    from log_writer import get_log_writer
+    from user_prompt_submit import UserPromptInterceptor
+    from autonomous_orchestrator_enhanced import AutonomousOrchestrator
+
+    if target == "hook":
+        # The hook's orchestrator lives in the sandbox's agent-system dir
+        interceptor = UserPromptInterceptor(confidence_threshold=0.7)
+        orchestrator = interceptor.orchestrator
+        agents_dir = sandbox / "agent-system"
+        requests = [json.dumps({"prompt": question}) for question in questions]
+        handle = interceptor.process_prompt
+    else:
+        agents_dir = sandbox / "orchestrator-run"
+        orchestrator = AutonomousOrchestrator(agents_dir=agents_dir, events=NullSink())
+        requests = questions
+        handle = orchestrator.process_question
+
+    log_writer = get_log_writer()
+    log_writer.flush()
+    size_before = dir_size(agents_dir)
+    written_before = process_write_bytes()
+
+    async def replay() -> list:
+        latencies = []
+        for request in requests:
+            started = time.perf_counter()
+            await handle(request)
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    started = time.perf_counter()
+    latencies = asyncio.run(replay())
+    orchestrator.knowledge_base.flush()
+    log_writer.flush()
+    elapsed = time.perf_counter() - started
+
+    written_after = process_write_bytes()
+    size_after = dir_size(agents_dir)
+    orchestrator.knowledge_base.close()
+
+    count = len(questions)
+    stats = orchestrator.stats
+    latencies_ms = sorted(seconds * 1000 for seconds in latencies)
+    return {
+        "target": target,
+        "questions": count,
+        # Hook only: prompts that passed the filters and reached the orchestrator
+        "intercepted": stats["total_questions"],
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_qps": round(count / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(sum(latencies_ms) / count, 4) if count else 0.0,
+        "p50_ms": round(percentile(latencies_ms, 50), 4),
+        "p95_ms": round(percentile(latencies_ms, 95), 4),
+        "p99_ms": round(percentile(latencies_ms, 99), 4),
+        "max_ms": round(latencies_ms[-1], 4) if latencies_ms else 0.0,
+        "kb_hit_rate": round(stats["learned_answers_used"] / stats["total_questions"], 4)
+        if stats["total_questions"] else 0.0,
+        "negative_cache_hit_rate": round(stats["negative_cache_hits"] / stats["total_questions"], 4)
+        if stats["total_questions"] else 0.0,
+        "agent_decisions": stats["agent_decisions"],
+        # write() bytes of the whole process (includes the background log writer)
+        "bytes_written_per_question": round((written_after - written_before) / count, 1)
+        if count and written_before >= 0 else None,
+        "disk_growth_per_question": round((size_after - size_before) / count, 1) if count else 0.0,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Metrics that got worse than the baseline by more than the tolerance
+
+    Args:
+        report: This run's report
+        baseline: An earlier report (same scale and seed for a fair comparison)
+        tolerance: Allowed relative change, e.g. 0.25 for 25%
+
+    Returns:
+        [{"target", "metric", "baseline", "current", "change"}]
+    """
+    regressions = []
+    previous = {result["target"]: result for result in baseline.get("results", [])}
+    for result in report["results"]:
+        before = previous.get(result["target"])
+        if before is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS:
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append({"target": result["target"], "metric": metric,
+                                    "baseline": old, "current": new,
+                                    "change": round(change, 4)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded questions and measure the question path")
+    parser.add_argument("--agents-dir", type=Path, default=AGENTS_DIR,
+                        help="Where the recorded logs are read from (default: agent-system/)")
+    parser.add_argument("--target", choices=TARGETS + ("both",), default="both")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="Replay N times the recorded traffic (default 1 = recorded only)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for synthetic traffic (default 42)")
+    parser.add_argument("--novel-ratio", type=float, default=0.2,
+                        help="Share of synthetic questions the knowledge base has not seen (default 0.2)")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, default=None,
+                        help="Compare against an earlier report; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative regression against the baseline (default 0.25)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if args.scale < 1:
+        parser.error("--scale must be at least 1")
+
+    sandbox = make_sandbox()
+    sys.path.insert(0, str(sandbox / "hooks"))
+    sys.path.insert(0, str(sandbox / "agent-system"))
+    # Never prompt, print banners or emit events during the replay
+    os.environ.pop("AUTO_AGENTS_EVENTS", None)
+
+    try:
+        traffic = load_traffic(args.agents_dir)
+        if not traffic:
+            print(f"📭 No recorded questions under {args.agents_dir}", file=sys.stderr)
+            sys.exit(1)
+        questions = amplify([item["question"] for item in traffic],
+                            args.scale, args.seed, args.novel_ratio)
+        targets = TARGETS if args.target == "both" else (args.target,)
+        results = [run_target(target, questions, sandbox) for target in targets]
+    finally:
+        shutil.rmtree(sandbox, ignore_errors=True)
+
+    report = {
+        "version": REPORT_VERSION,
+        "created": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "scale": args.scale,
+        "seed": args.seed,
+        "novel_ratio": args.novel_ratio,
+        "recorded_questions": len(traffic),
+        "sources": {source: sum(1 for item in traffic if item["source"] == source)
+                    for source in sorted({item["source"] for item in traffic})},
+        "results": results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if (baseline.get("scale"), baseline.get("seed")) != (args.scale, args.seed):
+            print("⚠️  Baseline was recorded with a different --scale/--seed", file=sys.stderr)
+        regressions = compare(report, baseline, args.tolerance)
+        report["baseline"] = str(args.baseline)
+        report["regressions"] = regressions
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("=" * 100)
+        print(f"REPLAY BENCHMARK - {len(questions)} questions "
+              f"({len(traffic)} recorded, scale {args.scale}x, seed {args.seed})")
+        print("=" * 100)
+        print(f"{'Target':<14}{'q/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"
+              f"{'KB hits':>10}{'bytes/q':>12}{'growth/q':>12}")
+        for r in results:
+            written = r["bytes_written_per_question"]
+            print(f"{r['target']:<14}{r['throughput_qps']:>10.1f}{r['p50_ms']:>8.2f}ms{r['p95_ms']:>8.2f}ms"
+                  f"{r['p99_ms']:>8.2f}ms{r['max_ms']:>8.2f}ms{r['kb_hit_rate']:>10.0%}"
+                  f"{(f'{written:.0f}' if written is not None else 'n/a'):>12}"
+                  f"{r['disk_growth_per_question']:>12.0f}")
+        print("=" * 100)
+        if args.output:
+            print(f"📄 Report: {args.output}")
+        if args.baseline:
+            if regressions:
+                print(f"❌ {len(regressions)} regression(s) against {args.baseline}:")
+                for r in regressions:
+                    print(f"   {r['target']} {r['metric']}: {r['baseline']} -> {r['current']} "
+                          f"({r['change']:+.0%})")
+            else:
+                print(f"✅ No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
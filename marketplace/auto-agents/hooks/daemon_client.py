@@ -0,0 +1,128 @@
+"""
+Prompt Daemon Client - Thin stdlib-only transport
+
+Shared by the UserPromptSubmit hook (client side) and prompt_daemon.py
+(server side). Deliberately imports nothing from agent-system so the hook
+can talk to a warm daemon without paying the orchestrator import cost.
+
+Protocol: one newline-terminated JSON request per connection, answered by
+one newline-terminated JSON response.
+    request:  {"command": "prompt", "prompt": "<raw hook stdin>"}
+    response: {"ok": true, "context": "<injection text>" | null}
+"""
+
+import os
+import json
+import socket
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+PLUGIN_ROOT = Path(__file__).parent.parent
+
+# Environment override for the socket location
+SOCKET_ENV_VAR = "AUTO_AGENTS_DAEMON_SOCKET"
+
+# New questions take ~1s in the orchestrator; leave generous headroom
+DEFAULT_TIMEOUT = 10.0
+
+
+def default_socket_path() -> Path:
+    """
+    Socket path for this plugin installation
+
+    Unix socket paths are limited to ~100 characters, so the socket lives
+    in the temp dir and is keyed by a hash of the plugin root instead of
+    sitting next to the (possibly deeply nested) plugin files.
+    """
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+
+    root_hash = hashlib.md5(str(PLUGIN_ROOT.resolve()).encode()).hexdigest()[:12]
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"auto-agents-{uid}-{root_hash}.sock"
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode a protocol message as a single JSON line"""
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> Optional[Dict[str, Any]]:
+    """Decode a protocol line, returning None if it is not a JSON object"""
+    try:
+        message = json.loads(line.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def send_request(message: Dict[str, Any], socket_path: Path = None,
+                 timeout: float = DEFAULT_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to the daemon
+
+    Args:
+        message: Protocol request
+        socket_path: Daemon socket (defaults to default_socket_path())
+        timeout: Seconds to wait for the response
+
+    Returns:
+        The daemon's response, or None if no daemon is listening.
+        If the daemon accepted the request but did not answer in time,
+        an empty non-injecting response is returned instead of None so the
+        caller does not process the same prompt a second time.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    path = socket_path or default_socket_path()
+    if not path.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(str(path))
+            sock.sendall(encode_message(message))
+        except OSError:
+            # Stale socket file or daemon not accepting - use fallback
+            return None
+
+        chunks = []
+        try:
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        except OSError:
+            return {"ok": False, "context": None, "error": "daemon timeout"}
+    finally:
+        sock.close()
+
+    response = decode_message(b"".join(chunks))
+    if response is None:
+        return {"ok": False, "context": None, "error": "malformed daemon response"}
+    return response
+
+
+def query_daemon(user_prompt_raw: str, socket_path: Path = None,
+                 timeout: float = DEFAULT_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """
+    Ask a running daemon to process a prompt
+
+    Returns:
+        Response dict with "context" (injection text or None), or None if
+        the daemon is not running and the caller should process in-process.
+    """
+    return send_request(
+        {"command": "prompt", "prompt": user_prompt_raw},
+        socket_path=socket_path,
+        timeout=timeout
+    )
@@ -11,6 +11,8 @@ Purpose: Eliminate permission prompts while maintaining security audit trail
 
 import sys
 import json
+import time
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
@@ -19,6 +21,20 @@ PLUGIN_ROOT = Path(__file__).parent.parent
 SECURITY_LOG = PLUGIN_ROOT / "agent-system" / "security_logs"
 SECURITY_LOG.mkdir(parents=True, exist_ok=True)
 
+# Shared background log writer and tracing live with the agent system; if
+# they cannot be imported, log synchronously and still pass tool calls through
+sys.path.insert(0, str(PLUGIN_ROOT / "agent-system"))
+try:
+    from log_writer import get_log_writer
+    from tracing import get_tracer
+except Exception:
+    get_log_writer = get_tracer = None
+
+
+def span(name: str):
+    """A tracing span, or a no-op when tracing is unavailable"""
+    return get_tracer().span(name) if get_tracer is not None else nullcontext()
+
 
 class SecurityAgent:
     """
@@ -27,6 +43,7 @@ class SecurityAgent:
 
     def __init__(self):
         self.log_file = SECURITY_LOG / f"security_log_{datetime.now().strftime('%Y%m%d')}.jsonl"
+        self.log_writer = get_log_writer() if get_log_writer is not None else None
 
     def evaluate_tool_use(self, tool_data: dict) -> dict:
         """
@@ -141,9 +158,12 @@ class SecurityAgent:
             "session_id": tool_data.get("session_id", "unknown")
         }
 
-        # Append to daily log file
-        with open(self.log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        # Append to daily log file (background writer, flushed at exit)
+        if self.log_writer is None:
+            with open(self.log_file, 'a') as f:
+                f.write(json.dumps(log_entry) + '\n')
+            return
+        self.log_writer.append(self.log_file, json.dumps(log_entry) + '\n')
 
 
 def main():
@@ -167,10 +187,12 @@ def main():
         agent = SecurityAgent()
 
         # Evaluate the tool use
-        decision = agent.evaluate_tool_use(tool_data)
+        with span("pre_tool_use.evaluate"):
+            decision = agent.evaluate_tool_use(tool_data)
 
         # Log the decision
-        agent.log_decision(tool_data, decision)
+        with span("pre_tool_use.log"):
+            agent.log_decision(tool_data, decision)
 
         # Output decision to Claude Code
         # If approved, output nothing (auto-approve)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Prompt Daemon - Warm backend for the UserPromptSubmit hook
+
+Opt-in long-lived process that keeps an AutonomousOrchestrator and
+UserPromptInterceptor loaded, so each prompt costs one socket round-trip
+instead of a fresh interpreter, the agent-system imports and a full
+knowledge base load.
+
+The hook connects to the daemon when its socket exists and falls back to
+in-process handling when it does not, so starting the daemon is optional.
+
+Usage:
+    python3 hooks/prompt_daemon.py            # Serve (foreground)
+    python3 hooks/prompt_daemon.py status     # Check if running
+    python3 hooks/prompt_daemon.py stop       # Ask running daemon to exit
+"""
+
+import os
+import sys
+import signal
+import asyncio
+import argparse
+from pathlib import Path
+
+from daemon_client import (
+    default_socket_path, encode_message, decode_message, send_request
+)
+from user_prompt_submit import UserPromptInterceptor
+from tracing import get_tracer
+
+
+class PromptDaemon:
+    """
+    Serves hook requests from a single warm UserPromptInterceptor
+
+    Requests are processed one at a time: the orchestrator keeps session
+    state and writes the knowledge base, so it is not safe to run two
+    prompts through it concurrently.
+    """
+
+    def __init__(self, socket_path: Path = None, confidence_threshold: float = 0.7):
+        """
+        Initialize the daemon
+
+        Args:
+            socket_path: Unix socket to listen on (defaults to default_socket_path())
+            confidence_threshold: Minimum confidence to inject answer (default 70%)
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.interceptor = UserPromptInterceptor(confidence_threshold=confidence_threshold)
+        self.tracer = get_tracer()
+        self._lock = None
+        self._server = None
+        self._stopped = None
+
+        # Warm up now rather than on the first prompt. The knowledge base
+        # is read live from SQLite, so other processes' writes are visible.
+        self.interceptor.orchestrator
+
+    async def handle_prompt(self, user_prompt_raw: str):
+        """Process one prompt and return the injection text (or None)"""
+        async with self._lock:
+            with self.tracer.span("daemon.handle_prompt"):
+                agent_response = await self.interceptor.process_prompt(user_prompt_raw)
+
+        if not agent_response:
+            return None
+        return self.interceptor.format_context_injection(agent_response)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """Handle one client connection (one request, one response)"""
+        try:
+            line = await reader.readline()
+            request = decode_message(line)
+
+            if request is None:
+                response = {"ok": False, "context": None, "error": "malformed request"}
+            elif request.get("command") == "ping":
+                response = {"ok": True, "pid": os.getpid()}
+            elif request.get("command") == "shutdown":
+                response = {"ok": True}
+                self._stopped.set()
+            elif request.get("command", "prompt") == "prompt":
+                try:
+                    context = await self.handle_prompt(request.get("prompt", ""))
+                    response = {"ok": True, "context": context}
+                except Exception as e:
+                    print(f"⚠️  Daemon error processing prompt: {e}", file=sys.stderr)
+                    response = {"ok": False, "context": None, "error": str(e)}
+            else:
+                response = {"ok": False, "context": None,
+                            "error": f"unknown command: {request.get('command')}"}
+
+            writer.write(encode_message(response))
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self):
+        """Listen on the socket until stopped"""
+        if send_request({"command": "ping"}, self.socket_path, timeout=1.0):
+            print(f"⚠️  Daemon already running on {self.socket_path}", file=sys.stderr)
+            return
+
+        # Remove a stale socket left behind by a crashed daemon
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        self._lock = asyncio.Lock()
+        self._stopped = asyncio.Event()
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self.socket_path)
+        )
+        os.chmod(self.socket_path, 0o600)
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stopped.set)
+
+        print(f"🤖 Prompt daemon listening on {self.socket_path} (pid {os.getpid()})",
+              file=sys.stderr)
+
+        try:
+            await self._stopped.wait()
+        finally:
+            self._server.close()
+            await self._server.wait_closed()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            print("🛑 Prompt daemon stopped", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm backend for the UserPromptSubmit hook")
+    parser.add_argument("action", nargs="?", default="serve",
+                        choices=["serve", "status", "stop"])
+    parser.add_argument("--socket", type=Path, default=None,
+                        help="Unix socket path (default: per-plugin path in temp dir)")
+    args = parser.parse_args()
+
+    socket_path = args.socket or default_socket_path()
+
+    if args.action == "status":
+        response = send_request({"command": "ping"}, socket_path, timeout=1.0)
+        if response and response.get("ok"):
+            print(f"✅ Running (pid {response.get('pid')}) on {socket_path}")
+            sys.exit(0)
+        print(f"❌ Not running ({socket_path})")
+        sys.exit(1)
+
+    if args.action == "stop":
+        response = send_request({"command": "shutdown"}, socket_path, timeout=1.0)
+        print("🛑 Stop requested" if response else "❌ Not running")
+        sys.exit(0)
+
+    asyncio.run(PromptDaemon(socket_path=socket_path).serve())
+
+
+if __name__ == "__main__":
+    main()
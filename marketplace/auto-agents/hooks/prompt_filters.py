@@ -0,0 +1,153 @@
+"""
+Prompt Filters - Cheap pass-through checks for the UserPromptSubmit hook
+
+Decides whether a prompt should reach the agent system at all. Kept free of
+agent-system (and asyncio) imports so the hook can reject most prompts in a
+few milliseconds, before anything heavy is loaded.
+"""
+
+import json
+
+# Phrases that mean the USER is asking Claude something
+QUESTION_INDICATORS = (
+    '?',
+    'should we',
+    'should i',
+    'can we',
+    'can i',
+    'is it',
+    'would it',
+    'do we',
+    'do i',
+    'what',
+    'how',
+    'which',
+    'when',
+    'where',
+    'why'
+)
+
+# Common answer patterns for operational questions (1-5 word prompts)
+ANSWER_PATTERNS = (
+    # Approval/permission responses
+    'yes', 'no', 'sure', 'okay', 'ok', 'yep', 'nope',
+    'go ahead', 'please do', 'sounds good',
+    'continue', 'proceed', 'skip', 'approve', 'reject',
+
+    # Technology choices
+    'typescript', 'javascript', 'python', 'java', 'go', 'rust',
+    'react', 'vue', 'angular', 'svelte', 'next', 'nuxt',
+    'postgres', 'mongodb', 'mysql', 'redis', 'sqlite',
+    'docker', 'kubernetes', 'aws', 'azure', 'gcp',
+
+    # Option selections
+    'option a', 'option b', 'option c',
+    'option 1', 'option 2', 'option 3',
+    'first one', 'second one', 'third one', 'last one',
+    'first', 'second', 'third',
+
+    # Choice indicators
+    'both', 'neither', 'either', 'all', 'none',
+    'that one', 'this one',
+
+    # File/folder operation responses
+    'create it', 'delete it', 'keep it', 'remove it',
+    'overwrite', 'merge', 'replace'
+)
+
+# Single-word technology/tool names (likely answers)
+SINGLE_WORD_TECH = (
+    'npm', 'yarn', 'pnpm', 'vite', 'webpack',
+    'jest', 'vitest', 'mocha', 'chai',
+    'eslint', 'prettier', 'biome'
+)
+
+# Choice phrases in medium-short responses (6-10 words)
+CHOICE_INDICATORS = (
+    'i prefer', 'i think', 'i choose', 'i\'d like', 'i want',
+    'let\'s use', 'let\'s go with', 'let\'s try',
+    'use the', 'go with', 'pick', 'choose',
+    'sounds good', 'looks good', 'that works',
+    'makes sense', 'i agree'
+)
+
+
+def extract_prompt(user_prompt_raw: str) -> str:
+    """
+    Extract the actual prompt from the hook payload
+
+    Args:
+        user_prompt_raw: The raw prompt (may be JSON from Claude Code)
+
+    Returns:
+        The prompt text
+    """
+    try:
+        prompt_data = json.loads(user_prompt_raw)
+        return prompt_data.get("prompt", user_prompt_raw)
+    except (json.JSONDecodeError, AttributeError):
+        # Not JSON, use as-is
+        return user_prompt_raw
+
+
+def is_user_asking_question(prompt: str) -> bool:
+    """
+    Detect if USER is asking Claude a question (not Claude asking user)
+
+    Args:
+        prompt: User's prompt
+
+    Returns:
+        True if this looks like a user question to Claude
+    """
+    prompt_lower = prompt.lower()
+    return any(indicator in prompt_lower for indicator in QUESTION_INDICATORS)
+
+
+def is_response_to_claude(prompt: str) -> bool:
+    """
+    Detect if user is responding to Claude's question
+
+    This checks for short, answer-like responses that suggest
+    Claude asked the user something and they're answering.
+
+    Common scenarios:
+    - Claude asks: "Should I create folder X?" → User: "yes"
+    - Claude asks: "TypeScript or JavaScript?" → User: "TypeScript"
+    - Claude asks: "Which approach?" → User: "option 1"
+
+    Args:
+        prompt: User's prompt
+
+    Returns:
+        True if this looks like an answer to Claude's question
+    """
+    prompt_lower = prompt.strip().lower()
+    word_count = len(prompt_lower.split())
+
+    # Very short responses (1-5 words - likely answers)
+    if word_count <= 5:
+        if any(pattern in prompt_lower for pattern in ANSWER_PATTERNS):
+            return True
+
+        if word_count == 1 and any(tech in prompt_lower for tech in SINGLE_WORD_TECH):
+            return True
+
+    # Medium-short responses (6-10 words) with choice indicators
+    if word_count <= 10:
+        if any(indicator in prompt_lower for indicator in CHOICE_INDICATORS):
+            return True
+
+    return False
+
+
+def should_intercept(prompt: str) -> bool:
+    """
+    Decide whether a prompt should go to the agent system
+
+    STRATEGY: Only intercept when user is responding to Claude's question.
+    Prompts where the user asks Claude something are left to Claude.
+    """
+    if is_user_asking_question(prompt):
+        return False
+    return is_response_to_claude(prompt)
@@ -10,28 +10,34 @@ Version: 4.0.0
 Integration: Claude Code Plugin System
 """
 
+import os
 import sys
-import json
-import asyncio
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+_STARTED = time.perf_counter()
+
 # Add agent-system directory to path to import orchestrator
 PLUGIN_ROOT = Path(__file__).parent.parent
 AGENT_SYSTEM_DIR = PLUGIN_ROOT / "agent-system"
 sys.path.insert(0, str(AGENT_SYSTEM_DIR))
 
-try:
-    from autonomous_orchestrator_enhanced import AutonomousOrchestrator
-except ImportError as e:
-    # Graceful fallback if orchestrator not available
-    print(f"⚠️  Warning: Could not load autonomous orchestrator: {e}", file=sys.stderr)
-    sys.exit(0)
+# Lightweight module only - daemon client and orchestrator are imported lazily
+import prompt_filters
+
+
+def tracing_enabled() -> bool:
+    """Checked before importing tracing, so pass-through prompts stay cheap"""
+    return os.environ.get("AUTO_AGENTS_TRACE", "") not in ("", "0")
 
 
 class UserPromptInterceptor:
     """
     Intercepts user prompts and provides agent answers when confident
+
+    The orchestrator is only imported and constructed the first time a
+    prompt actually qualifies for interception.
     """
 
     def __init__(self, confidence_threshold: float = 0.7):
@@ -42,117 +48,43 @@ class UserPromptInterceptor:
             confidence_threshold: Minimum confidence to inject answer (default 70%)
         """
         self.confidence_threshold = confidence_threshold
-        self.orchestrator = AutonomousOrchestrator(
-            agents_dir=PLUGIN_ROOT / "agent-system",
-            confidence_threshold=0.6  # Lower threshold for escalation
-        )
-
-    def is_user_asking_question(self, prompt: str) -> bool:
-        """
-        Detect if USER is asking Claude a question (not Claude asking user)
-
-        Args:
-            prompt: User's prompt
-
-        Returns:
-            True if this looks like a user question to Claude
+        self._orchestrator = None
+
+    @property
+    def orchestrator(self):
+        """Lazily import and build the AutonomousOrchestrator"""
+        if self._orchestrator is None:
+            from autonomous_orchestrator_enhanced import AutonomousOrchestrator
+
+            self._orchestrator = AutonomousOrchestrator(
+                agents_dir=PLUGIN_ROOT / "agent-system",
+                confidence_threshold=0.6,  # Lower threshold for escalation
+                events=self._event_sink(),
+                # AUTO_AGENTS_CLASSIFIER=model uses the trained question model
+                classifier=os.environ.get("AUTO_AGENTS_CLASSIFIER", "regex")
+            )
+        return self._orchestrator
+
+    def _event_sink(self):
         """
-        # Simple question detection
-        question_indicators = [
-            '?',
-            'should we',
-            'should i',
-            'can we',
-            'can i',
-            'is it',
-            'would it',
-            'do we',
-            'do i',
-            'what',
-            'how',
-            'which',
-            'when',
-            'where',
-            'why'
-        ]
-
-        prompt_lower = prompt.lower()
-        return any(indicator in prompt_lower for indicator in question_indicators)
+        Null sink by default, JSON events with AUTO_AGENTS_EVENTS=json
 
-    def is_response_to_claude(self, prompt: str) -> bool:
+        Never the console sink: stdout is reserved for the context injection.
         """
-        Detect if user is responding to Claude's question
-
-        This checks for short, answer-like responses that suggest
-        Claude asked the user something and they're answering.
+        from events import make_sink
 
-        Common scenarios:
-        - Claude asks: "Should I create folder X?" → User: "yes"
-        - Claude asks: "TypeScript or JavaScript?" → User: "TypeScript"
-        - Claude asks: "Which approach?" → User: "option 1"
+        if os.environ.get("AUTO_AGENTS_EVENTS") != "json":
+            return make_sink("null")
+        events_file = os.environ.get("AUTO_AGENTS_EVENTS_FILE")
+        return make_sink("json", Path(events_file) if events_file else None)
 
-        Args:
-            prompt: User's prompt
+    def is_user_asking_question(self, prompt: str) -> bool:
+        """Detect if USER is asking Claude a question (see prompt_filters)"""
+        return prompt_filters.is_user_asking_question(prompt)
 
-        Returns:
-            True if this looks like an answer to Claude's question
-        """
-        prompt_lower = prompt.strip().lower()
-        word_count = len(prompt_lower.split())
-
-        # Very short responses (1-5 words - likely answers)
-        if word_count <= 5:
-            # Common answer patterns for operational questions
-            answer_patterns = [
-                # Approval/permission responses
-                'yes', 'no', 'sure', 'okay', 'ok', 'yep', 'nope',
-                'go ahead', 'please do', 'sounds good',
-                'continue', 'proceed', 'skip', 'approve', 'reject',
-
-                # Technology choices
-                'typescript', 'javascript', 'python', 'java', 'go', 'rust',
-                'react', 'vue', 'angular', 'svelte', 'next', 'nuxt',
-                'postgres', 'mongodb', 'mysql', 'redis', 'sqlite',
-                'docker', 'kubernetes', 'aws', 'azure', 'gcp',
-
-                # Option selections
-                'option a', 'option b', 'option c',
-                'option 1', 'option 2', 'option 3',
-                'first one', 'second one', 'third one', 'last one',
-                'first', 'second', 'third',
-
-                # Choice indicators
-                'both', 'neither', 'either', 'all', 'none',
-                'that one', 'this one',
-
-                # File/folder operation responses
-                'create it', 'delete it', 'keep it', 'remove it',
-                'overwrite', 'merge', 'replace'
-            ]
-
-            if any(pattern in prompt_lower for pattern in answer_patterns):
-                return True
-
-            # Check for single-word technology/tool names (likely answers)
-            single_word_tech = ['npm', 'yarn', 'pnpm', 'vite', 'webpack',
-                               'jest', 'vitest', 'mocha', 'chai',
-                               'eslint', 'prettier', 'biome']
-            if word_count == 1 and any(tech in prompt_lower for tech in single_word_tech):
-                return True
-
-        # Medium-short responses (6-10 words) with choice indicators
-        if word_count <= 10:
-            choice_indicators = [
-                'i prefer', 'i think', 'i choose', 'i\'d like', 'i want',
-                'let\'s use', 'let\'s go with', 'let\'s try',
-                'use the', 'go with', 'pick', 'choose',
-                'sounds good', 'looks good', 'that works',
-                'makes sense', 'i agree'
-            ]
-            if any(indicator in prompt_lower for indicator in choice_indicators):
-                return True
-
-        return False
+    def is_response_to_claude(self, prompt: str) -> bool:
+        """Detect if user is responding to Claude's question (see prompt_filters)"""
+        return prompt_filters.is_response_to_claude(prompt)
 
     async def process_prompt(self, user_prompt_raw: str) -> Optional[Dict[str, Any]]:
         """
@@ -165,22 +97,11 @@ class UserPromptInterceptor:
             Agent response if confident, None otherwise
         """
         # Extract actual prompt from JSON if present
-        try:
-            prompt_data = json.loads(user_prompt_raw)
-            user_prompt = prompt_data.get("prompt", user_prompt_raw)
-        except (json.JSONDecodeError, AttributeError):
-            # Not JSON, use as-is
-            user_prompt = user_prompt_raw
+        user_prompt = prompt_filters.extract_prompt(user_prompt_raw)
 
         # STRATEGY: Only intercept when user is responding to Claude's question
-        # Skip if user is asking Claude a question (let Claude handle it)
-        if self.is_user_asking_question(user_prompt):
-            # User asking Claude - don't intercept, let Claude respond
-            return None
-
-        # Check if this looks like user responding to Claude
-        if not self.is_response_to_claude(user_prompt):
-            # Not a response to Claude - pass through
+        if not prompt_filters.should_intercept(user_prompt):
+            # User asking Claude, or not a response - pass through
             return None
 
         try:
@@ -257,11 +178,13 @@ Choice ID: {agent_response['choice_id']}
         return context
 
 
-async def main():
+def main():
     """
     Main hook entry point
 
     Reads user prompt from stdin, processes it, and outputs context if available.
+    Prompts that cannot qualify exit before anything heavy is imported; the
+    rest go to the warm prompt daemon when it is running, otherwise in-process.
     """
     # Read user prompt from stdin (provided by Claude Code)
     user_prompt = sys.stdin.read().strip()
@@ -270,11 +193,42 @@ async def main():
         # Empty prompt, pass through
         sys.exit(0)
 
+    # Cheap filters first - most prompts are pass-through
+    if not prompt_filters.should_intercept(prompt_filters.extract_prompt(user_prompt)):
+        if tracing_enabled():
+            from tracing import get_tracer
+            get_tracer().record("hook.pass_through", time.perf_counter() - _STARTED)
+        sys.exit(0)
+
+    from tracing import get_tracer
+    tracer = get_tracer()
+    tracer.record("hook.filters", time.perf_counter() - _STARTED)
+
+    # Fast path: warm daemon already holds the orchestrator and knowledge base
+    from daemon_client import query_daemon
+    with tracer.span("hook.daemon_query"):
+        daemon_response = query_daemon(user_prompt)
+    if daemon_response is not None:
+        if daemon_response.get("context"):
+            print(daemon_response["context"])
+        tracer.record("hook.total", time.perf_counter() - _STARTED)
+        sys.exit(0)
+
     # Initialize interceptor
     interceptor = UserPromptInterceptor(confidence_threshold=0.7)
+    try:
+        with tracer.span("hook.load_orchestrator"):
+            interceptor.orchestrator
+    except ImportError as e:
+        # Graceful fallback if orchestrator not available
+        print(f"⚠️  Warning: Could not load autonomous orchestrator: {e}", file=sys.stderr)
+        sys.exit(0)
 
     # Process the prompt
-    agent_response = await interceptor.process_prompt(user_prompt)
+    import asyncio
+    with tracer.span("hook.process_prompt"):
+        agent_response = asyncio.run(interceptor.process_prompt(user_prompt))
+    tracer.record("hook.total", time.perf_counter() - _STARTED)
 
     if agent_response:
         # High confidence answer available - inject context
@@ -289,7 +243,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        main()
     except Exception as e:
         # If anything fails, gracefully pass through
         print(f"⚠️  Hook error: {e}", file=sys.stderr)
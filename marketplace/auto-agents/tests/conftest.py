@@ -0,0 +1,8 @@
+"""Make the agent-system modules (and benchmarks) importable the way the hooks do"""
+
+import sys
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PLUGIN_ROOT / "agent-system"))
+sys.path.insert(0, str(PLUGIN_ROOT / "benchmarks"))
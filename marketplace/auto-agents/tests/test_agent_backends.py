@@ -0,0 +1,75 @@
+"""Agent consultation: priority order and early stop"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agent_backends import AgentRegistry
+from autonomous_orchestrator_enhanced import AutonomousOrchestrator
+from events import NullSink
+
+
+def answer(option, confidence, delay=0.0):
+    async def agent(question, classification):
+        await asyncio.sleep(delay)
+        return SimpleNamespace(chosen_option=option, confidence=confidence)
+    return agent
+
+
+def no_answer(delay=0.0):
+    async def agent(question, classification):
+        await asyncio.sleep(delay)
+        return None
+    return agent
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    orchestrator = AutonomousOrchestrator(agents_dir=tmp_path, events=NullSink())
+    yield orchestrator
+    orchestrator.knowledge_base.close()
+    orchestrator.similarity_index.close()
+
+
+def test_higher_priority_answer_wins_over_more_confident_one():
+    registry = AgentRegistry()
+    registry.register("database", answer("PostgreSQL", 0.85, delay=0.05))
+    registry.register("security", answer("Analysis provided", 0.95))
+
+    consultation = asyncio.run(registry.consult("question"))
+
+    assert consultation.best.chosen_option == "PostgreSQL"
+    assert not consultation.stopped_early
+
+
+def test_stops_early_once_the_winner_is_settled():
+    registry = AgentRegistry()
+    registry.register("database", no_answer())
+    registry.register("framework", answer("React", 0.75))
+    registry.register("slow", answer("Later", 0.95, delay=1.0))
+
+    consultation = asyncio.run(registry.consult("question"))
+
+    assert consultation.best.chosen_option == "React"
+    assert consultation.stopped_early
+    assert consultation.cancelled == ["slow"]
+    assert consultation.elapsed_seconds < 0.5
+
+
+def test_replaced_agent_keeps_its_priority():
+    registry = AgentRegistry()
+    registry.register("database", no_answer())
+    registry.register("security", no_answer())
+    registry.register("database", answer("PostgreSQL", 0.85))
+
+    assert registry.names() == ["database", "security"]
+    assert registry.get_stats()["database"]["answers"] == 0
+
+
+def test_database_question_is_answered_by_the_database_agent(orchestrator):
+    question = "What is the difference between MongoDB and PostgreSQL?"
+
+    result = asyncio.run(orchestrator.process_question(question))
+
+    assert result["choice"]["chosen_option"] == "PostgreSQL"
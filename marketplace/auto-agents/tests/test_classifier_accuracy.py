@@ -0,0 +1,16 @@
+"""Regex classifier accuracy on the labeled corpus (see benchmarks/bench_classifier.py)"""
+
+import json
+
+from bench_classifier import DEFAULT_BUDGET, accuracy, accuracy_violations, load_corpus
+from question_classifier import QuestionClassifier
+
+
+def test_regex_rules_meet_the_corpus_floors():
+    with open(DEFAULT_BUDGET, 'r') as f:
+        budgets = json.load(f)
+    corpus_file = DEFAULT_BUDGET.parent / budgets["corpus"]
+
+    result = accuracy(QuestionClassifier(cache_size=0), load_corpus(corpus_file))
+
+    assert accuracy_violations(result, budgets["regex"]) == []
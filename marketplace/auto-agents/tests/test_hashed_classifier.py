@@ -0,0 +1,97 @@
+"""Question model: quality gate and confidence cap"""
+
+import json
+import asyncio
+
+import pytest
+
+from hashed_classifier import (HashedFeatureModel, MAX_CONFIDENCE, DEFAULT_CORPUS,
+                               make_classifier, train)
+from autonomous_orchestrator_enhanced import AutonomousOrchestrator
+from events import NullSink
+from question_classifier import QuestionClassifier, QuestionType
+
+
+def corpus_examples():
+    with open(DEFAULT_CORPUS, 'r') as f:
+        return [(record["question"], record["expected"], 1.0)
+                for record in map(json.loads, filter(str.strip, f))]
+
+
+def write_budget(path, **floors):
+    with open(path, 'w') as f:
+        json.dump({"corpus": DEFAULT_CORPUS.name, "model": floors}, f)
+    return path
+
+
+@pytest.fixture
+def skewed_model():
+    # Mostly clarification, like the current Q&A history, but every type seen once
+    examples = [(f"what do you mean by item {n}?", QuestionType.CLARIFICATION_NEEDED.value, 1.0)
+                for n in range(60)]
+    examples.extend((f"placeholder {q_type.value}", q_type.value, 1.0) for q_type in QuestionType)
+    model = train(examples, dim=1024)
+    model.evaluate()
+    return model
+
+
+def test_model_missing_a_type_is_not_saved(tmp_path):
+    model = train([("what do you mean?", QuestionType.CLARIFICATION_NEEDED.value, 1.0),
+                   ("what port is free?", QuestionType.AGENT_ANSWERABLE.value, 1.0)], dim=1024)
+    model.evaluate()
+
+    with pytest.raises(ValueError, match="no training examples for human_decision"):
+        model.save(tmp_path / "model.bin", write_budget(tmp_path / "budget.json"))
+    assert not list(tmp_path.glob("*.bin*"))
+
+
+def test_unevaluated_model_is_not_saved(tmp_path):
+    model = train(corpus_examples(), dim=1024)
+
+    with pytest.raises(ValueError, match="not evaluated"):
+        model.save(tmp_path / "model.bin", write_budget(tmp_path / "budget.json"))
+
+
+def test_model_below_the_floors_is_not_saved_or_loaded(tmp_path, skewed_model):
+    strict = write_budget(tmp_path / "strict.json", min_accuracy=0.7)
+    with pytest.raises(ValueError, match="accuracy"):
+        skewed_model.save(tmp_path / "model.bin", strict)
+
+    model_file = skewed_model.save(tmp_path / "model.bin", write_budget(tmp_path / "lenient.json"))
+    with pytest.raises(ValueError, match="quality gate"):
+        HashedFeatureModel.load(model_file, strict)
+    assert HashedFeatureModel.load(model_file, budget_file=None).metadata["quality"]
+
+
+def test_make_classifier_falls_back_to_regex_for_a_weak_model(tmp_path, skewed_model):
+    model_file = skewed_model.save(tmp_path / "model.bin", write_budget(tmp_path / "lenient.json"))
+
+    # The shipped floors are the regex rules' (no "model" entry yet)
+    assert isinstance(make_classifier("model", model_file), QuestionClassifier)
+
+
+def test_confidence_stays_below_the_thresholds(skewed_model):
+    result = skewed_model.classify("Should we drop the production database?")
+
+    assert result.confidence <= MAX_CONFIDENCE < 0.6
+
+
+def test_model_label_alone_does_not_produce_an_agent_answer(tmp_path):
+    question = "Can I delete the production database?"
+    examples = [(question, QuestionType.AGENT_ANSWERABLE.value, 5.0)]
+    examples.extend((f"placeholder {q_type.value}", q_type.value, 1.0) for q_type in QuestionType)
+    model = train(examples, dim=1024)
+    classification = model.classify(question)
+    assert classification.question_type == QuestionType.AGENT_ANSWERABLE
+
+    orchestrator = AutonomousOrchestrator(agents_dir=tmp_path, events=NullSink())
+    orchestrator.classifier = model
+    try:
+        result = asyncio.run(orchestrator.process_question(question))
+    finally:
+        orchestrator.knowledge_base.close()
+        orchestrator.similarity_index.close()
+
+    assert result["choice"]["chosen_option"] != "ALLOWED"
+    assert "Security" not in result["choice"]["agents_consulted"]
+    assert result["choice"]["confidence"] < 0.7
@@ -0,0 +1,96 @@
+"""Knowledge store write-behind buffering"""
+
+import json
+
+import pytest
+
+from knowledge_store import KnowledgeStore, JsonKnowledgeStore, question_hash
+
+
+def make_entry(question):
+    return {
+        "question": question,
+        "chosen_option": "Option A",
+        "reasoning": "test",
+        "confidence": 0.8,
+        "agents_consulted": [],
+        "alternatives_considered": [],
+        "learned_date": "2025-01-01T00:00:00",
+        "times_used": 0,
+        "source": "agents",
+    }
+
+
+@pytest.fixture(params=["sqlite", "json"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        kb = KnowledgeStore(tmp_path / "learned_answers.db", max_pending=10, max_delay_seconds=3600)
+    else:
+        kb = JsonKnowledgeStore(tmp_path / "learned_answers.json", max_pending=10, max_delay_seconds=3600)
+    yield kb
+    kb.close()
+
+
+def stored_times_used(store, q_hash):
+    """times_used as persisted, ignoring anything still buffered"""
+    if isinstance(store, KnowledgeStore):
+        return store._conn.execute(
+            "SELECT times_used FROM learned_answers WHERE question_hash = ?", (q_hash,)
+        ).fetchone()[0]
+    with open(store.json_file) as f:
+        return json.load(f)[q_hash]["times_used"]
+
+
+def test_empty_buffer_still_buffers(store):
+    # An empty buffer used to be falsy, so `if self._buffer:` skipped it
+    q_hash = question_hash("Should we use Redis?")
+    store.put(q_hash, make_entry("Should we use Redis?"))
+
+    store.record_use(q_hash)
+
+    assert store._buffer.pending_changes == 1
+    assert stored_times_used(store, q_hash) == 0
+    assert store.get(q_hash)["times_used"] == 1
+
+
+def test_buffer_flushes_at_threshold(store):
+    q_hash = question_hash("Should we use Redis?")
+    store.put(q_hash, make_entry("Should we use Redis?"))
+
+    for _ in range(10):
+        store.record_use(q_hash)
+
+    assert store._buffer.pending_changes == 0
+    assert stored_times_used(store, q_hash) == 10
+
+
+def test_close_flushes_pending(tmp_path):
+    q_hash = question_hash("Which database?")
+    kb = KnowledgeStore(tmp_path / "learned_answers.db", max_pending=100, max_delay_seconds=3600)
+    kb.put(q_hash, make_entry("Which database?"))
+    kb.record_use(q_hash)
+    kb.reinforce(q_hash, 0.9, "2025-01-02T00:00:00")
+    kb.close()
+
+    reopened = KnowledgeStore(tmp_path / "learned_answers.db", write_behind=False)
+    entry = reopened.get(q_hash)
+    reopened.close()
+    assert entry["times_used"] == 1
+    assert entry["success_count"] == 1
+    assert entry["confidence"] == 0.9
+
+
+def test_reinforce_never_lowers_confidence(store):
+    # A reused near-duplicate answer reports a confidence scaled by similarity
+    q_hash = question_hash("Should we use Redis?")
+    store.put(q_hash, make_entry("Should we use Redis?"))
+
+    store.reinforce(q_hash, 0.6, "2025-01-02T00:00:00")
+    assert store.get(q_hash)["confidence"] == 0.8
+    store.flush()
+    assert store.get(q_hash)["confidence"] == 0.8
+
+    store.reinforce(q_hash, 0.9, "2025-01-03T00:00:00")
+    store.flush()
+    assert store.get(q_hash)["confidence"] == pytest.approx(0.9)
+    assert store.get(q_hash)["success_count"] == 2
@@ -0,0 +1,39 @@
+"""Background log writer: whole-file writes"""
+
+import json
+import threading
+
+from json_io import temp_path, write_json_atomic
+from log_writer import LogWriter
+
+
+def test_temp_paths_are_unique(tmp_path):
+    target = tmp_path / "report.json"
+    names = {temp_path(target) for _ in range(100)}
+
+    other_thread = []
+    thread = threading.Thread(target=lambda: other_thread.append(temp_path(target)))
+    thread.start()
+    thread.join()
+
+    assert len(names) == 100
+    assert other_thread[0] not in names
+    assert all(name.parent == tmp_path for name in names)
+
+
+def test_sync_and_background_writes_of_one_file(tmp_path):
+    # Same file from the caller's thread (write_json_atomic) and the writer
+    # thread (write_file): neither may clobber the other's temp file
+    target = tmp_path / "all_outcomes.json"
+    writer = LogWriter(batch_size=1)
+    try:
+        for n in range(300):
+            writer.write_file(target, json.dumps({"writer": "background", "n": n}))
+            write_json_atomic(target, {"writer": "sync", "n": n})
+        writer.flush()
+    finally:
+        writer.close()
+
+    assert writer.stats["errors"] == 0
+    assert json.loads(target.read_text())["n"] == 299
+    assert [path.name for path in tmp_path.iterdir()] == ["all_outcomes.json"]
@@ -0,0 +1,86 @@
+"""Negative cache persistence across processes"""
+
+import asyncio
+
+import pytest
+
+import negative_cache
+from negative_cache import NegativeCache, NON_ANSWER
+from autonomous_orchestrator_enhanced import AutonomousOrchestrator
+from events import NullSink
+
+CHOICE = {"chosen_option": NON_ANSWER, "confidence": 0.3}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(negative_cache.time, "time", clock.time)
+    return clock
+
+
+def test_entries_survive_reopen(tmp_path, clock):
+    # The default hook runs one process per prompt
+    first = NegativeCache(tmp_path / "negative_cache.db", ttl_seconds=60)
+    first.put("q1", CHOICE)
+    first.close()
+
+    second = NegativeCache(tmp_path / "negative_cache.db", ttl_seconds=60)
+    assert second.get("q1") == CHOICE
+    assert second.hits == 1
+    second.close()
+
+
+def test_entries_expire(tmp_path, clock):
+    cache = NegativeCache(tmp_path / "negative_cache.db", ttl_seconds=60)
+    cache.put("q1", CHOICE)
+    clock.now += 59
+    assert cache.get("q1") == CHOICE
+    clock.now += 2
+    assert cache.get("q1") is None
+    assert cache.size == 0
+    cache.close()
+
+
+def test_least_recently_used_dropped(clock):
+    cache = NegativeCache(ttl_seconds=60, max_entries=2)
+    cache.put("q1", CHOICE)
+    clock.now += 1
+    cache.put("q2", CHOICE)
+    clock.now += 1
+    cache.get("q1")
+    clock.now += 1
+    cache.put("q3", CHOICE)
+    assert cache.get("q2") is None
+    assert cache.get("q1") == CHOICE
+    assert cache.get("q3") == CHOICE
+
+
+def test_invalidate(clock):
+    cache = NegativeCache(ttl_seconds=60)
+    cache.put("q1", CHOICE)
+    cache.invalidate("q1")
+    assert cache.get("q1") is None
+
+
+def test_hit_in_a_new_orchestrator(tmp_path):
+    question = "Frobnicate the quux widget before the zorble step?"
+
+    first = AutonomousOrchestrator(agents_dir=tmp_path, events=NullSink())
+    result = asyncio.run(first.process_question(question))
+    assert result["choice"]["chosen_option"] == NON_ANSWER
+    first.knowledge_base.close()
+
+    second = AutonomousOrchestrator(agents_dir=tmp_path, events=NullSink())
+    result = asyncio.run(second.process_question(question))
+    assert result["source"] == "negative_cache"
+    assert second.stats["negative_cache_hits"] == 1
+    second.knowledge_base.close()
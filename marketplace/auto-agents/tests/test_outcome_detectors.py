@@ -0,0 +1,58 @@
+"""Outcome detectors: concurrent runs, timeouts and errors"""
+
+import time
+import asyncio
+
+import pytest
+
+from outcome_detectors import DetectorRegistry
+
+
+def test_detectors_are_sorted_by_kind_and_failures_are_recorded():
+    async def stable(log):
+        return ["stable"]
+
+    def blocking(log):
+        return ["no errors in logs"]
+
+    async def slow(log):
+        await asyncio.sleep(1)
+        return ["never seen"]
+
+    def broken(log):
+        raise RuntimeError("git not found")
+
+    registry = DetectorRegistry()
+    registry.register("stable", "success", stable)
+    registry.register("blocking", "success", blocking)
+    registry.register("slow", "failure", slow, timeout=0.01)
+    registry.register("broken", "failure", broken)
+
+    success, failure = asyncio.run(registry.run({"choice": {}}))
+
+    assert success == ["stable", "no errors in logs"]
+    assert failure == []
+    stats = registry.get_stats()
+    assert stats["slow"]["timeouts"] == 1
+    assert stats["broken"]["errors"] == 1
+    assert stats["stable"] == dict(stats["stable"], kind="success", calls=1, timeouts=0, errors=0)
+
+
+def test_run_many_runs_records_concurrently():
+    async def check(log):
+        await asyncio.sleep(0.05)
+        return [log["n"]]
+
+    registry = DetectorRegistry()
+    registry.register("check", "success", check)
+
+    started = time.perf_counter()
+    results = asyncio.run(registry.run_many([{"n": n} for n in range(8)], concurrency=8))
+
+    assert results == [([n], []) for n in range(8)]
+    assert time.perf_counter() - started < 0.05 * 4
+
+
+def test_register_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        DetectorRegistry().register("odd", "maybe", lambda log: [])
@@ -0,0 +1,102 @@
+"""Post-question processor: auto-validation"""
+
+import sys
+import json
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from choice_ids import new_choice_id
+import post_question_processor
+from post_question_processor import PostQuestionProcessor
+
+
+def make_record(n, hours_ago=2.0, confidence=0.9):
+    timestamp = (datetime.now() - timedelta(hours=hours_ago)).isoformat()
+    return {
+        "timestamp": timestamp,
+        "question": f"Should we enable feature {n}?",
+        "choice": {
+            "choice_id": new_choice_id(),
+            "question": f"Should we enable feature {n}?",
+            "chosen_option": "Yes",
+            "confidence": confidence,
+            "source": "agent",
+            "timestamp": timestamp,
+        },
+    }
+
+
+@pytest.fixture
+def processor(tmp_path):
+    processor = PostQuestionProcessor(agents_dir=tmp_path)
+    yield processor
+    processor.close()
+
+
+def test_auto_validation_saves_outcomes_once_per_batch(processor, monkeypatch):
+    # 10 stable high-confidence choices, 2 inconclusive ones
+    records = [make_record(n) for n in range(10)] + [make_record(n, confidence=0.5) for n in range(10, 12)]
+    for record in records:
+        processor.qa_log.append(record)
+
+    saves = []
+    save_outcomes = processor._save_outcomes
+    monkeypatch.setattr(processor, "_save_outcomes", lambda: saves.append(1) or save_outcomes())
+
+    # concurrency=1 -> batches of 4 records
+    asyncio.run(processor.auto_validate_outcomes(concurrency=1))
+
+    assert len(saves) == 3
+    validated = {record["choice"]["choice_id"] for record in records[:10]}
+    assert set(processor.outcomes) == validated
+
+    reopened = PostQuestionProcessor(agents_dir=processor.agents_dir)
+    try:
+        assert set(reopened.outcomes) == validated
+        state = reopened._load_validation_state()
+        assert set(state["pending"]) == {record["choice"]["choice_id"] for record in records[10:]}
+    finally:
+        reopened.close()
+
+
+def test_report_covers_outcomes_recorded_by_earlier_runs(processor, monkeypatch, capsys):
+    records = [make_record(n) for n in range(3)]
+    for record in records:
+        processor.qa_log.append(record)
+    statuses = ["success", "success", "failed"]
+    asyncio.run(processor.process_outcomes_bulk(
+        {"choice_id": record["choice"]["choice_id"], "status": status}
+        for record, status in zip(records, statuses)
+    ))
+    capsys.readouterr()
+
+    monkeypatch.setattr(sys, "argv", ["post_question_processor.py", "report",
+                                      "--agents-dir", str(processor.agents_dir)])
+    post_question_processor.main()
+    report = capsys.readouterr().out
+
+    assert "**Total Validated**: 3" in report
+    assert "Success: 2" in report
+    assert "Failed: 1" in report
+
+
+def test_first_auto_validation_migrates_legacy_records(processor):
+    # Written by an older version: one per-choice file and all_questions.jsonl,
+    # plus a watermark left after a newer choice
+    legacy = [make_record(n, hours_ago=3.0) for n in range(2)]
+    log_dir = processor.qa_log.log_dir
+    (log_dir / f"{legacy[0]['choice']['choice_id']}.json").write_text(json.dumps(legacy[0]))
+    with open(log_dir / "all_questions.jsonl", 'w') as f:
+        for record in legacy:
+            f.write(json.dumps(record) + '\n')
+    newer = make_record(2, hours_ago=1.0)
+    processor.qa_log.append(newer)
+    processor._save_validation_state({"watermark": newer["choice"]["choice_id"], "pending": []})
+
+    asyncio.run(processor.auto_validate_outcomes())
+
+    assert {record["choice"]["choice_id"] for record in legacy} <= set(processor.outcomes)
+    assert processor._load_validation_state()["legacy_migrated"]
+    assert (log_dir / "all_questions.jsonl").exists()
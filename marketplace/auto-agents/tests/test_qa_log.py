@@ -0,0 +1,130 @@
+"""Segmented Q&A log: compaction"""
+
+import os
+import json
+
+import pytest
+
+import qa_log
+from qa_log import QALog, COMPACT_DIR, COMPACT_MARKER
+from choice_ids import new_choice_id
+
+
+def make_record(n):
+    return {
+        "timestamp": "2025-01-01T00:00:00",
+        "question": f"Question number {n}?",
+        "choice": {"choice_id": new_choice_id(), "chosen_option": f"Option {n}"},
+    }
+
+
+@pytest.fixture
+def log(tmp_path):
+    # Small segments so compaction has several to merge and renumber
+    log = QALog(tmp_path / "qa_logs", segment_max_bytes=300)
+    for n in range(40):
+        log.append(make_record(n))
+    # Undersized segments: a bigger size makes the compacted log shorter
+    log.segment_max_bytes = 1200
+    return log
+
+
+def choice_ids(log_dir):
+    return sorted(record["choice"]["choice_id"] for record in QALog(log_dir).iter_records())
+
+
+def test_compact_keeps_every_record(log):
+    before = choice_ids(log.log_dir)
+    stats = log.compact()
+
+    assert stats["records_kept"] == 40
+    assert stats["segments_after"] < stats["segments_before"]
+    assert choice_ids(log.log_dir) == before
+    reopened = QALog(log.log_dir)
+    assert len(reopened) == 40
+    for choice_id in before:
+        assert reopened.get(choice_id)["choice"]["choice_id"] == choice_id
+    assert not (log.log_dir / COMPACT_DIR).exists()
+
+
+@pytest.mark.parametrize("fail_at", [1, 2, 3])
+def test_crash_while_moving_segments_loses_nothing(log, monkeypatch, fail_at):
+    before = choice_ids(log.log_dir)
+    real_replace = os.replace
+    calls = []
+
+    def crashing_replace(src, dst):
+        calls.append(dst)
+        if len(calls) == fail_at:
+            raise OSError("simulated crash")
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(qa_log.os, "replace", crashing_replace)
+    with pytest.raises(OSError):
+        log.compact()
+    monkeypatch.undo()
+
+    # The next process to open the log finishes the switch
+    assert choice_ids(log.log_dir) == before
+    reopened = QALog(log.log_dir)
+    assert len(reopened) == 40
+    assert not (log.log_dir / COMPACT_DIR).exists()
+    for choice_id in before:
+        assert reopened.get(choice_id)["choice"]["choice_id"] == choice_id
+
+
+def test_crash_while_removing_old_segments_loses_nothing(log, monkeypatch):
+    before = choice_ids(log.log_dir)
+
+    def crashing_unlink(path, missing_ok=False):
+        raise OSError("simulated crash")
+
+    monkeypatch.setattr(qa_log.Path, "unlink", crashing_unlink)
+    with pytest.raises(OSError):
+        log.compact()
+    monkeypatch.undo()
+
+    assert (log.log_dir / COMPACT_DIR / COMPACT_MARKER).exists()
+    assert choice_ids(log.log_dir) == before
+    assert len(QALog(log.log_dir)) == 40
+
+
+def test_crash_before_marker_leaves_log_untouched(log, monkeypatch):
+    before = choice_ids(log.log_dir)
+    segments_before = list(log.segments())
+
+    def crashing_fsync(path):
+        raise OSError("simulated crash")
+
+    monkeypatch.setattr(qa_log, "_fsync", crashing_fsync)
+    with pytest.raises(OSError):
+        log.compact()
+    monkeypatch.undo()
+
+    reopened = QALog(log.log_dir)
+    assert list(reopened.segments()) == segments_before
+    assert choice_ids(log.log_dir) == before
+
+    # A later compaction starts over cleanly
+    assert reopened.compact()["records_kept"] == 40
+    assert choice_ids(log.log_dir) == before
+
+
+def test_iter_all_records_yields_legacy_choices_once(tmp_path):
+    log_dir = tmp_path / "qa_logs"
+    log = QALog(log_dir)
+    migrated = make_record(0)
+    log.append(migrated)
+
+    # Old layout: every choice in all_questions.jsonl, plus one file per choice
+    legacy = [make_record(n) for n in range(1, 4)]
+    with open(log_dir / "all_questions.jsonl", 'w') as f:
+        for record in [migrated] + legacy:
+            f.write(json.dumps(record) + '\n')
+    for record in legacy[:2]:
+        with open(log_dir / f"{record['choice']['choice_id']}.json", 'w') as f:
+            json.dump(record, f)
+
+    choice_ids = [record["choice"]["choice_id"] for record in QALog(log_dir).iter_all_records()]
+
+    assert sorted(choice_ids) == sorted(record["choice"]["choice_id"] for record in [migrated] + legacy)
@@ -0,0 +1,40 @@
+"""Relabeling the question history"""
+
+import json
+
+from choice_ids import new_choice_id
+from qa_log import QALog
+from question_classifier import QuestionClassifier
+from relabel import LabelStore, iter_history, relabel
+
+
+def make_record(question):
+    return {
+        "timestamp": "2025-01-01T00:00:00",
+        "question": question,
+        "choice": {"choice_id": new_choice_id(), "chosen_option": "Yes"},
+    }
+
+
+def test_legacy_history_is_counted_once_per_choice(tmp_path):
+    log_dir = tmp_path / "qa_logs"
+    QALog(log_dir).append(make_record("Should we use Redis?"))
+
+    # Old layout: every choice in all_questions.jsonl, plus one file per choice
+    legacy = [make_record("What does this function do?"), make_record("Which port is free?")]
+    with open(log_dir / "all_questions.jsonl", 'w') as f:
+        for record in legacy:
+            f.write(json.dumps(record) + '\n')
+    for record in legacy:
+        with open(log_dir / f"{record['choice']['choice_id']}.json", 'w') as f:
+            json.dump(record, f)
+
+    labels = LabelStore(tmp_path / "classification_labels.db")
+    try:
+        report = relabel(iter_history(tmp_path), QuestionClassifier(), labels)
+    finally:
+        labels.close()
+
+    assert report["questions"] == 3
+    assert sum(report["by_source"]["qa_log"].values()) == 3
+    assert report["distinct"] == report["new"] == 3
@@ -0,0 +1,88 @@
+"""Near-duplicate lookup of learned answers"""
+
+from datetime import datetime
+
+import pytest
+
+from autonomous_orchestrator_enhanced import AutonomousOrchestrator, AgentChoice
+from events import NullSink
+from similarity_index import SimilarityIndex
+
+
+def make_choice(question, option="Option A", confidence=0.8):
+    return AgentChoice(
+        question=question,
+        chosen_option=option,
+        reasoning="test",
+        confidence=confidence,
+        agents_consulted=["database"],
+        alternatives_considered=[],
+        timestamp=datetime.now().isoformat(),
+        choice_id="choice_test",
+    )
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    orchestrator = AutonomousOrchestrator(agents_dir=tmp_path, events=NullSink())
+    yield orchestrator
+    orchestrator.knowledge_base.close()
+    orchestrator.similarity_index.close()
+
+
+def test_empty_index_is_truthy(tmp_path):
+    index = SimilarityIndex(tmp_path / "similarity_index.db")
+    assert index.size == 0
+    assert index
+    index.close()
+
+
+def test_first_learned_answer_is_indexed(orchestrator):
+    # An empty index used to be falsy, so `if self.similarity_index:` never indexed anything
+    question = "Should we implement Redis caching for the API endpoints?"
+    orchestrator._save_learned_answer(question, make_choice(question))
+
+    assert orchestrator.similarity_index.size == 1
+    found = orchestrator._find_learned_entry("Should we use Redis caching for the API endpoints?")
+    assert found is not None
+    assert found[1]["question"] == question
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SimilarityIndex(tmp_path / "similarity_index.db")
+    yield index
+    index.close()
+
+
+@pytest.mark.parametrize("learned, asked", [
+    ("yes delete it", "no delete it"),
+    ("delete it", "don't delete it"),
+    ("Should we drop the users table?", "Should we not drop the users table?"),
+    ("Can I overwrite config.json?", "I cannot overwrite config.json?"),
+])
+def test_negation_never_matches(index, learned, asked):
+    index.add("learned", learned)
+    assert index.find_similar(asked, threshold=0.0) is None
+
+
+def test_word_pairs_count(index):
+    index.add("learned", "Should we migrate the users table to postgres")
+    # Same words, different order: single words alone would score 1.0
+    match = index.find_similar("postgres to table users the migrate we should", threshold=0.0)
+    assert match is not None and match[1] < 0.6
+
+
+def test_reused_confidence_scaled_by_similarity(orchestrator):
+    learned = "Should we implement Redis caching for the API endpoints?"
+    orchestrator._save_learned_answer(learned, make_choice(learned, confidence=0.8))
+
+    choice, entry = orchestrator._check_learned_answer("Should we use Redis caching for the API endpoints?")
+
+    assert 0.6 <= entry["similarity"] < 1.0
+    assert choice.confidence == pytest.approx(0.8 * entry["similarity"])
+    assert "similar question" in choice.reasoning
+
+    choice, entry = orchestrator._check_learned_answer(learned)
+    assert entry["similarity"] == 1.0
+    assert choice.confidence == 0.8